@@ -20,8 +20,40 @@ def stop(context):
         # Remove all of the event handlers your app has created
         futil.clear_handlers()
 
+        # clickupUtils is imported with the first command that runs; when no
+        # command ran there is no background work or connection to clean up
+        cutil = None
+        if commands.loaded():
+            from .lib import clickupUtils as cutil
+
+        # Cancel queued background work and wait briefly for running requests
+        if cutil:
+            cutil.shutdown_background()
+
         # This will run the start function in each of your commands as defined in commands/__init__.py
         commands.stop()
 
+        # Close the pooled ClickUp/TinyURL keep-alive connections
+        if cutil:
+            cutil.close_connections()
+            cutil.stop_cassette()
+
+        # Save the short-URL and thumbnail caches' recency, kept in memory on hits
+        if cutil:
+            cutil.flush_short_urls()
+            cutil.flush_thumbnail_cache()
+
+        # Fold this session's metrics into cache/metrics/
+        if cutil:
+            cutil.write_metrics_report()
+
+        # Write trace events not yet saved with a dialog (post-OK work)
+        if cutil and cutil.tracing_enabled():
+            cutil.write_trace()
+
+        # Flush the command log file, if file logging is on
+        if cutil:
+            cutil.shutdown_logging()
+
     except:
         futil.handle_error('stop')
\ No newline at end of file
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""End-to-end timings for List Tasks, Update Tasks and Add Task, without Fusion.
+
+The add-in is loaded as a package against the stand-in `adsk` in
+fake_adsk/, with its cache redirected to a temporary directory and every
+ClickUp / TinyURL call sent to clickup_stub.py on localhost. For each list
+size the three commands are clicked, edited and confirmed the way a user
+would, and each phase is timed:
+
+    created  — button click until the dialog is built (command_created)
+    settled  — click until background work has been delivered back to
+               the main thread (stale-while-revalidate refresh, lookups)
+    execute  — OK until command_execute returns (ClickUp writes included)
+
+The first run of each size is reported as "cold" (empty task mirror and
+metadata cache); the median of the remaining runs as "warm".
+
+    python benchmarks/bench.py
+    python benchmarks/bench.py --sizes 100 1000 --repeat 7 --latency-ms 40
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(HERE, "fake_adsk"))
+sys.path.insert(0, HERE)
+
+import adsk.core  # noqa: E402 — the stand-in, from fake_adsk/
+import clickup_stub  # noqa: E402
+
+PACKAGE = "powertools_plusproject"
+BENCH_PNG = b"\x89PNG\r\n\x1a\n" + os.urandom(24 * 1024)  # thumbnail-sized payload
+SETTLE_TIMEOUT_SECONDS = 120.0
+EDITED_ROWS = 3  # rows changed in each dialog before OK
+
+
+def load_addin(cache_dir: str):
+    """Import the add-in as package PACKAGE with its cache under *cache_dir*."""
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [REPO_ROOT]
+    sys.modules[PACKAGE] = package
+
+    # Every cache path is derived from config at import time, so redirect it
+    # before anything else in the add-in is imported.
+    config = importlib.import_module(f"{PACKAGE}.config")
+    config.CACHE_DIR = cache_dir
+    config.PROJECTS_DB_PATH = os.path.join(cache_dir, "projects.sqlite")
+    config.PROJECTS_JSON_PATH = os.path.join(cache_dir, "projects.json")
+    config.AUTH_JSON_PATH = os.path.join(cache_dir, "auth.json")
+
+    spec = importlib.util.spec_from_file_location(
+        f"{PACKAGE}.main", os.path.join(REPO_ROOT, "PowerTools-PlusProject.py")
+    )
+    main = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = main
+    spec.loader.exec_module(main)
+    return main
+
+
+class Harness:
+    """Drives the loaded add-in: clicks buttons, edits inputs, pumps events."""
+
+    def __init__(self, addin, cutil, verbose: bool = False):
+        self.addin = addin
+        self.cutil = cutil
+        self.app = adsk.core.Application.get()
+        self.verbose = verbose
+
+    def command(self, package_name: str):
+        return getattr(self.addin.commands, package_name)
+
+    def click(self, package_name: str):
+        definition = self.app.userInterface.commandDefinitions.itemById(
+            self.command(package_name).CMD_ID
+        )
+        return definition.execute()
+
+    def settle(self) -> None:
+        """Pump custom events until no background task is outstanding."""
+        workers = self.cutil.background._workers
+        deadline = time.monotonic() + SETTLE_TIMEOUT_SECONDS
+        while workers._tasks or self.app._pending:
+            adsk.doEvents()
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"background work did not settle: {list(workers._tasks.values())}")
+            time.sleep(0.0005)
+
+    def change(self, command, command_input) -> None:
+        command.inputChanged.fire(adsk.core.InputChangedEventArgs(command, command_input))
+
+    def ok(self, command) -> None:
+        command.execute.fire(adsk.core.CommandEventArgs(command))
+
+    def close(self, command) -> None:
+        command.destroy.fire(adsk.core.CommandEventArgs(command))
+
+    def report_messages(self, label: str) -> None:
+        messages = self.app.userInterface.messages
+        if self.verbose:
+            for text, title in messages:
+                print(f"    [{label}] {title}: {text.splitlines()[0] if text else ''}")
+        messages.clear()
+
+
+def _input_ids(command, prefix: str) -> list:
+    return [i for i in command.commandInputs._by_id if i.startswith(prefix)]
+
+
+def _select_other(dropdown) -> None:
+    """Select the item after the current one, wrapping around."""
+    current = dropdown.selectedItem
+    index = (current.index + 1) % dropdown.listItems.count if current else 0
+    dropdown.listItems.item(index).isSelected = True
+
+
+def run_list_tasks(h: Harness) -> dict:
+    t0 = time.perf_counter()
+    command = h.click("listTasks")
+    created = time.perf_counter()
+    h.settle()
+    settled = time.perf_counter()
+
+    for input_id in _input_ids(command, "all_status_")[:EDITED_ROWS]:
+        _select_other(command.commandInputs.itemById(input_id))
+    t1 = time.perf_counter()
+    h.ok(command)
+    executed = time.perf_counter()
+    h.close(command)
+    h.settle()
+    h.report_messages("List Tasks")
+    return {"created": created - t0, "settled": settled - t0, "execute": executed - t1}
+
+
+def run_update_tasks(h: Harness) -> dict:
+    t0 = time.perf_counter()
+    command = h.click("updateTasks")
+    created = time.perf_counter()
+    h.settle()
+    settled = time.perf_counter()
+
+    inputs = command.commandInputs
+    for input_id in _input_ids(command, "sel_")[:EDITED_ROWS]:
+        select = inputs.itemById(input_id)
+        select.value = True
+        h.change(command, select)
+        # Always a real change: a quarter hour more than the current estimate
+        detail_time = inputs.itemById("detail_time")
+        hours = float(detail_time.value or 0) + 0.25
+        detail_time.value = f"{hours:g}"
+        h.change(command, detail_time)
+        apply_button = inputs.itemById("btn_apply_edits")
+        apply_button.value = True
+        h.change(command, apply_button)
+    t1 = time.perf_counter()
+    h.ok(command)
+    executed = time.perf_counter()
+    h.close(command)
+    h.settle()
+    h.report_messages("Update Tasks")
+    return {"created": created - t0, "settled": settled - t0, "execute": executed - t1}
+
+
+def run_add_task(h: Harness) -> dict:
+    t0 = time.perf_counter()
+    command = h.click("addTask")
+    created = time.perf_counter()
+    h.settle()
+    settled = time.perf_counter()
+
+    inputs = command.commandInputs
+    inputs.itemById("task_name").value = f"Benchmark task {time.time_ns()}"
+    h.change(command, inputs.itemById("task_name"))
+    command.validateInputs.fire(adsk.core.ValidateInputsEventArgs(command))
+    t1 = time.perf_counter()
+    h.ok(command)
+    executed = time.perf_counter()
+    h.close(command)
+    # URN write and thumbnail upload run after OK; drain them before the next run
+    h.settle()
+    h.report_messages("Add Task")
+    return {"created": created - t0, "settled": settled - t0, "execute": executed - t1}
+
+
+SCENARIOS = [
+    ("List Tasks", run_list_tasks),
+    ("Update Tasks", run_update_tasks),
+    ("Add Task", run_add_task),
+]
+PHASES = ("created", "settled", "execute")
+
+
+def open_benchmark_document(h: Harness, size: int, api_base: str) -> None:
+    """Map a project to list-<size> and make its document the active one."""
+    hub = adsk.core.DataHub("bench-hub", "Benchmark Hub", "https://bench.autodesk360.com/g/en")
+    project = adsk.core.DataProject(f"bench-project-{size}", f"Benchmark {size}", hub)
+    data_file = adsk.core.DataFile(
+        clickup_stub.doc_urn_for(size), f"Bench {size}", project, 1, BENCH_PNG
+    )
+    h.cutil.save_project_mapping(
+        project.id,
+        {
+            "clickup_list_id": f"list-{size}",
+            "clickup_url": f"https://app.clickup.com/1/v/li/list-{size}",
+        },
+    )
+    h.app.activate_document(adsk.core.Document(f"Bench {size}", data_file))
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:9.1f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per command and size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every stub response")
+    parser.add_argument("--verbose", action="store_true", help="print every message box shown")
+    parser.add_argument("--cassette", help="JSON-lines file to record HTTP traffic to or replay it from")
+    parser.add_argument(
+        "--cassette-mode",
+        choices=("record", "replay", "replay-fast"),
+        default="record",
+        help="replay waits the recorded latency; replay-fast answers immediately",
+    )
+    args = parser.parse_args()
+
+    server = clickup_stub.start_server(latency=args.latency_ms / 1000)
+    host, port = server.server_address
+    api_base = f"http://{host}:{port}"
+
+    with tempfile.TemporaryDirectory(prefix="pp-bench-") as cache_dir:
+        t0 = time.perf_counter()
+        addin = load_addin(cache_dir)
+        addin.run(None)
+        startup = time.perf_counter() - t0
+
+        cutil = importlib.import_module(f"{PACKAGE}.lib.clickupUtils")
+        cutil.http_client.CLICKUP_API_BASE = f"{api_base}/api/v2"
+        cutil.save_tokens(clickup_api_token="pk_bench", tinyurl_api_token="tiny_bench")
+        # Entry modules are imported here, before timing, so the TinyURL
+        # endpoint can be redirected; import cost is covered by add-in startup.
+        add_task_entry = addin.commands.addTask._entry.module
+        add_task_entry.TINYURL_API_BASE = f"{api_base}/tinyurl"
+        for name in ("listTasks", "updateTasks"):
+            getattr(addin.commands, name)._entry.module
+        if args.cassette:
+            if args.cassette_mode == "record":
+                cutil.start_recording(args.cassette)
+            else:
+                cutil.start_replay(args.cassette, realtime=args.cassette_mode == "replay")
+
+        h = Harness(addin, cutil, verbose=args.verbose)
+        print(f"add-in start: {startup * 1000:.1f} ms   stub latency: {args.latency_ms:.0f} ms   "
+              f"runs: {args.repeat}")
+        print(f"{'command':<14}{'tasks':>7}  {'phase':<8}{'cold ms':>9} {'warm ms':>9}")
+
+        try:
+            for size in args.sizes:
+                open_benchmark_document(h, size, api_base)
+                for label, scenario in SCENARIOS:
+                    runs = [scenario(h) for _ in range(max(1, args.repeat))]
+                    for phase in PHASES:
+                        cold = runs[0][phase]
+                        warm = statistics.median(r[phase] for r in runs[1:]) if len(runs) > 1 else cold
+                        print(f"{label:<14}{size:>7}  {phase:<8}{format_ms(cold)} {format_ms(warm)}")
+        finally:
+            addin.stop(None)
+            server.shutdown()
+
+        print(f"stub requests served: {server.state.request_count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
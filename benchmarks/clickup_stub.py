@@ -0,0 +1,295 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Local stand-in for the ClickUp v2 endpoints the add-in calls, plus TinyURL.
+
+Lists are synthesised on first use from their id: `list-<N>` holds N tasks,
+one in every URN_EVERY carrying the benchmark document's URN in the
+"Fusion Document URN" custom field. The server keeps state, so PUT / POST
+change what later GETs return, and honours `date_updated_gt` so the task
+mirror's incremental sync behaves as it does against ClickUp.
+
+Run standalone for manual poking:
+
+    python benchmarks/clickup_stub.py --port 8765
+"""
+
+import argparse
+import json
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+PAGE_SIZE = 100  # ClickUp's fixed page size for GET /list/{id}/task
+URN_EVERY = 50  # one task in URN_EVERY is linked to the benchmark document
+URN_FIELD_ID = "cf-urn"
+URL_FIELD_ID = "cf-url"
+STATUSES = ["to do", "in progress", "review", "complete"]
+MEMBERS = [
+    {"user": {"id": 1000 + i, "username": f"member{i:02d}", "email": f"member{i:02d}@example.com"}}
+    for i in range(12)
+]
+
+
+def doc_urn_for(size: int) -> str:
+    """URN of the benchmark document whose tasks live in list-<size>."""
+    return f"urn:adsk.wipprod:dm.lineage:BENCH-DOC-{size}"
+
+
+def _local_midnight_ms(days_ahead: int) -> int:
+    """Due dates as the dialogs write them: date only, local midnight."""
+    t = time.localtime(time.time() + days_ahead * 86_400)
+    return int(time.mktime((t.tm_year, t.tm_mon, t.tm_mday, 0, 0, 0, 0, 0, -1)) * 1000)
+
+
+def _make_task(list_id: str, index: int, doc_urn: str, now_ms: int) -> dict:
+    task_id = f"{list_id}-t{index:05d}"
+    urn_value = doc_urn if index % URN_EVERY == 0 else f"urn:adsk.wipprod:dm.lineage:OTHER-{index}"
+    return {
+        "id": task_id,
+        "name": f"Synthetic task {index}",
+        "status": {"status": STATUSES[index % len(STATUSES)], "type": "custom"},
+        "priority": {"id": str(index % 4 + 1)},
+        "date_created": str(now_ms - 86_400_000 - index),
+        "date_updated": str(now_ms - 3_600_000 - index),
+        "due_date": str(_local_midnight_ms(index % 30)) if index % 3 else None,
+        "description": f"Description of synthetic task {index}.\nSecond line.",
+        "time_estimate": (index % 8) * 1_800_000 or None,
+        "assignees": [{"id": MEMBERS[index % len(MEMBERS)]["user"]["id"]}] if index % 2 else [],
+        "is_private": False,
+        "url": f"https://app.clickup.com/t/{task_id}",
+        "custom_fields": [
+            {"id": URN_FIELD_ID, "name": "Fusion Document URN", "type": "short_text", "value": urn_value},
+            {"id": URL_FIELD_ID, "name": "Fusion Design", "type": "url", "value": None},
+        ],
+    }
+
+
+class ClickUpState:
+    """Task lists, keyed by list id, built on first request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lists: dict = {}  # list id → {task id: task}
+        self._task_list: dict = {}  # task id → list id
+        self._next_id = 0
+        self.request_count = 0
+
+    def tasks(self, list_id: str) -> dict:
+        with self._lock:
+            tasks = self._lists.get(list_id)
+            if tasks is None:
+                match = re.fullmatch(r"list-(\d+)", list_id)
+                size = int(match.group(1)) if match else 0
+                now_ms = int(time.time() * 1000)
+                doc_urn = doc_urn_for(size)
+                tasks = {}
+                for i in range(size):
+                    task = _make_task(list_id, i, doc_urn, now_ms)
+                    tasks[task["id"]] = task
+                    self._task_list[task["id"]] = list_id
+                self._lists[list_id] = tasks
+            return tasks
+
+    def find(self, task_id: str):
+        with self._lock:
+            list_id = self._task_list.get(task_id)
+        return self.tasks(list_id).get(task_id) if list_id else None
+
+    def create(self, list_id: str, payload: dict) -> dict:
+        tasks = self.tasks(list_id)
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            self._next_id += 1
+            task_id = f"{list_id}-new{self._next_id:05d}"
+            task = {
+                "id": task_id,
+                "name": payload.get("name", ""),
+                "status": {"status": STATUSES[0], "type": "open"},
+                "priority": {"id": str(payload.get("priority") or 3)},
+                "date_created": str(now_ms),
+                "date_updated": str(now_ms),
+                "due_date": str(payload["due_date"]) if payload.get("due_date") else None,
+                "description": payload.get("markdown_content", ""),
+                "time_estimate": None,
+                "assignees": [{"id": a} for a in payload.get("assignees", [])],
+                "is_private": bool(payload.get("is_private")),
+                "url": f"https://app.clickup.com/t/{task_id}",
+                "custom_fields": [
+                    {"id": URN_FIELD_ID, "name": "Fusion Document URN", "type": "short_text", "value": None},
+                    {"id": URL_FIELD_ID, "name": "Fusion Design", "type": "url", "value": None},
+                ],
+            }
+            for field in payload.get("custom_fields", []):
+                for existing in task["custom_fields"]:
+                    if existing["id"] == field.get("id"):
+                        existing["value"] = field.get("value")
+            tasks[task_id] = task
+            self._task_list[task_id] = list_id
+        return task
+
+    @staticmethod
+    def touch(task: dict) -> None:
+        task["date_updated"] = str(int(time.time() * 1000))
+
+
+class ClickUpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like api.clickup.com
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle plus
+        # delayed ACK on loopback adds ~40 ms to every response.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    @property
+    def state(self) -> ClickUpState:
+        return self.server.state
+
+    def log_message(self, format, *args):  # noqa: A002 — silence per-request logging
+        pass
+
+    def _send(self, status: int, body) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        # Generous budget so the shared rate limiter never throttles a benchmark
+        self.send_header("x-ratelimit-limit", "100000")
+        self.send_header("x-ratelimit-remaining", "100000")
+        self.send_header("x-ratelimit-reset", str(int(time.time()) + 60))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self, method: str) -> None:
+        self.state.request_count += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        path = parts.path
+        if path.startswith("/api/v2"):
+            path = path[len("/api/v2"):]
+        raw = self._read_body()
+
+        if not self.headers.get("Authorization"):
+            return self._send(401, {"err": "Token invalid", "ECODE": "OAUTH_017"})
+
+        route = (method, path)
+        m = re.fullmatch(r"/list/([^/]+)(/task|/field|/member)?", path)
+        if m:
+            list_id, sub = m.group(1), m.group(2) or ""
+            if method == "GET" and sub == "":
+                return self._send(200, {
+                    "id": list_id,
+                    "name": f"Benchmark {list_id}",
+                    "statuses": [
+                        {"status": s, "orderindex": i, "color": "#7c4dff", "type": "custom"}
+                        for i, s in enumerate(STATUSES)
+                    ],
+                })
+            if method == "GET" and sub == "/field":
+                return self._send(200, {"fields": [
+                    {"id": URN_FIELD_ID, "name": "Fusion Document URN", "type": "short_text"},
+                    {"id": URL_FIELD_ID, "name": "Fusion Design", "type": "url"},
+                ]})
+            if method == "GET" and sub == "/member":
+                return self._send(200, {"members": MEMBERS})
+            if method == "GET" and sub == "/task":
+                return self._send(200, self._task_page(list_id, query))
+            if method == "POST" and sub == "/task":
+                return self._send(200, self.state.create(list_id, json.loads(raw or b"{}")))
+
+        m = re.fullmatch(r"/task/([^/]+)(/field/([^/]+)|/attachment)?", path)
+        if m:
+            task = self.state.find(m.group(1))
+            if task is None:
+                return self._send(404, {"err": "Task not found", "ECODE": "ITEM_013"})
+            if method == "PUT" and m.group(2) is None:
+                self._apply_update(task, json.loads(raw or b"{}"))
+                return self._send(200, task)
+            if method == "POST" and m.group(3):
+                value = json.loads(raw or b"{}").get("value")
+                for field in task["custom_fields"]:
+                    if field["id"] == m.group(3):
+                        field["value"] = value
+                self.state.touch(task)
+                return self._send(200, {})
+            if method == "POST" and m.group(2) == "/attachment":
+                return self._send(200, {"id": f"att-{task['id']}", "size": len(raw)})
+
+        if route == ("POST", "/tinyurl/create"):
+            url = json.loads(raw or b"{}").get("url", "")
+            return self._send(200, {"data": {"tiny_url": f"https://tinyurl.com/b{abs(hash(url)) % 10**8}"}})
+
+        return self._send(404, {"err": f"No route for {method} {path}"})
+
+    def _task_page(self, list_id: str, query: dict) -> dict:
+        tasks = list(self.state.tasks(list_id).values())
+        updated_gt = int(query.get("date_updated_gt") or 0)
+        if updated_gt:
+            tasks = [t for t in tasks if int(t["date_updated"]) > updated_gt]
+        if query.get("include_closed") != "true":
+            tasks = [t for t in tasks if t["status"]["status"] != "complete"]
+        page = int(query.get("page") or 0)
+        chunk = tasks[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        return {"tasks": chunk, "last_page": (page + 1) * PAGE_SIZE >= len(tasks)}
+
+    def _apply_update(self, task: dict, payload: dict) -> None:
+        if "name" in payload:
+            task["name"] = payload["name"]
+        if "status" in payload:
+            task["status"] = {"status": payload["status"], "type": "custom"}
+        if "priority" in payload:
+            task["priority"] = {"id": str(payload["priority"])} if payload["priority"] else None
+        if "description" in payload:
+            task["description"] = payload["description"]
+        if "time_estimate" in payload:
+            task["time_estimate"] = payload["time_estimate"] or None
+        if "due_date" in payload:
+            task["due_date"] = str(payload["due_date"]) if payload["due_date"] else None
+        self.state.touch(task)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+
+def start_server(port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    """Start the stand-in on a daemon thread and return the server (see server_address)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), ClickUpHandler)
+    server.daemon_threads = True
+    server.state = ClickUpState()
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, name="clickup-stub", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every response")
+    args = parser.parse_args()
+    server = start_server(args.port, args.latency_ms / 1000)
+    host, port = server.server_address
+    print(f"ClickUp stand-in on http://{host}:{port}/api/v2 — Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
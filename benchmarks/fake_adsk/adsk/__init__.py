@@ -0,0 +1,17 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Stand-in for Fusion's `adsk` package, for the offline benchmarks only.
+
+Implements just the slice of adsk.core / adsk.fusion the add-in touches
+(Application, UserInterface, command definitions and inputs, documents,
+DataFile thumbnails, custom events, HttpRequest) with plain Python objects
+so commands can be driven and timed on a machine without Fusion.
+"""
+
+from . import core, fusion, cam  # noqa: F401
+
+
+def doEvents():
+    """Deliver custom events fired from worker threads, like Fusion's message loop."""
+    core.Application.get().process_events()
@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""adsk.cam stand-in — imported by fusionAddInUtils, otherwise unused."""
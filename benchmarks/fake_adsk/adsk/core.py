@@ -0,0 +1,627 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""adsk.core stand-in for the offline benchmarks.
+
+Behaviour that the add-in depends on is modelled faithfully enough to be
+timed: command inputs keep their values and table rows, single-select
+dropdowns deselect siblings, and custom events fired from worker threads
+are queued until the main thread calls adsk.doEvents(). Toolbars and
+workspaces are reported as absent, so add-in start() registers command
+definitions without placing buttons.
+"""
+
+import json
+import re
+import threading
+import urllib.error
+import urllib.request
+from collections import deque
+
+
+# ── Enums ─────────────────────────────────────────────────────────────────────
+
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+
+class LogTypes:
+    FileLogType = 0
+    ConsoleLogType = 1
+
+
+class DropDownStyles:
+    LabeledIconDropDownStyle = 0
+    CheckBoxDropDownStyle = 1
+    TextListDropDownStyle = 2
+
+
+class FutureStates:
+    ProcessingFutureState = 0
+    RunningFutureState = 1
+    FinishedFutureState = 2
+    FailedFutureState = 3
+
+
+class UploadStates:
+    UploadProcessing = 0
+    UploadFinished = 1
+    UploadFailed = 2
+
+
+# ── Events ────────────────────────────────────────────────────────────────────
+# fusionAddInUtils.add_handler resolves the handler base class from the
+# string annotation on Event.add, so every event shares one handler type.
+
+
+class EventHandler:
+    def notify(self, args):
+        raise NotImplementedError
+
+
+class Event:
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._handlers: list = []
+
+    def add(self, handler: "EventHandler") -> bool:
+        self._handlers.append(handler)
+        return True
+
+    def remove(self, handler: "EventHandler") -> bool:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+            return True
+        return False
+
+    def fire(self, args) -> None:
+        """Benchmark hook: notify every handler, as Fusion would."""
+        for handler in list(self._handlers):
+            handler.notify(args)
+
+
+class CustomEvent(Event):
+    pass
+
+
+class EventArgs:
+    def __init__(self, firingEvent=None):
+        self.firingEvent = firingEvent
+
+
+class CommandCreatedEventArgs(EventArgs):
+    def __init__(self, command):
+        super().__init__()
+        self.command = command
+
+
+class CommandEventArgs(EventArgs):
+    def __init__(self, command):
+        super().__init__()
+        self.command = command
+        self.executeFailed = False
+
+
+class InputChangedEventArgs(EventArgs):
+    def __init__(self, command, changed_input):
+        super().__init__()
+        self.command = command
+        self.input = changed_input
+        self.inputs = command.commandInputs
+
+
+class ValidateInputsEventArgs(EventArgs):
+    def __init__(self, command):
+        super().__init__()
+        self.command = command
+        self.inputs = command.commandInputs
+        self.areInputsValid = True
+
+
+class DocumentEventArgs(EventArgs):
+    def __init__(self, document):
+        super().__init__()
+        self.document = document
+
+
+class CustomEventArgs(EventArgs):
+    def __init__(self, additional_info: str = ""):
+        super().__init__()
+        self.additionalInfo = additional_info
+
+
+# ── Command inputs ────────────────────────────────────────────────────────────
+
+
+class CommandInput:
+    def __init__(self, inputs, input_id: str, name: str):
+        self.parentCommandInputs = inputs
+        self.id = input_id
+        self.name = name
+        self.isEnabled = True
+        self.isVisible = True
+        self.tooltip = ""
+        self.tooltipDescription = ""
+        self.isFullWidth = False
+
+    def deleteMe(self) -> bool:
+        return self.parentCommandInputs._remove(self)
+
+
+class StringValueCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name, value=""):
+        super().__init__(inputs, input_id, name)
+        self.value = value
+        self.isReadOnly = False
+        self.isValueError = False
+
+
+class TextBoxCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name, formatted_text="", num_rows=1, is_read_only=False):
+        super().__init__(inputs, input_id, name)
+        self.formattedText = formatted_text
+        self.numRows = num_rows
+        self.isReadOnly = is_read_only
+
+    @property
+    def text(self) -> str:
+        return re.sub(r"<[^>]+>", "", self.formattedText or "")
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.formattedText = value
+
+
+class BoolValueCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name, is_check_box=True, resource_folder="", initial_value=False):
+        super().__init__(inputs, input_id, name)
+        self.isCheckBox = is_check_box
+        self.resourceFolder = resource_folder
+        self.value = initial_value
+
+
+class ListItem:
+    def __init__(self, items, name: str, index: int, is_selected: bool):
+        self._items = items
+        self.name = name
+        self.index = index
+        self._selected = False
+        self.isSelected = is_selected
+
+    @property
+    def isSelected(self) -> bool:
+        return self._selected
+
+    @isSelected.setter
+    def isSelected(self, value: bool) -> None:
+        if value and self._items.single_select:
+            for other in self._items._items:
+                other._selected = False
+        self._selected = bool(value)
+
+    def deleteMe(self) -> bool:
+        self._items._items.remove(self)
+        for i, item in enumerate(self._items._items):
+            item.index = i
+        return True
+
+
+class ListItems:
+    def __init__(self, single_select: bool = True):
+        self.single_select = single_select
+        self._items: list = []
+
+    def add(self, name: str, isSelected: bool = False, icon: str = "", beforeIndex: int = -1) -> ListItem:
+        item = ListItem(self, name, len(self._items), False)
+        self._items.append(item)
+        item.isSelected = isSelected
+        return item
+
+    def clear(self) -> bool:
+        self._items = []
+        return True
+
+    @property
+    def count(self) -> int:
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index] if 0 <= index < len(self._items) else None
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class DropDownCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name, drop_down_style=DropDownStyles.TextListDropDownStyle):
+        super().__init__(inputs, input_id, name)
+        self.dropDownStyle = drop_down_style
+        self.listItems = ListItems(drop_down_style != DropDownStyles.CheckBoxDropDownStyle)
+        self.maxVisibleItems = 20
+
+    @property
+    def selectedItem(self):
+        for item in self.listItems:
+            if item.isSelected:
+                return item
+        return None
+
+
+class TableCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name, number_of_columns=1, column_ratio=""):
+        super().__init__(inputs, input_id, name)
+        self.numberOfColumns = number_of_columns
+        self.columnRatio = column_ratio
+        self.hasGrid = False
+        self.minimumVisibleRows = 1
+        self.maximumVisibleRows = 10
+        self.selectedRow = -1
+        self.tablePresentationStyle = 0
+        self._rows: list = []  # one {column: CommandInput} per row
+        self.toolbarInputs: list = []
+
+    def addCommandInput(self, command_input, row: int, column: int, rowSpan: int = 0, columnSpan: int = 0) -> bool:
+        while len(self._rows) <= row:
+            self._rows.append({})
+        self._rows[row][column] = command_input
+        return True
+
+    def addToolbarCommandInput(self, command_input) -> bool:
+        self.toolbarInputs.append(command_input)
+        return True
+
+    def getInputAtPosition(self, row: int, column: int):
+        return self._rows[row].get(column) if 0 <= row < len(self._rows) else None
+
+    @property
+    def rowCount(self) -> int:
+        return len(self._rows)
+
+    def deleteRow(self, row: int, deleteInputs: bool = True) -> bool:
+        if not 0 <= row < len(self._rows):
+            return False
+        cells = self._rows.pop(row)
+        if deleteInputs:
+            for cell in cells.values():
+                cell.deleteMe()
+        return True
+
+    def clear(self) -> bool:
+        for row in range(self.rowCount - 1, -1, -1):
+            self.deleteRow(row, True)
+        return True
+
+
+class GroupCommandInput(CommandInput):
+    def __init__(self, inputs, input_id, name):
+        super().__init__(inputs, input_id, name)
+        self.children = CommandInputs(inputs._command, root=inputs._root)
+        self.isExpanded = True
+
+
+class CommandInputs:
+    """Ordered inputs of one command. Children of groups share the id namespace."""
+
+    def __init__(self, command, root=None):
+        self._command = command
+        self._root = root or self
+        self._by_id: dict = {}
+        self._order: dict = {}  # id → CommandInput, insertion ordered
+
+    @property
+    def command(self):
+        return self._command
+
+    def _register(self, command_input):
+        if command_input.id in self._root._by_id:
+            raise RuntimeError(f"duplicate command input id '{command_input.id}'")
+        self._root._by_id[command_input.id] = command_input
+        self._order[command_input.id] = command_input
+        return command_input
+
+    def _remove(self, command_input) -> bool:
+        self._root._by_id.pop(command_input.id, None)
+        self._order.pop(command_input.id, None)
+        return True
+
+    def itemById(self, input_id: str):
+        return self._root._by_id.get(input_id)
+
+    @property
+    def count(self) -> int:
+        return len(self._order)
+
+    def item(self, index: int):
+        return list(self._order.values())[index] if 0 <= index < len(self._order) else None
+
+    def __iter__(self):
+        return iter(list(self._order.values()))
+
+    def addStringValueInput(self, input_id, name, initialValue=""):
+        return self._register(StringValueCommandInput(self, input_id, name, initialValue))
+
+    def addTextBoxCommandInput(self, input_id, name, formattedText, numRows, isReadOnly):
+        return self._register(TextBoxCommandInput(self, input_id, name, formattedText, numRows, isReadOnly))
+
+    def addBoolValueInput(self, input_id, name, isCheckBox, resourceFolder="", initialValue=False):
+        return self._register(
+            BoolValueCommandInput(self, input_id, name, isCheckBox, resourceFolder, initialValue)
+        )
+
+    def addDropDownCommandInput(self, input_id, name, dropDownStyle):
+        return self._register(DropDownCommandInput(self, input_id, name, dropDownStyle))
+
+    def addTableCommandInput(self, input_id, name, numberOfColumns, columnRatio):
+        return self._register(TableCommandInput(self, input_id, name, numberOfColumns, columnRatio))
+
+    def addGroupCommandInput(self, input_id, name):
+        return self._register(GroupCommandInput(self, input_id, name))
+
+
+class Command:
+    def __init__(self, definition):
+        self.parentCommandDefinition = definition
+        self.commandInputs = CommandInputs(self)
+        self.execute = Event("execute")
+        self.executePreview = Event("executePreview")
+        self.destroy = Event("destroy")
+        self.inputChanged = Event("inputChanged")
+        self.validateInputs = Event("validateInputs")
+        self.activate = Event("activate")
+        self.isAutoExecute = False
+        self.isOKButtonVisible = True
+        self.okButtonText = "OK"
+        self.cancelButtonText = "Cancel"
+        self.isExecutedWhenPreEmpted = True
+
+    def setDialogInitialSize(self, width: int, height: int) -> bool:
+        return True
+
+    def setDialogMinimumSize(self, width: int, height: int) -> bool:
+        return True
+
+    def doExecute(self, terminate: bool) -> bool:
+        self.execute.fire(CommandEventArgs(self))
+        return True
+
+
+class CommandDefinition:
+    def __init__(self, definitions, cmd_id, name, tooltip, resource_folder):
+        self._definitions = definitions
+        self.id = cmd_id
+        self.name = name
+        self.tooltip = tooltip
+        self.resourceFolder = resource_folder
+        self.commandCreated = Event("commandCreated")
+
+    def deleteMe(self) -> bool:
+        return self._definitions._by_id.pop(self.id, None) is not None
+
+    def execute(self):
+        """Benchmark hook: create a Command and fire commandCreated, like a button click."""
+        command = Command(self)
+        self.commandCreated.fire(CommandCreatedEventArgs(command))
+        return command
+
+
+class CommandDefinitions:
+    def __init__(self):
+        self._by_id: dict = {}
+
+    def itemById(self, cmd_id: str):
+        return self._by_id.get(cmd_id)
+
+    def addButtonDefinition(self, cmd_id, name, tooltip, resourceFolder=""):
+        if cmd_id in self._by_id:
+            raise RuntimeError(f"command definition '{cmd_id}' already exists")
+        definition = CommandDefinition(self, cmd_id, name, tooltip, resourceFolder)
+        self._by_id[cmd_id] = definition
+        return definition
+
+    @property
+    def count(self) -> int:
+        return len(self._by_id)
+
+
+class _AbsentCollection:
+    """workspaces / toolbars: nothing to place buttons into."""
+
+    def itemById(self, item_id):
+        return None
+
+    count = 0
+
+
+class DropDownControl:
+    @staticmethod
+    def cast(obj):
+        return obj
+
+
+class UserInterface:
+    def __init__(self):
+        self.commandDefinitions = CommandDefinitions()
+        self.workspaces = _AbsentCollection()
+        self.toolbars = _AbsentCollection()
+        self.messages: list = []  # (text, title) of every messageBox shown
+
+    def messageBox(self, text, title="", buttons=0, icon=0):
+        self.messages.append((text, title))
+        return 0
+
+
+# ── Data: documents, files, thumbnails ───────────────────────────────────────
+
+
+class DataObject:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def getAsArray(self):
+        return self._data
+
+    def saveToFile(self, path: str) -> bool:
+        with open(path, "wb") as fh:
+            fh.write(self._data)
+        return True
+
+
+class DataObjectFuture:
+    """Finished immediately, as when Fusion already holds the thumbnail."""
+
+    def __init__(self, data: bytes):
+        self.state = FutureStates.FinishedFutureState
+        self.dataObject = DataObject(data)
+
+
+class DataHub:
+    def __init__(self, hub_id: str, name: str, web_url: str):
+        self.id = hub_id
+        self.name = name
+        self.fusionWebURL = web_url
+
+
+class DataProject:
+    def __init__(self, project_id: str, name: str, hub: DataHub):
+        self.id = project_id
+        self.name = name
+        self.parentHub = hub
+
+
+class DataFile:
+    def __init__(self, file_id: str, name: str, project: DataProject, version: int = 1, thumbnail: bytes = b""):
+        self.id = file_id
+        self.name = name
+        self.parentProject = project
+        self.versionNumber = version
+        self._thumbnail = thumbnail
+
+    @property
+    def thumbnail(self) -> DataObjectFuture:
+        return DataObjectFuture(self._thumbnail)
+
+
+class Document:
+    def __init__(self, name: str, data_file: DataFile = None):
+        self.name = name
+        self.dataFile = data_file
+        self.isSaved = data_file is not None
+        self.isModified = False
+
+
+class Documents:
+    def __init__(self):
+        self._items: list = []
+
+    @property
+    def count(self) -> int:
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index] if 0 <= index < len(self._items) else None
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+
+
+class HttpResponse:
+    def __init__(self, status_code: int, data: str, headers: dict):
+        self.statusCode = status_code
+        self.data = data
+        self.headers = headers
+
+
+class HttpRequest:
+    """Synchronous request through urllib, standing in for Fusion's networking."""
+
+    def __init__(self, url: str, method: str):
+        self.url = url
+        self.method = method
+        self.data = ""
+        self._headers: dict = {}
+
+    @staticmethod
+    def create(url: str, method: str) -> "HttpRequest":
+        return HttpRequest(url, method)
+
+    def setHeader(self, name: str, value: str) -> bool:
+        self._headers[name] = value
+        return True
+
+    def executeSync(self) -> HttpResponse:
+        body = self.data.encode("utf-8") if isinstance(self.data, str) and self.data else None
+        request = urllib.request.Request(self.url, data=body, headers=self._headers, method=self.method)
+        try:
+            with urllib.request.urlopen(request) as resp:
+                return HttpResponse(resp.status, resp.read().decode("utf-8"), dict(resp.headers))
+        except urllib.error.HTTPError as exc:
+            return HttpResponse(exc.code, exc.read().decode("utf-8"), dict(exc.headers))
+
+
+# ── Application ───────────────────────────────────────────────────────────────
+
+
+class Application:
+    _instance = None
+
+    def __init__(self):
+        self.userInterface = UserInterface()
+        self.activeDocument = None
+        self.activeProduct = None
+        self.documents = Documents()
+        self.data = None
+        self.documentActivated = Event("documentActivated")
+        self._custom_events: dict = {}
+        self._pending = deque()  # (event id, additional info) fired from any thread
+        self._pending_lock = threading.Lock()
+        self.log_lines = deque(maxlen=1000)  # most recent app.log messages
+
+    @staticmethod
+    def get() -> "Application":
+        if Application._instance is None:
+            Application._instance = Application()
+        return Application._instance
+
+    def log(self, message: str, level=LogLevels.InfoLogLevel, log_type=LogTypes.ConsoleLogType) -> None:
+        self.log_lines.append(message)
+
+    def registerCustomEvent(self, event_id: str) -> CustomEvent:
+        event = CustomEvent(event_id)
+        self._custom_events[event_id] = event
+        return event
+
+    def unregisterCustomEvent(self, event_id: str) -> bool:
+        return self._custom_events.pop(event_id, None) is not None
+
+    def fireCustomEvent(self, event_id: str, additionalInfo: str = "") -> bool:
+        if event_id not in self._custom_events:
+            return False
+        with self._pending_lock:
+            self._pending.append((event_id, additionalInfo))
+        return True
+
+    def process_events(self) -> int:
+        """Deliver queued custom events on the calling (main) thread. Returns the count."""
+        delivered = 0
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    return delivered
+                event_id, info = self._pending.popleft()
+            event = self._custom_events.get(event_id)
+            if event is not None:
+                event.fire(CustomEventArgs(info))
+                delivered += 1
+
+    def activate_document(self, document: Document) -> None:
+        """Benchmark hook: make *document* active and fire documentActivated."""
+        self.activeDocument = document
+        if document not in self.documents._items:
+            self.documents._items.append(document)
+        self.documentActivated.fire(DocumentEventArgs(document))
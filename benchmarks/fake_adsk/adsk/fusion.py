@@ -0,0 +1,10 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""adsk.fusion stand-in — only what the add-in references."""
+
+
+class Design:
+    @staticmethod
+    def cast(obj):
+        return obj if isinstance(obj, Design) else None
@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2022-2026 IMA LLC
 
-from .saveURL import entry as commandDialog
-from .openClickUp import entry as openClickUp
-from .addtask import entry as addTask
-from .setTokens import entry as setTokens
-from .listTasks import entry as listTasks
-from .updateTasks import entry as updateTasks
+# Each command package's __init__ only registers the button; its entry.py is
+# imported the first time the command runs (see lazy.py).
+from . import saveURL as commandDialog
+from . import openClickUp
+from . import addtask as addTask
+from . import setTokens
+from . import listTasks
+from . import updateTasks
 
 from ..lib import fusionAddInUtils as futil
 
@@ -17,11 +19,12 @@ commands = [commandDialog, openClickUp, addTask, listTasks, updateTasks, setToke
 # Assumes you defined a "start" function in each of your modules.
 # The start function will be run when the add-in is started.
 def start():
-    for command in commands:
-        try:
-            command.start()
-        except Exception:
-            futil.handle_error(command.__name__)
+    with futil.perf_timer("start", "commands"):
+        for command in commands:
+            try:
+                command.start()
+            except Exception:
+                futil.handle_error(command.__name__)
 
 
 # Assumes you defined a "stop" function in each of your modules.
@@ -32,3 +35,8 @@ def stop():
             command.stop()
         except Exception:
             futil.handle_error(command.__name__)
+
+
+def loaded():
+    """Return True once any command's implementation has been imported."""
+    return any(command._entry.loaded for command in commands)
@@ -3,8 +3,6 @@
 
 import adsk.core
 import adsk.fusion
-import http.client
-import json
 import os
 import tempfile
 import time
@@ -12,80 +10,54 @@ from datetime import datetime
 from urllib.parse import quote
 
 from ...lib import fusionAddInUtils as futil
+from ...lib import clickupUtils as cutil
 from ... import config
+from . import CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
-
-# Command identity information
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_addTask"
-CMD_NAME = "Add ClickUp Task"
-CMD_Description = "Create a new ClickUp task with a name, description, and due date"
-
-# Specify that the command will be promoted to the panel
-IS_PROMOTED = True
-WORKSPACE_ID = config.design_workspace
-TAB_ID = config.tools_tab_id
-TAB_NAME = config.my_tab_name
-
-PANEL_ID = config.clickup_panel_id
-PANEL_NAME = config.clickup_panel_name
-PANEL_AFTER = config.clickup_panel_after
-
-# Resource location for command icons
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
+log = cutil.get_logger(CMD_NAME)
 
 # ClickUp API configuration
 # The API token is read from cache/auth.json.
-# The list ID is read per-project from cache/projects.json ("clickup_list_id" key),
+# The list ID is read per-project from cache/projects.sqlite ("clickup_list_id" key),
 # keyed by the Fusion project URN — the same lookup used by openClickUp and saveURL.
-CLICKUP_API_BASE = "https://api.clickup.com/api/v2"
+# All requests go through the pooled client in lib/clickupUtils.
+TINYURL_API_BASE = "https://api.tinyurl.com"
+
+# DataFile.thumbnail download: how often to re-check it and when to give up
+THUMBNAIL_POLL_SECONDS = 0.1
+THUMBNAIL_MAX_WAIT_SECONDS = 10.0
 
 # Path to auth credentials in the shared cache folder
 CACHE_DIR = config.CACHE_DIR
 AUTH_JSON_PATH = os.path.join(CACHE_DIR, "auth.json")
-PROJECTS_JSON_PATH = os.path.join(CACHE_DIR, "projects.json")
+PROJECTS_DB_PATH = config.PROJECTS_DB_PATH
 
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
 local_handlers = []
 
-# Module-level cache of list members fetched during command_created so they are
-# available by index when command_execute resolves the selected dropdown item.
-_list_members: list = []  # [{"id": int, "username": str, "email": str}, ...]
+# Module-level index of the list members fetched during command_created, so
+# command_execute resolves the selected dropdown item without a scan.
+_list_lookup = cutil.ListLookup()  # members only; statuses are not shown here
 
 # Module-level list of pre-calculated quick-date (label, value) tuples built in command_created.
 _quick_date_options: list = []
 
-
-def start():
-    """Executed when add-in is run."""
-    # Create a command Definition
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-
-    # Define an event handler for the command created event
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    # Add a button into the UI
-    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
-    if panel:
-        control = panel.controls.addCommand(cmd_def, "", False)
-        control.isPromoted = IS_PROMOTED
-
-
-def stop():
-    """Executed when add-in is stopped."""
-    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
+# Dependency-aware pipeline for the dialog's network lookups. Created in
+# command_created so the Link Document lookups (field ids, TinyURL) run while
+# the user is still filling in the dialog; command_execute collects the results.
+_pipeline = None  # cutil.Pipeline, or None when the list could not be resolved
+_api_token: str = ""
+_list_id: str = ""
+_thumbnail_future = None  # DataObjectFuture started speculatively for Link Document
 
 
+@cutil.traced(CMD_NAME, begin=True)
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     """Called when the command button is clicked — builds the dialog."""
-    futil.log(f"{CMD_NAME}: Command Created — building dialog inputs.")
+    log.info("Command Created — building dialog inputs.")
 
     # ------------------------------------------------------------------ #
     # Pre-flight: confirm required cache files are present               #
@@ -93,12 +65,12 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     missing = []
     if not os.path.isfile(AUTH_JSON_PATH):
         missing.append(f"  • {AUTH_JSON_PATH}")
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        missing.append(f"  • {PROJECTS_JSON_PATH}")
+    if not cutil.project_mappings_exist():
+        missing.append(f"  • {PROJECTS_DB_PATH}")
 
     if missing:
         missing_list = "\n".join(missing)
-        futil.log(f"{CMD_NAME}: Aborting — missing cache file(s):\n{missing_list}")
+        log.info("Aborting — missing cache file(s):\n%s", missing_list)
         ui.messageBox(
             "Required configuration files are missing:\n\n"
             f"{missing_list}\n\n"
@@ -114,27 +86,34 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         return
 
     # ------------------------------------------------------------------ #
-    # Pre-fetch list members for the assignee dropdown (best-effort)      #
+    # Start the pipeline: list members for the assignee dropdown, plus   #
+    # the Link Document lookups (on by default) so they overlap with the  #
+    # member fetch and with the user filling in the dialog (best-effort). #
     # ------------------------------------------------------------------ #
-    global _list_members
-    _list_members = []
+    global _list_lookup, _pipeline, _api_token, _list_id, _thumbnail_future
+    _list_lookup = cutil.ListLookup()
+    _pipeline = None
+    _api_token = ""
+    _list_id = ""
+    _thumbnail_future = None
     try:
-        _api_token_early = _load_api_token()
+        _api_token = cutil.get_clickup_api_token()
         _doc_early = app.activeDocument
         _data_file_early = _doc_early.dataFile if _doc_early else None
         _proj_early = _data_file_early.parentProject if _data_file_early else None
         _proj_urn_early = _proj_early.id if _proj_early else None
-        if _api_token_early and _proj_urn_early:
-            _list_id_early = _load_list_id_for_project(_proj_urn_early)
-            if _list_id_early:
-                _list_members = _fetch_list_members(_list_id_early, _api_token_early)
-                futil.log(
-                    f"{CMD_NAME}: command_created — fetched {len(_list_members)} member(s)."
-                )
+        if _api_token and _proj_urn_early:
+            _list_id = cutil.get_list_id_for_project(_proj_urn_early)
+        if _list_id:
+            _pipeline = cutil.Pipeline("addTask")
+            _pipeline.step("members", _fetch_list_members, _list_id, _api_token)
+            _start_link_document_steps()
+            _list_lookup = cutil.ListLookup(members=_pipeline.value("members", default=[]))
+            log.info(
+                "command_created — fetched %s member(s).", len(_list_lookup.members)
+            )
     except Exception as _exc:
-        futil.log(
-            f"{CMD_NAME}: command_created — member prefetch failed (non-fatal): {_exc}"
-        )
+        log.warning("command_created — pipeline start failed (non-fatal): %s", _exc)
 
     inputs = args.command.commandInputs
 
@@ -217,8 +196,8 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         "(Populated from the ClickUp list members.)"
     )
     assignee_input.listItems.add("— Unassigned —", True)
-    for _member in _list_members:
-        assignee_input.listItems.add(_member["username"], False)
+    for _username in _list_lookup.member_options:
+        assignee_input.listItems.add(_username, False)
 
     # Private Task — checkbox; only enabled when an assignee is selected
     # (ClickUp private tasks require at least one assignee to be meaningful)
@@ -252,9 +231,10 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     )
 
 
+@cutil.traced(CMD_NAME)
 def command_execute(args: adsk.core.CommandEventArgs):
     """Called when the user clicks OK in the dialog."""
-    futil.log(f"{CMD_NAME}: Execute event started.")
+    log.info("Execute event started.")
 
     try:
         # ------------------------------------------------------------------ #
@@ -281,70 +261,47 @@ def command_execute(args: adsk.core.CommandEventArgs):
         link_document = getattr(link_doc_input, "value", False)
         task_private = getattr(private_input, "value", False)
 
-        # Resolve assignee: look up selected username in cached _list_members
+        # Resolve assignee: look up selected username in the cached member index
         assignee_id = 0  # 0 = unassigned
         if assignee_input and assignee_input.selectedItem:
-            selected_name = assignee_input.selectedItem.name
-            for _m in _list_members:
-                if _m["username"] == selected_name:
-                    assignee_id = _m["id"]
-                    break
+            assignee_id = _list_lookup.member_id(assignee_input.selectedItem.name)
 
         # Map label → ClickUp priority integer
         _PRIORITY_MAP = {"Low": 4, "Normal": 3, "High": 2, "Urgent": 1}
         priority_value = _PRIORITY_MAP.get(priority_label, 3)
 
-        futil.log(
-            f"{CMD_NAME}: Inputs collected — name='{task_name}', due='{due_date_str}', priority='{priority_label}'({priority_value}), link_document={link_document}, private={task_private}, assignee_id={assignee_id}"
+        log.info(
+            "Inputs collected — name='%s', due='%s', priority='%s'(%s), "
+            "link_document=%s, private=%s, assignee_id=%s",
+            task_name,
+            due_date_str,
+            priority_label,
+            priority_value,
+            link_document,
+            task_private,
+            assignee_id,
         )
 
         # ------------------------------------------------------------------ #
-        # 1b. Build Open-on-Desktop URL and shorten via TinyURL (if checked) #
-        # Done early so the result is ready before payload construction.     #
+        # 1b. Collect the shortened Open-on-Desktop URL (if checked)         #
+        # Usually finished already: the pipeline started it speculatively.  #
         # ------------------------------------------------------------------ #
         short_url = None
         if link_document:
-            futil.log(
-                f"{CMD_NAME}: [TinyURL] link_document=True — building Open-on-Desktop URL."
-            )
-            active_doc = app.activeDocument
-            futil.log(
-                f"{CMD_NAME}: [TinyURL] active_doc='{getattr(active_doc, 'name', None)}' "
-                f"isSaved={getattr(active_doc, 'isSaved', None)} "
-                f"dataFile={getattr(active_doc, 'dataFile', None)}",
-            )
-            if active_doc and active_doc.isSaved and active_doc.dataFile:
-                fusion_url = _build_open_on_desktop_url(active_doc)
-                futil.log(f"{CMD_NAME}: [TinyURL] fusion_url='{fusion_url}'")
-
-                tinyurl_token = _load_tinyurl_token()
-                if tinyurl_token:
-                    futil.log(
-                        f"{CMD_NAME}: [TinyURL] token loaded (len={len(tinyurl_token)}), calling _shorten_url..."
-                    )
-                    short_url = _shorten_url(fusion_url, tinyurl_token)
-                    futil.log(
-                        f"{CMD_NAME}: [TinyURL] _shorten_url returned: '{short_url}'"
-                    )
-                else:
-                    futil.log(
-                        f"{CMD_NAME}: [TinyURL] WARNING — tinyurl_api_token missing in auth.json. Skipping."
-                    )
-            else:
-                futil.log(
-                    f"{CMD_NAME}: [TinyURL] WARNING — document unsaved or no dataFile. Skipping."
-                )
+            _start_link_document_steps()  # no-op when already started
+            short_url = _pipeline.value("short_url") if _pipeline else None
+            log.info("[TinyURL] short_url='%s'", short_url)
         else:
-            futil.log(f"{CMD_NAME}: link_document=False — skipping document link.")
+            log.info("link_document=False — skipping document link.")
 
         # ------------------------------------------------------------------ #
         # 2. Load API token from cache/auth.json                             #
         # ------------------------------------------------------------------ #
-        futil.log(f"{CMD_NAME}: Loading API token from '{AUTH_JSON_PATH}'")
+        log.info("Loading API token from '%s'", AUTH_JSON_PATH)
 
-        api_token = _load_api_token()
+        api_token = cutil.get_clickup_api_token()
         if not api_token:
-            futil.log(f"{CMD_NAME}: ERROR — API token not found in '{AUTH_JSON_PATH}'")
+            log.error("ERROR — API token not found in '%s'", AUTH_JSON_PATH)
             ui.messageBox(
                 f"ClickUp API token not found.\n\n"
                 f"Please add your token to:\n{AUTH_JSON_PATH}\n\n"
@@ -354,12 +311,10 @@ def command_execute(args: adsk.core.CommandEventArgs):
             )
             return
 
-        futil.log(
-            f"{CMD_NAME}: API token loaded successfully (length={len(api_token)})."
-        )
+        log.info("API token loaded successfully (length=%s).", len(api_token))
 
         # ------------------------------------------------------------------ #
-        # 2b. Resolve list ID from projects.json using the active project    #
+        # 2b. Resolve list ID from the project mapping for the active project #
         # ------------------------------------------------------------------ #
         doc = app.activeDocument
         data_file = doc.dataFile if doc else None
@@ -367,7 +322,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
         project_urn = project.id if project else None
 
         if not project_urn:
-            futil.log(f"{CMD_NAME}: ERROR — could not determine current project URN.")
+            log.error("ERROR — could not determine current project URN.")
             ui.messageBox(
                 "Could not determine the current Fusion project.\n\n"
                 "Please make sure a saved document is open.",
@@ -375,25 +330,22 @@ def command_execute(args: adsk.core.CommandEventArgs):
             )
             return
 
-        futil.log(f"{CMD_NAME}: Active project URN = '{project_urn}'")
+        log.info("Active project URN = '%s'", project_urn)
 
-        list_id = _load_list_id_for_project(project_urn)
+        list_id = cutil.get_list_id_for_project(project_urn)
         if not list_id:
-            futil.log(
-                f"{CMD_NAME}: ERROR — clickup_list_id not set for project '{project_urn}'"
-            )
+            log.error("ERROR — clickup_list_id not set for project '%s'", project_urn)
             ui.messageBox(
                 f"No ClickUp list ID configured for this project.\n\n"
                 f"To fix:\n"
                 f"1. Open ClickUp and navigate into a List (not a Folder).\n"
                 f"2. Copy the number after /li/ in the URL.\n"
-                f'3. Add "clickup_list_id" to this project\'s entry in:\n'
-                f"   {config.PROJECTS_JSON_PATH}",
+                f"3. Run 'Map Project to ClickUp' and paste it into ClickUp List ID.",
                 "List ID Not Configured",
             )
             return
 
-        futil.log(f"{CMD_NAME}: Using list ID '{list_id}'.")
+        log.info("Using list ID '%s'.", list_id)
 
         # ------------------------------------------------------------------ #
         # 3. Build the ClickUp Create Task payload                           #
@@ -409,7 +361,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
         # Add assignee if one was selected (ClickUp create task takes an array of IDs)
         if assignee_id:
             payload["assignees"] = [assignee_id]
-            futil.log(f"{CMD_NAME}: Assigning task to user ID {assignee_id}.")
+            log.info("Assigning task to user ID %s.", assignee_id)
 
         # Use markdown_content if a description was provided (overrides plain description)
         if task_description:
@@ -421,13 +373,13 @@ def command_execute(args: adsk.core.CommandEventArgs):
             if due_ms is not None:
                 payload["due_date"] = due_ms
                 payload["due_date_time"] = " " in due_date_str  # True when HH:MM present (Later)
-                futil.log(f"{CMD_NAME}: Due date '{due_date_str}' → {due_ms} ms.")
+                log.info("Due date '%s' → %s ms.", due_date_str, due_ms)
             else:
-                futil.log(
-                    f"{CMD_NAME}: WARNING — Could not parse due date '{due_date_str}'. Skipping."
+                log.warning(
+                    "WARNING — Could not parse due date '%s'. Skipping.", due_date_str
                 )
 
-        futil.log(f"{CMD_NAME}: Payload prepared — {list(payload.keys())}")
+        log.debug(lambda: f"Payload prepared — {list(payload.keys())}")
 
         # ------------------------------------------------------------------ #
         # 3b. Inject document custom fields when "Link Document" is enabled  #
@@ -435,24 +387,25 @@ def command_execute(args: adsk.core.CommandEventArgs):
         custom_fields_list = []
 
         if short_url:
-            futil.log(
-                f"{CMD_NAME}: [TinyURL] Attaching short_url='{short_url}' to ClickUp custom field."
+            log.info(
+                "[TinyURL] Attaching short_url='%s' to ClickUp custom field.", short_url
             )
-            url_field_id = _get_url_custom_field_id(list_id, api_token)
+            url_field_id = _pipeline.value("url_field_id", default="")
             if url_field_id:
                 custom_fields_list.append({"id": url_field_id, "value": short_url})
-                futil.log(
-                    f"{CMD_NAME}: [TinyURL] URL custom field queued — field_id='{url_field_id}'."
+                log.info(
+                    "[TinyURL] URL custom field queued — field_id='%s'.", url_field_id
                 )
             else:
-                futil.log(
-                    f"{CMD_NAME}: [TinyURL] WARNING — 'Fusion Design' URL field not found on list '{list_id}'. "
-                    f"Document link will not be attached.",
+                log.warning(
+                    "[TinyURL] WARNING — 'Fusion Design' URL field not found on list "
+                    "'%s'. Document link will not be attached.",
+                    list_id,
                 )
         elif link_document:
-            futil.log(
-                f"{CMD_NAME}: [TinyURL] WARNING — shortening failed or was skipped. "
-                f"No URL custom field added to payload.",
+            log.warning(
+                "[TinyURL] WARNING — shortening failed or was skipped. No URL custom "
+                "field added to payload.",
             )
 
         # Look up the 'Fusion Document URN' field ID now — value is written after task creation
@@ -461,88 +414,112 @@ def command_execute(args: adsk.core.CommandEventArgs):
         doc_urn = None
         if link_document and data_file:
             doc_urn = data_file.id
-            futil.log(f"{CMD_NAME}: [URN] Document URN resolved: '{doc_urn}'")
-            urn_field_id = _get_urn_custom_field_id(list_id, api_token)
+            log.info("[URN] Document URN resolved: '%s'", doc_urn)
+            urn_field_id = (
+                _pipeline.value("urn_field_id", default="")
+                if _pipeline
+                else _get_urn_custom_field_id(list_id, api_token)
+            )
             if urn_field_id:
-                futil.log(
-                    f"{CMD_NAME}: [URN] 'Fusion Document URN' field found — id='{urn_field_id}'. Will write after task creation."
+                log.info(
+                    "[URN] 'Fusion Document URN' field found — id='%s'. Will write "
+                    "after task creation.",
+                    urn_field_id,
                 )
             else:
-                futil.log(
-                    f"{CMD_NAME}: [URN] WARNING — 'Fusion Document URN' field not found on list '{list_id}'. "
-                    f"Document URN will not be attached.",
+                log.warning(
+                    "[URN] WARNING — 'Fusion Document URN' field not found on list "
+                    "'%s'. Document URN will not be attached.",
+                    list_id,
                 )
 
         if custom_fields_list:
             payload["custom_fields"] = custom_fields_list
-            futil.log(
-                f"{CMD_NAME}: payload['custom_fields'] set with {len(custom_fields_list)} field(s)."
+            log.info(
+                "payload['custom_fields'] set with %s field(s).",
+                len(custom_fields_list),
             )
 
         # ------------------------------------------------------------------ #
-        # 4. POST to ClickUp API using adsk.core.HttpRequest (Fusion native) #
-        # Ref: adsk.core.HttpRequest.create / executeSync                    #
+        # 4. POST to ClickUp API over the shared keep-alive connection pool  #
         # ------------------------------------------------------------------ #
-        url = f"{CLICKUP_API_BASE}/list/{list_id}/task"
-        body_str = json.dumps(payload)
-
-        futil.log(f"{CMD_NAME}: Creating HttpRequest — POST '{url}'")
+        log.info("POST '/list/%s/task'", list_id)
 
-        http_req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.PostMethod)
-        http_req.setHeader("Authorization", api_token)
-        http_req.setHeader("Content-Type", "application/json")
-        http_req.setHeader("Accept", "application/json")
-        http_req.data = body_str
-
-        futil.log(f"{CMD_NAME}: Executing request synchronously...")
-        response = http_req.executeSync()
+        response = cutil.clickup_request(
+            "POST", f"/list/{list_id}/task", api_token, json_body=payload
+        )
 
-        status_code = response.statusCode
-        futil.log(f"{CMD_NAME}: Response status — {status_code}")
+        status_code = response.status_code
+        log.info("Response status — %s (%.3f s)", status_code, response.elapsed)
 
         # ------------------------------------------------------------------ #
         # 5. Handle response                                                  #
         # ------------------------------------------------------------------ #
-        if 200 <= status_code < 300:
-            task = json.loads(response.data)
+        if response.ok:
+            task = response.json()
             task_id = task.get("id", "")
             task_url = task.get("url", "—")
             task_status = task.get("status", {}).get("status", "—")
 
-            futil.log(f"{CMD_NAME}: Task created successfully.")
-            futil.log(f"{CMD_NAME}:   Task ID  = {task_id}")
-            futil.log(f"{CMD_NAME}:   Task URL = {task_url}")
-            futil.log(f"{CMD_NAME}:   Status   = {task_status}")
+            log.info("Task created successfully.")
+            log.info("  Task ID  = %s", task_id)
+            log.info("  Task URL = %s", task_url)
+            log.info("  Status   = %s", task_status)
+
+            # Write-through to the local task mirror so List/Update Tasks show the
+            # new task before the next ClickUp sync picks it up.
+            try:
+                cutil.get_task_mirror(list_id).upsert_tasks([task])
+            except Exception as exc:
+                log.warning("task mirror write-through failed (non-fatal): %s", exc)
 
             # ------------------------------------------------------------------ #
-            # 5b. Write Fusion Document URN to custom field via dedicated API    #
-            # POST /api/v2/task/{task_id}/field/{field_id}                       #
-            # This is more reliable than inline custom_fields on task creation   #
-            # for text-type fields.                                              #
+            # 5b. Post-creation work runs in the background so OK returns     #
+            # after the single POST:                                          #
+            #   • Fusion Document URN → POST /task/{task_id}/field/{field_id} #
+            #     (more reliable than inline custom_fields for text fields)   #
+            #   • document thumbnail → POST /task/{task_id}/attachment, once  #
+            #     the download started when the dialog opened has finished   #
             # ------------------------------------------------------------------ #
-            if urn_field_id and doc_urn and task_id:
-                futil.log(
-                    f"{CMD_NAME}: [URN] Setting 'Fusion Document URN' on task '{task_id}'."
-                )
-                urn_ok = _set_task_custom_field(
-                    task_id, urn_field_id, doc_urn, api_token
+            if task_id and urn_field_id and doc_urn:
+                cutil.submit_background(
+                    _write_document_urn,
+                    task_id,
+                    list_id,
+                    urn_field_id,
+                    doc_urn,
+                    api_token,
+                    on_error=lambda exc: log.warning(
+                        "[URN] background write failed: %r", exc
+                    ),
+                    name=f"{CMD_NAME} URN write",
                 )
-                if urn_ok:
-                    futil.log(
-                        f"{CMD_NAME}: [URN] 'Fusion Document URN' written successfully."
-                    )
-                else:
-                    futil.log(
-                        f"{CMD_NAME}: [URN] WARNING — failed to write 'Fusion Document URN' field."
-                    )
 
-            # ------------------------------------------------------------------ #
-            # 5c. Attach document thumbnail when Link Document is enabled        #
-            # DataFile.thumbnail → DataObjectFuture → 256×256 PNG attachment       #
-            # ------------------------------------------------------------------ #
             if link_document and task_id and data_file:
-                futil.log(f"{CMD_NAME}: [Thumbnail] Attaching document thumbnail to task '{task_id}'.")
-                _attach_thumbnail_to_task(task_id, data_file, api_token)
+                thumbnail_name = data_file.name.replace(" ", "_") + "_thumbnail.png"
+                file_id, version = data_file.id, data_file.versionNumber
+
+                def _upload(png):
+                    cutil.submit_background(
+                        _cache_and_upload_thumbnail,
+                        task_id,
+                        thumbnail_name,
+                        png,
+                        file_id,
+                        version,
+                        api_token,
+                        name=f"{CMD_NAME} thumbnail upload",
+                    )
+
+                # Same document version as an earlier task → reuse its thumbnail
+                cached_png = cutil.cached_thumbnail(file_id, version)
+                if cached_png:
+                    log.info("[Thumbnail] using cached thumbnail for v%s.", version)
+                    _upload(cached_png)
+                else:
+                    if _thumbnail_future is None:
+                        _start_link_document_steps()
+                    _await_thumbnail(_thumbnail_future, _upload)
 
             ui.messageBox(
                 f"Task <b>{task_name}</b> created.<br>"
@@ -553,7 +530,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
 
         else:
             error_body = response.data
-            futil.log(f"{CMD_NAME}: ERROR — API returned {status_code}: {error_body}")
+            log.error("ERROR — API returned %s: %s", status_code, error_body)
             ui.messageBox(
                 f"Failed to create task.\n\n" f"HTTP {status_code}\n\n" f"{error_body}",
                 "ClickUp API Error",
@@ -563,6 +540,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
         futil.handle_error(f"{CMD_NAME}: command_execute", show_message_box=True)
 
 
+@cutil.traced(CMD_NAME)
 def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
     """Called on every input change to enable/disable the OK button."""
     inputs = args.inputs
@@ -586,12 +564,19 @@ def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
     args.areInputsValid = True
 
 
+@cutil.traced(CMD_NAME)
 def command_input_changed(args: adsk.core.InputChangedEventArgs):
     """Handles input changes: date shortcuts fill the due-date field;
     the assignee dropdown enables/disables the private-task checkbox.
     """
     changed = args.input
 
+    # ---- Link Document → start its lookups before OK is clicked ----
+    if changed.id == "link_document":
+        if getattr(changed, "value", False):
+            _start_link_document_steps()
+        return
+
     # ---- Assignee → toggle private checkbox ----
     if changed.id == "task_assignee":
         private_input = args.inputs.itemById("task_private")
@@ -614,11 +599,45 @@ def command_input_changed(args: adsk.core.InputChangedEventArgs):
         return
 
 
+@cutil.traced(CMD_NAME)
+def document_activated(args: adsk.core.DocumentEventArgs):
+    """Prefetch the Open-on-Desktop short link for the newly active document.
+
+    Only documents in a project mapped to a ClickUp list are considered, and
+    nothing is sent when the link is already memoized.
+    """
+    doc = args.document
+    if not (doc and doc.isSaved and doc.dataFile):
+        return
+    project = doc.dataFile.parentProject
+    if not (project and cutil.get_list_id_for_project(project.id)):
+        return
+    tinyurl_token = cutil.get_tinyurl_api_token()
+    if not tinyurl_token:
+        return
+    fusion_url = _build_open_on_desktop_url(doc)
+    if cutil.get_short_url(fusion_url):
+        return
+    log.info("[TinyURL] prefetching short link for '%s'.", doc.name)
+    cutil.submit_background(
+        _get_short_url,
+        fusion_url,
+        tinyurl_token,
+        name=f"{CMD_NAME} short link prefetch",
+    )
+
+
+@cutil.traced(CMD_NAME, end=True)
 def command_destroy(args: adsk.core.CommandEventArgs):
     """Called when the command dialog closes — clears event handler references."""
-    futil.log(f"{CMD_NAME}: Command destroyed. Clearing local handlers.")
-    global local_handlers
+    log.info("Command destroyed. Clearing local handlers.")
+    global local_handlers, _pipeline, _thumbnail_future
     local_handlers = []
+    # Speculative lookups nobody collected (dialog cancelled) are dropped
+    if _pipeline is not None:
+        _pipeline.shutdown()
+    _pipeline = None
+    _thumbnail_future = None
 
 
 # ---------------------------------------------------------------------------
@@ -627,120 +646,69 @@ def command_destroy(args: adsk.core.CommandEventArgs):
 
 
 def _fetch_list_members(list_id: str, api_token: str) -> list:
-    """GET /api/v2/list/{list_id}/member and return a sorted list of user dicts.
+    """Return the list members sorted by username, via the shared list-metadata cache.
 
     Each returned item has: {"id": int, "username": str, "email": str}.
     Returns an empty list on any failure.
     ClickUp docs: https://developer.clickup.com/reference/getlistmembers
     """
-    url = f"{CLICKUP_API_BASE}/list/{list_id}/member"
-    futil.log(f"{CMD_NAME}: _fetch_list_members — GET '{url}'")
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_list_members — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_list_members — error: {response.data}")
-            return []
-        data = json.loads(response.data)
-        members = []
-        for item in data.get("members", []):
-            user = item.get("user", item)
-            uid = user.get("id")
-            if not uid:
-                continue
-            members.append(
-                {
-                    "id": int(uid),
-                    "username": (user.get("username") or user.get("email") or str(uid)),
-                    "email": user.get("email", ""),
-                }
-            )
-        members.sort(key=lambda m: m["username"].lower())
-        return members
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_list_members — exception: {exc}")
-        return []
-
+    members = cutil.get_list_members(list_id, api_token)
+    log.info("_fetch_list_members — %s member(s)", len(members))
+    return members
 
-def _load_api_token() -> str:
-    """Read the ClickUp API token from cache/auth.json.
 
-    Expected file layout::
-
-        {
-            "clickup_api_token": "pk_YOUR_TOKEN_HERE"
-        }
+def _start_link_document_steps() -> None:
+    """Start the Link Document lookups in the pipeline. Safe to call repeatedly.
 
-    Returns an empty string if the file is missing, malformed, or the key is absent.
+    Runs on the main thread: the Open-on-Desktop URL and the thumbnail
+    download need the Fusion API, so they are resolved here and only the
+    network calls (field lookups, TinyURL) are handed to the pipeline.
     """
-    futil.log(f"{CMD_NAME}: _load_api_token — reading '{AUTH_JSON_PATH}'")
-
-    if not os.path.isfile(AUTH_JSON_PATH):
-        futil.log(
-            f"{CMD_NAME}: _load_api_token — auth.json not found at '{AUTH_JSON_PATH}'"
-        )
-        return ""
-
-    try:
-        with open(AUTH_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except json.JSONDecodeError as exc:
-        futil.log(f"{CMD_NAME}: _load_api_token — JSON parse error: {exc}")
-        return ""
-    except OSError as exc:
-        futil.log(f"{CMD_NAME}: _load_api_token — file read error: {exc}")
-        return ""
-
-    token = data.get("clickup_api_token", "").strip()
-    if not token:
-        futil.log(
-            f"{CMD_NAME}: _load_api_token — 'clickup_api_token' key is missing or empty."
-        )
-    return token
-
-
-def _load_list_id_for_project(project_urn: str) -> str:
-    """Read the ClickUp list ID for the given Fusion project URN from projects.json.
-
-    Expected file layout::
+    global _thumbnail_future
+    if _pipeline is None:
+        return
+    _pipeline.step("url_field_id", _get_url_custom_field_id, _list_id, _api_token)
+    _pipeline.step("urn_field_id", _get_urn_custom_field_id, _list_id, _api_token)
 
-        {
-            "projects": {
-                "<project_urn>": {
-                    "clickup_list_id": "901112345678"
-                }
-            }
-        }
+    active_doc = app.activeDocument
+    if not (active_doc and active_doc.isSaved and active_doc.dataFile):
+        log.warning("[TinyURL] WARNING — document unsaved or no dataFile. Skipping.")
+        return
 
-    The list ID is the number after /li/ in a ClickUp list URL.
-    Returns an empty string if the file/key is missing, malformed, or the project is not found.
-    """
-    futil.log(f"{CMD_NAME}: _load_list_id_for_project — URN='{project_urn}'")
+    data_file = active_doc.dataFile
+    if _thumbnail_future is None and not cutil.cached_thumbnail_digest(
+        data_file.id, data_file.versionNumber
+    ):
+        # Starts the async 256×256 PNG download; read after the task POST
+        _thumbnail_future = data_file.thumbnail
+
+    if "short_url" not in _pipeline:
+        fusion_url = _build_open_on_desktop_url(active_doc)
+        log.info("[TinyURL] fusion_url='%s'", fusion_url)
+        tinyurl_token = cutil.get_tinyurl_api_token()
+        if tinyurl_token:
+            _pipeline.step("short_url", _get_short_url, fusion_url, tinyurl_token)
+        else:
+            log.warning(
+                "[TinyURL] WARNING — tinyurl_api_token missing in auth.json. Skipping."
+            )
 
-    if not os.path.isfile(config.PROJECTS_JSON_PATH):
-        futil.log(f"{CMD_NAME}: _load_list_id_for_project — projects.json not found.")
-        return ""
 
+def _write_document_urn(
+    task_id: str, list_id: str, urn_field_id: str, doc_urn: str, api_token: str
+) -> None:
+    """Worker thread: write the Fusion Document URN field on a new task and mirror it."""
+    log.info("[URN] Setting 'Fusion Document URN' on task '%s'.", task_id)
+    if not _set_task_custom_field(
+        task_id, urn_field_id, doc_urn, api_token, priority=cutil.PRIORITY_BACKGROUND
+    ):
+        log.warning("[URN] WARNING — failed to write 'Fusion Document URN' field.")
+        return
+    log.info("[URN] 'Fusion Document URN' written successfully.")
     try:
-        with open(config.PROJECTS_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except json.JSONDecodeError as exc:
-        futil.log(f"{CMD_NAME}: _load_list_id_for_project — JSON parse error: {exc}")
-        return ""
-    except OSError as exc:
-        futil.log(f"{CMD_NAME}: _load_list_id_for_project — file read error: {exc}")
-        return ""
-
-    project_entry = data.get("projects", {}).get(project_urn, {})
-    list_id = project_entry.get("clickup_list_id", "").strip()
-    if not list_id:
-        futil.log(
-            f"{CMD_NAME}: _load_list_id_for_project — 'clickup_list_id' missing or empty for URN '{project_urn}'."
-        )
-    return list_id
+        cutil.get_task_mirror(list_id).record_custom_field(task_id, urn_field_id, doc_urn)
+    except Exception as exc:
+        log.warning("[URN] mirror update failed (non-fatal): %s", exc)
 
 
 def _date_to_unix_ms(date_str: str):
@@ -783,183 +751,152 @@ def _build_open_on_desktop_url(doc) -> str:
 
 
 def _get_url_custom_field_id(list_id: str, api_token: str) -> str:
-    """Query the ClickUp list for its custom fields and return the ID of the
-    field named ``'Fusion Design'`` with type ``'url'``.
+    """Return the ID of the list's custom field named ``'Fusion Design'`` with type ``'url'``.
 
+    Served from the shared list-metadata cache, which holds the single
+    GET /api/v2/list/{list_id}/field response used for every field lookup.
     Returns an empty string when the field is not found or if the request fails.
-
-    API reference: GET /api/v2/list/{list_id}/field
     """
-    futil.log(f"{CMD_NAME}: _get_url_custom_field_id — querying list '{list_id}'")
-
     TARGET_NAME = "Fusion Design"
     TARGET_TYPE = "url"
 
-    fields_url = f"{CLICKUP_API_BASE}/list/{list_id}/field"
+    field_id = cutil.find_custom_field_id(list_id, api_token, TARGET_NAME, TARGET_TYPE)
+    if field_id:
+        log.info(
+            "_get_url_custom_field_id — found '%s' (url) id='%s'", TARGET_NAME, field_id
+        )
+    else:
+        log.info(
+            "_get_url_custom_field_id — '%s' (url) field not found on list '%s'. Add "
+            "a URL custom field named '%s' in ClickUp.",
+            TARGET_NAME,
+            list_id,
+            TARGET_NAME,
+        )
+    return field_id
+
+
+def _await_thumbnail(future, on_ready, deadline: float = None) -> None:
+    """Call ``on_ready(png_bytes)`` once a DataFile.thumbnail download has finished.
 
+    *future* is the DataObjectFuture from DataFile.thumbnail, normally started
+    when the dialog opened. While it is still running the check is re-queued
+    with cutil.call_later_on_main_thread rather than sleeping, so Fusion stays
+    responsive; the wait gives up after THUMBNAIL_MAX_WAIT_SECONDS. Main
+    thread only. Failures are logged — the thumbnail is best-effort.
+    """
+    if future is None:
+        log.info("[Thumbnail] no thumbnail download was started — skipping.")
+        return
+    if deadline is None:
+        deadline = time.monotonic() + THUMBNAIL_MAX_WAIT_SECONDS
     try:
-        req = adsk.core.HttpRequest.create(fields_url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
+        try:
+            running = future.state == adsk.core.FutureStates.RunningFutureState
+        except AttributeError:
+            # FutureStates enum path differs — treat as done
+            running = False
+
+        if running:
+            if time.monotonic() < deadline:
+                cutil.call_later_on_main_thread(
+                    THUMBNAIL_POLL_SECONDS,
+                    lambda: _await_thumbnail(future, on_ready, deadline),
+                    name=f"{CMD_NAME} thumbnail wait",
+                )
+            else:
+                log.info(
+                    "[Thumbnail] download still running after %.0f s — skipping.",
+                    THUMBNAIL_MAX_WAIT_SECONDS,
+                )
+            return
 
-        response = req.executeSync()
-        status = response.statusCode
-        futil.log(f"{CMD_NAME}: _get_url_custom_field_id — status {status}")
+        png = _thumbnail_bytes(future.dataObject)
+        if png:
+            log.info("[Thumbnail] thumbnail ready (%s bytes).", len(png))
+            on_ready(png)
+    except Exception as exc:
+        log.warning("[Thumbnail] Exception — %s", exc)
 
-        if not (200 <= status < 300):
-            futil.log(
-                f"{CMD_NAME}: _get_url_custom_field_id — non-2xx response: {response.data}",
-            )
-            return ""
-
-        fields_data = json.loads(response.data)
-        all_fields = fields_data.get("fields", [])
-
-        # Log all field types to help diagnose mismatches
-        for f in all_fields:
-            futil.log(f"{CMD_NAME}:   field '{f.get('name')}' type='{f.get('type')}'")
-
-        # Find the field named "Fusion Design" with type "url"
-        matched = next(
-            (
-                f
-                for f in all_fields
-                if f.get("name") == TARGET_NAME and f.get("type") == TARGET_TYPE
-            ),
-            None,
-        )
 
-        if matched:
-            field_id = matched.get("id", "")
-            futil.log(
-                f"{CMD_NAME}: _get_url_custom_field_id — found '{TARGET_NAME}' (url) id='{field_id}'",
-            )
-            return field_id
+def _thumbnail_bytes(data_obj) -> bytes:
+    """Return a DataObject's PNG bytes in memory, or None if there is no thumbnail.
 
-        futil.log(
-            f"{CMD_NAME}: _get_url_custom_field_id — '{TARGET_NAME}' (url) field not found on "
-            f"list '{list_id}'. Add a URL custom field named '{TARGET_NAME}' in ClickUp.",
+    DataObject.getAsArray hands the bytes over directly. Builds without it
+    fall back to saveToFile and a single read of the temp file.
+    """
+    if data_obj is None:
+        log.info(
+            "[Thumbnail] dataObject is None — no thumbnail available for this document."
         )
-        return ""
+        return None
 
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _get_url_custom_field_id — exception: {exc}")
-        return ""
+    get_as_array = getattr(data_obj, "getAsArray", None)
+    if get_as_array is not None:
+        return bytes(get_as_array())
+
+    tmp_path = os.path.join(tempfile.gettempdir(), f"fpp_thumb_{os.getpid()}_{id(data_obj)}.png")
+    try:
+        if not data_obj.saveToFile(tmp_path):
+            log.info("[Thumbnail] saveToFile returned False — skipping.")
+            return None
+        with open(tmp_path, "rb") as fh:
+            return fh.read()
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
-def _attach_thumbnail_to_task(task_id: str, data_file, api_token: str) -> None:
-    """Download the DataFile thumbnail and upload it to the ClickUp task as an attachment.
+def _cache_and_upload_thumbnail(
+    task_id: str, file_name: str, png: bytes, file_id: str, version, api_token: str
+) -> None:
+    """Worker thread: cache *png* for this document version and attach it to the new task."""
+    cutil.store_thumbnail(file_id, version, png)
+    _upload_thumbnail(task_id, file_name, png, api_token)
 
-    Uses DataFile.thumbnail to start an async download (returns a DataObjectFuture),
-    polls until the 256×256 PNG is ready, saves it to a temp file, then POSTs it
-    to the ClickUp attachment endpoint as multipart/form-data.
 
-    Uses http.client.HTTPSConnection (instead of adsk.core.HttpRequest) so the
-    body is sent as raw bytes — adsk.core.HttpRequest.data is a string and would
-    re-encode the binary PNG as UTF-8, corrupting byte values above 0x7F.
+def _upload_thumbnail(task_id: str, file_name: str, image_bytes: bytes, api_token: str) -> bool:
+    """Upload PNG bytes to the ClickUp task as an attachment (worker-thread safe).
 
-    All failures are logged but do not raise — thumbnail attachment is best-effort.
+    The multipart/form-data body is streamed from the image buffer by
+    cutil.MultipartBody, so the PNG is neither re-encoded nor copied into a
+    second buffer. Returns True on success. All failures are logged but do
+    not raise — thumbnail attachment is best-effort.
 
     ClickUp API: POST /api/v2/task/{task_id}/attachment
     """
-    futil.log(f"{CMD_NAME}: [Thumbnail] Starting thumbnail fetch for task '{task_id}'.")
-    tmp_path = None
     try:
-        # 1. Start async thumbnail download
-        future = data_file.thumbnail
-        if future is None:
-            futil.log(f"{CMD_NAME}: [Thumbnail] data_file.thumbnail returned None — skipping.")
-            return
-
-        # 2. Poll until the download leaves the running state (max 10 s)
-        MAX_WAIT = 10.0
-        POLL_INTERVAL = 0.1
-        start_time = time.time()
-        while time.time() - start_time < MAX_WAIT:
-            try:
-                if future.state != adsk.core.FutureStates.RunningFutureState:
-                    break
-            except AttributeError:
-                # FutureStates enum path differs — treat as done
-                break
-            time.sleep(POLL_INTERVAL)
-
-        futil.log(f"{CMD_NAME}: [Thumbnail] Wait ended after {time.time() - start_time:.1f}s (state={future.state}).")
-
-        data_obj = future.dataObject
-        if data_obj is None:
-            futil.log(
-                f"{CMD_NAME}: [Thumbnail] dataObject is None — "
-                "no thumbnail available for this document."
-            )
-            return
-
-        # 3. Save PNG to a temp file
-        tmp_path = os.path.join(
-            tempfile.gettempdir(), f"fpp_thumb_{task_id}.png"
-        )
-        if not data_obj.saveToFile(tmp_path):
-            futil.log(f"{CMD_NAME}: [Thumbnail] saveToFile returned False — skipping.")
-            return
-
-        futil.log(f"{CMD_NAME}: [Thumbnail] Thumbnail saved to '{tmp_path}' ({os.path.getsize(tmp_path)} bytes).")
-
-        # 4. Read the PNG bytes
-        with open(tmp_path, "rb") as fh:
-            image_bytes = fh.read()
-
-        # 5. Build multipart/form-data body as bytes (preserves all 256 byte values)
-        boundary = b"----FusionAddInBoundary3c1f9e"
-        safe_name = (data_file.name.replace(" ", "_") + "_thumbnail.png").encode("utf-8")
-
-        body = (
-            b"--" + boundary + b"\r\n"
-            b'Content-Disposition: form-data; name="attachment"; filename="' + safe_name + b'"\r\n'
-            b"Content-Type: image/png\r\n"
-            b"\r\n"
-            + image_bytes
-            + b"\r\n--" + boundary + b"--\r\n"
-        )
-
-        content_type = f"multipart/form-data; boundary={boundary.decode('ascii')}"
+        body = cutil.MultipartBody()
+        body.add_file("attachment", file_name, image_bytes, "image/png")
 
-        # 6. POST via http.client so the body is sent as raw bytes
-        #    (adsk.core.HttpRequest.data is a string and would corrupt binary data)
-        conn = http.client.HTTPSConnection("api.clickup.com", timeout=30)
-        conn.request(
+        response = cutil.clickup_request(
             "POST",
-            f"/api/v2/task/{task_id}/attachment",
+            f"/task/{task_id}/attachment",
+            api_token,
             body=body,
-            headers={
-                "Authorization": api_token,
-                "Content-Type": content_type,
-                "Accept": "application/json",
-                "Content-Length": str(len(body)),
-            },
+            content_type=body.content_type,
+            priority=cutil.PRIORITY_BACKGROUND,
         )
-        resp = conn.getresponse()
-        status = resp.status
-        resp_body = resp.read().decode("utf-8", errors="replace")
-        conn.close()
-
-        futil.log(f"{CMD_NAME}: [Thumbnail] Attachment upload — HTTP {status}")
-        if 200 <= status < 300:
-            futil.log(f"{CMD_NAME}: [Thumbnail] Thumbnail attached successfully.")
-        else:
-            futil.log(f"{CMD_NAME}: [Thumbnail] Upload failed: {resp_body}")
+
+        log.info("[Thumbnail] Attachment upload — HTTP %s", response.status_code)
+        if response.ok:
+            log.info("[Thumbnail] Thumbnail attached successfully.")
+            return True
+        log.warning("[Thumbnail] Upload failed: %s", response.data)
 
     except Exception as exc:
-        futil.log(f"{CMD_NAME}: [Thumbnail] Exception — {exc}")
-    finally:
-        if tmp_path:
-            try:
-                os.remove(tmp_path)
-            except Exception:
-                pass
+        log.warning("[Thumbnail] Exception — %s", exc)
+    return False
 
 
 def _set_task_custom_field(
-    task_id: str, field_id: str, value: str, api_token: str
+    task_id: str,
+    field_id: str,
+    value: str,
+    api_token: str,
+    priority: int = cutil.PRIORITY_INTERACTIVE,
 ) -> bool:
     """Set a custom field value on an existing task via the dedicated ClickUp endpoint.
 
@@ -972,118 +909,67 @@ def _set_task_custom_field(
 
     Returns ``True`` on success, ``False`` otherwise.
     """
-    futil.log(
-        f"{CMD_NAME}: _set_task_custom_field — task='{task_id}' field='{field_id}' "
-        f"value='{value[:80]}{'...' if len(value) > 80 else ''}'"
+    log.info(
+        "_set_task_custom_field — task='%s' field='%s' value='%s%s'",
+        task_id,
+        field_id,
+        value[:80],
+        "..." if len(value) > 80 else "",
     )
 
-    url = f"{CLICKUP_API_BASE}/task/{task_id}/field/{field_id}"
-    body = json.dumps({"value": value})
-
     try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.PostMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Content-Type", "application/json")
-        req.setHeader("Accept", "application/json")
-        req.data = body
-
-        response = req.executeSync()
-        status = response.statusCode
-        futil.log(f"{CMD_NAME}: _set_task_custom_field — status {status}")
+        response = cutil.clickup_request(
+            "POST",
+            f"/task/{task_id}/field/{field_id}",
+            api_token,
+            json_body={"value": value},
+            priority=priority,
+        )
+        status = response.status_code
+        log.info("_set_task_custom_field — status %s", status)
 
-        if 200 <= status < 300:
+        if response.ok:
             return True
 
-        futil.log(f"{CMD_NAME}: _set_task_custom_field — FAILED: {response.data}")
+        log.error("_set_task_custom_field — FAILED: %s", response.data)
         return False
 
     except Exception as exc:
-        futil.log(f"{CMD_NAME}: _set_task_custom_field — exception: {exc}")
+        log.warning("_set_task_custom_field — exception: %s", exc)
         return False
 
 
 def _get_urn_custom_field_id(list_id: str, api_token: str) -> str:
-    """Query the ClickUp list for its custom fields and return the ID of the
-    field named ``'Fusion Document URN'``.
+    """Return the ID of the list's custom field named ``'Fusion Document URN'``.
 
     Matches any field type so the ClickUp field can be ``short_text``, ``text``, etc.
-    Returns an empty string when the field is not found or if the request fails.
-
-    API reference: GET /api/v2/list/{list_id}/field
+    Served from the shared list-metadata cache (same /field response as
+    ``_get_url_custom_field_id``). Returns an empty string when the field is not found.
     """
-    futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — querying list '{list_id}'")
-
     TARGET_NAME = "Fusion Document URN"
 
-    fields_url = f"{CLICKUP_API_BASE}/list/{list_id}/field"
-
-    try:
-        req = adsk.core.HttpRequest.create(fields_url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-
-        response = req.executeSync()
-        status = response.statusCode
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — status {status}")
-
-        if not (200 <= status < 300):
-            futil.log(
-                f"{CMD_NAME}: _get_urn_custom_field_id — non-2xx response: {response.data}",
-            )
-            return ""
-
-        fields_data = json.loads(response.data)
-        all_fields = fields_data.get("fields", [])
-
-        matched = next(
-            (f for f in all_fields if f.get("name") == TARGET_NAME),
-            None,
+    field_id = cutil.find_custom_field_id(list_id, api_token, TARGET_NAME)
+    if field_id:
+        log.info("_get_urn_custom_field_id — found '%s' id='%s'", TARGET_NAME, field_id)
+    else:
+        log.info(
+            "_get_urn_custom_field_id — '%s' field not found on list '%s'. Add a text "
+            "custom field named '%s' in ClickUp.",
+            TARGET_NAME,
+            list_id,
+            TARGET_NAME,
         )
-
-        if matched:
-            field_id = matched.get("id", "")
-            futil.log(
-                f"{CMD_NAME}: _get_urn_custom_field_id — found '{TARGET_NAME}' "
-                f"(type='{matched.get('type')}') id='{field_id}'",
-            )
-            return field_id
-
-        futil.log(
-            f"{CMD_NAME}: _get_urn_custom_field_id — '{TARGET_NAME}' field not found on "
-            f"list '{list_id}'. Add a text custom field named '{TARGET_NAME}' in ClickUp.",
-        )
-        return ""
-
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — exception: {exc}")
-        return ""
+    return field_id
 
 
-def _load_tinyurl_token() -> str:
-    """Read the TinyURL API token from cache/auth.json.
+def _get_short_url(long_url: str, tinyurl_token: str) -> str:
+    """Return the short URL for ``long_url`` from the disk memo, shortening it on a miss.
 
-    Expected key: ``"tinyurl_api_token"``.
-    Returns an empty string if the file is missing, malformed, or the key is absent.
+    Returns ``None`` when the memo has no entry and shortening fails.
     """
-    futil.log(f"{CMD_NAME}: _load_tinyurl_token — reading '{AUTH_JSON_PATH}'")
-
-    if not os.path.isfile(AUTH_JSON_PATH):
-        futil.log(f"{CMD_NAME}: _load_tinyurl_token — auth.json not found.")
-        return ""
-
-    try:
-        with open(AUTH_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError) as exc:
-        futil.log(f"{CMD_NAME}: _load_tinyurl_token — read error: {exc}")
-        return ""
-
-    token = data.get("tinyurl_api_token", "").strip()
-    if not token:
-        futil.log(
-            f"{CMD_NAME}: _load_tinyurl_token — 'tinyurl_api_token' missing or empty."
-        )
-    return token
+    return cutil.memoized_short_url(
+        long_url, lambda url: _shorten_url(url, tinyurl_token)
+    )
 
 
 def _shorten_url(long_url: str, tinyurl_token: str) -> str:
@@ -1098,50 +984,51 @@ def _shorten_url(long_url: str, tinyurl_token: str) -> str:
     response, or missing ``tiny_url`` in the response body). The caller is
     responsible for deciding whether to skip the field in that case.
     """
-    futil.log(f"{CMD_NAME}: _shorten_url — shortening via TinyURL API")
-    futil.log(f"{CMD_NAME}: _shorten_url — long_url='{long_url}'")
-    futil.log(
-        f"{CMD_NAME}: _shorten_url — token prefix='{tinyurl_token[:8]}...' (len={len(tinyurl_token)})"
+    log.info("_shorten_url — shortening via TinyURL API")
+    log.debug("_shorten_url — long_url='%s'", long_url)
+    log.debug(
+        "_shorten_url — token prefix='%s...' (len=%s)",
+        tinyurl_token[:8],
+        len(tinyurl_token),
     )
 
-    TINYURL_API_BASE = "https://api.tinyurl.com"
     endpoint = f"{TINYURL_API_BASE}/create"
-    body = json.dumps({"url": long_url, "domain": "tinyurl.com"})
+    body = {"url": long_url, "domain": "tinyurl.com"}
 
-    futil.log(f"{CMD_NAME}: _shorten_url — endpoint='{endpoint}'")
-    futil.log(f"{CMD_NAME}: _shorten_url — request body={body}")
+    log.debug("_shorten_url — endpoint='%s'", endpoint)
+    log.debug("_shorten_url — request body=%s", body)
 
     try:
-        req = adsk.core.HttpRequest.create(endpoint, adsk.core.HttpMethods.PostMethod)
-        req.setHeader("Authorization", f"Bearer {tinyurl_token}")
-        req.setHeader("Content-Type", "application/json")
-        req.setHeader("Accept", "application/json")
-        req.data = body
-
-        futil.log(f"{CMD_NAME}: _shorten_url — executing request...")
-        response = req.executeSync()
-        status = response.statusCode
+        log.info("_shorten_url — executing request...")
+        response = cutil.http_request(
+            "POST",
+            endpoint,
+            headers={"Authorization": f"Bearer {tinyurl_token}"},
+            json_body=body,
+        )
+        status = response.status_code
         raw_response = response.data
-        futil.log(f"{CMD_NAME}: _shorten_url — status={status}")
-        futil.log(f"{CMD_NAME}: _shorten_url — raw response={raw_response}")
+        log.info("_shorten_url — status=%s", status)
+        log.debug("_shorten_url — raw response=%s", raw_response)
 
-        if 200 <= status < 300:
-            resp_data = json.loads(raw_response)
+        if response.ok:
+            resp_data = response.json()
             short_url = resp_data.get("data", {}).get("tiny_url", "")
             if short_url:
-                futil.log(
-                    f"{CMD_NAME}: _shorten_url — SUCCESS: short_url='{short_url}'"
-                )
+                log.info("_shorten_url — SUCCESS: short_url='%s'", short_url)
                 return short_url
-            futil.log(
-                f"{CMD_NAME}: _shorten_url — 'tiny_url' key missing in response data. Returning None."
+            log.info(
+                "_shorten_url — 'tiny_url' key missing in response data. "
+                "Returning None.",
             )
         else:
-            futil.log(
-                f"{CMD_NAME}: _shorten_url — FAILED: non-2xx status={status} body={raw_response}. Returning None."
+            log.error(
+                "_shorten_url — FAILED: non-2xx status=%s body=%s. Returning None.",
+                status,
+                raw_response,
             )
 
     except Exception as exc:
-        futil.log(f"{CMD_NAME}: _shorten_url — EXCEPTION: {exc}. Returning None.")
+        log.warning("_shorten_url — EXCEPTION: %s. Returning None.", exc)
 
     return None
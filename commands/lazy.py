@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Deferred import of a command's implementation.
+
+Each command package's __init__ holds only what add-in start needs — the
+command identity, start() and stop() — and forwards its event handlers to
+entry.py through a LazyEntry. entry.py (the dialog, its network code and
+clickupUtils with http.client/ssl/sqlite3) is therefore imported the first
+time the user runs the command instead of while Fusion is starting up.
+"""
+
+import importlib
+
+from ..lib import fusionAddInUtils as futil
+
+
+class LazyEntry:
+    """The `entry` module of *package*, imported on first access."""
+
+    def __init__(self, package: str, cmd_name: str):
+        self._package = package
+        self._cmd_name = cmd_name
+        self._module = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    @property
+    def module(self):
+        if self._module is None:
+            with futil.perf_timer("import entry", self._cmd_name):
+                self._module = importlib.import_module(".entry", self._package)
+        return self._module
@@ -1,4 +1,58 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2022-2026 IMA LLC
 
-# listTasks command package
+import adsk.core
+import os
+from ...lib import fusionAddInUtils as futil
+from ... import config
+from ..lazy import LazyEntry
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+# Command identity information
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_listTasks"
+CMD_NAME = "List Tasks"
+CMD_Description = "List ClickUp tasks linked to the current Fusion document"
+
+IS_PROMOTED = True
+WORKSPACE_ID = config.design_workspace
+TAB_ID = config.tools_tab_id
+TAB_NAME = config.my_tab_name
+
+PANEL_ID = config.clickup_panel_id
+PANEL_NAME = config.clickup_panel_name
+PANEL_AFTER = config.clickup_panel_after
+
+# Dedicated listTasks icons (clipboard body + three blue report lines)
+ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
+
+
+# The implementation lives in entry.py and is imported the first time the
+# command runs, so add-in start only pays for the button (see commands/lazy.py).
+_entry = LazyEntry(__name__, CMD_NAME)
+
+
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    _entry.module.command_created(args)
+
+
+def start():
+    """Executed when add-in is run."""
+    cmd_def = ui.commandDefinitions.addButtonDefinition(
+        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
+    )
+    futil.add_handler(cmd_def.commandCreated, command_created)
+
+    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
+    if panel:
+        control = panel.controls.addCommand(cmd_def, "", False)
+        control.isPromoted = IS_PROMOTED
+
+
+def stop():
+    """Executed when add-in is stopped."""
+    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+    if command_definition:
+        command_definition.deleteMe()
@@ -3,97 +3,78 @@
 
 import adsk.core
 import adsk.fusion
-import json
 import os
-import webbrowser
-from urllib.parse import quote
+import time
 
 from ...lib import fusionAddInUtils as futil
+from ...lib import clickupUtils as cutil
 from ... import config
+from ..table_pager import TablePager
+from . import CMD_ID, CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
-
-# Command identity information
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_listTasks"
-CMD_NAME = "List Tasks"
-CMD_Description = "List ClickUp tasks linked to the current Fusion document"
-
-IS_PROMOTED = True
-WORKSPACE_ID = config.design_workspace
-TAB_ID = config.tools_tab_id
-TAB_NAME = config.my_tab_name
-
-PANEL_ID = config.clickup_panel_id
-PANEL_NAME = config.clickup_panel_name
-PANEL_AFTER = config.clickup_panel_after
-
-# Dedicated listTasks icons (clipboard body + three blue report lines)
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
-
-# ClickUp API configuration
-CLICKUP_API_BASE = "https://api.clickup.com/api/v2"
+log = cutil.get_logger(CMD_NAME)
 
 CACHE_DIR = config.CACHE_DIR
 AUTH_JSON_PATH = os.path.join(CACHE_DIR, "auth.json")
-PROJECTS_JSON_PATH = os.path.join(CACHE_DIR, "projects.json")
+PROJECTS_DB_PATH = config.PROJECTS_DB_PATH
 
 # Priority constants
-_PRIORITY_SORT_KEY = {1: 0, 2: 1, 3: 2, 4: 3}
 _PRIORITY_OPTIONS = ["Urgent", "High", "Normal", "Low"]
 _PRIORITY_LABEL_TO_INT = {"Urgent": 1, "High": 2, "Normal": 3, "Low": 4}
 _PRIORITY_INT_TO_LABEL = {v: k for k, v in _PRIORITY_LABEL_TO_INT.items()}
 
+URN_FIELD_NAME = "Fusion Document URN"
+
 local_handlers = []
 
 # Module-level state shared between command_created and command_execute
+_list_id: str = ""
 _list_url: str = ""
 _api_token: str = ""
-_list_statuses: list = []  # [{"status": str, "color": str, ...}, ...] from ClickUp API
+_list_lookup = cutil.ListLookup()  # the list's statuses, indexed once per snapshot / refresh
 _task_originals: dict = (
     {}
-)  # "{id_prefix}_{task_id}" → {"status": str, "priority": int|None, "description": str, "time_estimate_ms": int|None}
-
-
-def start():
-    """Executed when add-in is run."""
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
-    if panel:
-        control = panel.controls.addCommand(cmd_def, "", False)
-        control.isPromoted = IS_PROMOTED
-
-
-def stop():
-    """Executed when add-in is stopped."""
-    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
+)  # "{id_prefix}_{task_id}" → {"name": str, "status": str, "priority": int|None, "description": str, "time_estimate_ms": int|None}
+_task_rows: dict = {}  # "{id_prefix}_{task_id}" → {"id", "name", "url"} for drawing a row
+_task_values: dict = {}  # "{id_prefix}_{task_id}" → {"priority": int|None, "status": str}, edits included
+_pagers: dict = {}  # id_prefix → TablePager of that table
+_doc_urn: str = ""
+_synced_at: float = 0.0  # epoch of the mirror sync the rows were drawn from
+_command_inputs = None  # live dialog inputs while the dialog is open
+_rendered_signature: tuple = ()  # what the tables' visible rows show, see _render_signature
 
 
+@cutil.traced(CMD_NAME, begin=True)
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     """Builds the task-list dialog."""
-    global _list_url, _api_token, _list_statuses, _task_originals
+    global _list_id, _list_url, _api_token, _list_lookup, _task_originals
+    global _task_rows, _task_values, _pagers
+    global _doc_urn, _synced_at, _command_inputs, _rendered_signature
+    _list_id = ""
     _list_url = ""
     _api_token = ""
-    _list_statuses = []
+    _list_lookup = cutil.ListLookup()
     _task_originals = {}
+    _task_rows = {}
+    _task_values = {}
+    _pagers = {}
+    _doc_urn = ""
+    _synced_at = 0.0
+    _command_inputs = None
+    _rendered_signature = ()
 
-    futil.log(f"{CMD_NAME}: Command Created — building task list dialog.")
+    log.info("Command Created — building task list dialog.")
 
     # ------------------------------------------------------------------ #
-    # Pre-flight: require auth.json and projects.json                     #
+    # Pre-flight: require auth.json and a project mapping                 #
     # ------------------------------------------------------------------ #
     missing = []
     if not os.path.isfile(AUTH_JSON_PATH):
         missing.append(f"  • {AUTH_JSON_PATH}")
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        missing.append(f"  • {PROJECTS_JSON_PATH}")
+    if not cutil.project_mappings_exist():
+        missing.append(f"  • {PROJECTS_DB_PATH}")
 
     if missing:
         ui.messageBox(
@@ -131,9 +112,9 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    futil.log(f"{CMD_NAME}: project_urn='{project_urn}' doc_urn='{doc_urn}'")
+    log.info("project_urn='%s' doc_urn='%s'", project_urn, doc_urn)
 
-    list_id = _load_list_id_for_project(project_urn)
+    list_id = cutil.get_list_id_for_project(project_urn)
     if not list_id:
         ui.messageBox(
             "No ClickUp list ID configured for this project.\n\n"
@@ -143,10 +124,11 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    _list_url = _load_clickup_url_for_project(project_urn)
-    futil.log(f"{CMD_NAME}: list_id='{list_id}'  list_url='{_list_url}'")
+    _list_id = list_id
+    _list_url = cutil.get_clickup_url_for_project(project_urn)
+    log.info("list_id='%s'  list_url='%s'", list_id, _list_url)
 
-    _api_token = _load_api_token()
+    _api_token = cutil.get_clickup_api_token()
     if not _api_token:
         ui.messageBox(
             f"ClickUp API token not found.\n\nPlease run 'Set Tokens'.",
@@ -155,56 +137,24 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    # Fetch available statuses for the list (populates the status dropdowns)
-    _list_statuses = _fetch_list_statuses(list_id, _api_token)
-    futil.log(
-        f"{CMD_NAME}: fetched {len(_list_statuses)} status(es) for list '{list_id}'."
-    )
-
     # ------------------------------------------------------------------ #
-    # Fetch tasks filtered by the Fusion Document URN custom field        #
+    # Draw from the last known snapshot of the list, then revalidate     #
+    # against ClickUp in the background (stale-while-revalidate).        #
     # ------------------------------------------------------------------ #
-    urn_field_id = _get_urn_custom_field_id(list_id, _api_token)
-    if not urn_field_id:
-        ui.messageBox(
-            "The 'Fusion Document URN' custom field was not found on this ClickUp list.\n\n"
-            "Add a text custom field named 'Fusion Document URN' to your ClickUp list,\n"
-            "then create tasks with 'Add Task' to populate it.",
-            "Custom Field Missing",
-        )
-        args.command.isAutoExecute = True
-        return
-
-    # Fetch both task sets
-    doc_tasks_raw = _fetch_tasks_for_urn(list_id, urn_field_id, doc_urn, _api_token)
-    all_tasks = _fetch_all_tasks(list_id, _api_token)
-
-    # The ClickUp API text-field filter can return partial/fuzzy matches.
-    # Apply a strict client-side exact-match on the custom field value.
-    def _urn_matches(task: dict) -> bool:
-        for cf in task.get("custom_fields", []):
-            if cf.get("id") == urn_field_id:
-                return cf.get("value", "") == doc_urn
-        return False
-
-    doc_tasks = [t for t in doc_tasks_raw if _urn_matches(t)]
-    doc_task_ids = {t.get("id") for t in doc_tasks}
-    all_tasks = [t for t in all_tasks if t.get("id") not in doc_task_ids]
-    futil.log(
-        f"{CMD_NAME}: {len(doc_tasks_raw)} API result(s) → {len(doc_tasks)} "
-        f"exact URN match(es); {len(all_tasks)} remaining project task(s) after exclusion."
+    _doc_urn = doc_urn
+    page_size = config.TASK_TABLE_PAGE_SIZE
+    snapshot = _load_list_snapshot(list_id, doc_urn, page_size)
+    _list_lookup = cutil.ListLookup(snapshot["statuses"])
+    _synced_at = snapshot["synced_at"]
+    doc_tasks = snapshot["doc_tasks"]
+    first_page = snapshot["first_page"]
+    log.info(
+        "snapshot — %s document task(s), %s project task(s), %s status(es).",
+        len(doc_tasks),
+        snapshot["project_count"],
+        len(_list_lookup.statuses),
     )
 
-    def _priority_sort_key(task):
-        raw = task.get("priority") or {}
-        try:
-            return _PRIORITY_SORT_KEY.get(int(raw.get("id", 99)), 99)
-        except (ValueError, TypeError):
-            return 99
-
-    doc_tasks.sort(key=_priority_sort_key)
-    all_tasks.sort(key=_priority_sort_key)
-
     # ------------------------------------------------------------------ #
     # Build dialog inputs                                                 #
     # ------------------------------------------------------------------ #
@@ -224,13 +174,22 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         True,
     )
 
+    # Sync banner: tells the user the rows may be stale until the refresh lands
+    inputs.addTextBoxCommandInput(
+        "sync_status",
+        "",
+        _sync_banner("stale"),
+        1,
+        True,
+    )
+
     # ------------------------------------------------------------------ #
     # Table 1 — tasks linked to this document                            #
     # ------------------------------------------------------------------ #
     inputs.addTextBoxCommandInput(
         "doc_tasks_header",
         "",
-        f"<b>Tasks Linked to This Document</b> ({len(doc_tasks)})",
+        _doc_tasks_header(len(doc_tasks)),
         1,
         True,
     )
@@ -239,8 +198,6 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         doc_tasks,
         table_id="doc_tasks_table",
         id_prefix="doc",
-        status_options=_list_statuses,
-        task_originals=_task_originals,
     )
 
     # ------------------------------------------------------------------ #
@@ -249,48 +206,263 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     inputs.addTextBoxCommandInput(
         "all_tasks_header",
         "",
-        f"<b>Project Tasks</b> ({len(all_tasks)})",
+        _all_tasks_header(snapshot["project_count"]),
         1,
         True,
     )
+    # Only the first page for now; the refresh brings the rest of the rows
     _build_task_table(
         inputs,
-        all_tasks,
+        first_page,
         table_id="all_tasks_table",
         id_prefix="all",
-        status_options=_list_statuses,
-        task_originals=_task_originals,
     )
 
+    _rendered_signature = _render_signature(_list_lookup.statuses, doc_tasks, first_page)
+    _command_inputs = inputs
+
     # Connect events
     futil.add_handler(
         args.command.execute, command_execute, local_handlers=local_handlers
     )
+    futil.add_handler(
+        args.command.inputChanged,
+        command_input_changed,
+        local_handlers=local_handlers,
+    )
     futil.add_handler(
         args.command.destroy, command_destroy, local_handlers=local_handlers
     )
 
+    # Revalidate: statuses, URN field id, a mirror sync and the full row
+    # model are built off the UI thread; _on_list_data installs the rows and
+    # redraws only if the visible ones changed.
+    cutil.submit_background(
+        _fetch_list_data,
+        list_id,
+        _api_token,
+        doc_urn,
+        _rendered_signature,
+        page_size,
+        on_done=_on_list_data,
+        on_error=_on_list_data_failed,
+        owner=CMD_ID,
+        name=f"{CMD_NAME} refresh",
+    )
+
+
+def _load_list_snapshot(list_id: str, doc_urn: str, page_size: int) -> dict:
+    """Return what the dialog draws before the refresh — no network, no full mirror read.
+
+    The document's tasks come through the mirror's URN index and the
+    project table gets its first *page_size* rows only, so opening the
+    dialog costs the same for any list size.
+    """
+    mirror = cutil.get_task_mirror(list_id)
+    urn_field_id = cutil.peek_custom_field_id(list_id, URN_FIELD_NAME)
+    doc_tasks = mirror.tasks_with_field_value(urn_field_id, doc_urn) if urn_field_id else []
+    doc_tasks.sort(key=cutil.priority_order)
+    return {
+        "statuses": cutil.peek_list_metadata(list_id, "statuses") or [],
+        "doc_tasks": doc_tasks,
+        "first_page": mirror.tasks_by_priority(page_size, urn_field_id, doc_urn),
+        "project_count": mirror.count() - len(doc_tasks),
+        "synced_at": mirror.last_synced(),
+    }
+
+
+def _fetch_list_data(
+    list_id: str, api_token: str, doc_urn: str, rendered_signature: tuple, page_size: int
+) -> dict:
+    """Worker thread: revalidate list metadata, sync the task mirror and build the row model.
+
+    Loads and splits the whole list here rather than on the UI thread, and
+    compares what the first page would now show with *rendered_signature*.
+    Raises when the mirror sync fails so _on_list_data_failed can keep the
+    snapshot on screen.
+    """
+    statuses = _fetch_list_statuses(list_id, api_token)
+    urn_field_id = _get_urn_custom_field_id(list_id, api_token)
+    mirror = cutil.get_task_mirror(list_id)
+    mirror.sync(api_token)
+    doc_tasks, all_tasks = _split_tasks(mirror.all_tasks(), urn_field_id, doc_urn)
+    signature = _render_signature(statuses, doc_tasks, all_tasks[:page_size])
+    return {
+        "statuses": statuses,
+        "urn_field_id": urn_field_id,
+        "synced_at": mirror.last_synced(),
+        "changed": signature != rendered_signature,
+        "signature": signature,
+        "models": {
+            "doc": _task_row_model(doc_tasks, "doc"),
+            "all": _task_row_model(all_tasks, "all"),
+        },
+    }
+
+
+def _on_list_data(data: dict) -> None:
+    """Main thread: the full list arrived — install its rows, redrawing only if the visible ones changed."""
+    global _list_lookup, _synced_at, _rendered_signature
+    inputs = _command_inputs
+    if inputs is None:
+        return
+    _synced_at = data["synced_at"]
+
+    if not data["urn_field_id"]:
+        _set_sync_status(inputs, _sync_banner("failed"))
+        ui.messageBox(
+            "The 'Fusion Document URN' custom field was not found on this ClickUp list.\n\n"
+            "Add a text custom field named 'Fusion Document URN' to your ClickUp list,\n"
+            "then create tasks with 'Add Task' to populate it.",
+            "Custom Field Missing",
+        )
+        return
+
+    models = data["models"]
+    if data["changed"]:
+        log.info(
+            "refresh changed the list — redrawing %s + %s row(s).",
+            len(models["doc"]["keys"]),
+            len(models["all"]["keys"]),
+        )
+        # Keep whatever the user already changed in the dialog
+        pending = _collect_task_payloads(inputs)
+        _list_lookup = cutil.ListLookup(data["statuses"])
+        _task_originals.clear()
+        for id_prefix, model in models.items():
+            _refill_task_table(inputs, id_prefix, model, pending)
+        _rendered_signature = data["signature"]
+    else:
+        log.info(
+            "refresh found no visible changes — %s project row(s) loaded.",
+            len(models["all"]["keys"]),
+        )
+        # The drawn rows (and any edits in them) stay; the rest join the pager
+        for id_prefix, model in models.items():
+            _install_row_model(id_prefix, model, keep_existing=True)
+            pager = _pagers.get(id_prefix)
+            if pager is not None:
+                pager.set_rows(inputs, model["keys"], redraw=False)
+    _set_text(inputs, "doc_tasks_header", _doc_tasks_header(len(models["doc"]["keys"])))
+    _set_text(inputs, "all_tasks_header", _all_tasks_header(len(models["all"]["keys"])))
+    _set_sync_status(inputs, _sync_banner("fresh"))
+
+
+def _on_list_data_failed(exc: Exception) -> None:
+    """Main thread: the refresh failed — keep the snapshot and say so."""
+    log.warning("background refresh failed: %s", exc)
+    if _command_inputs is not None:
+        _set_sync_status(_command_inputs, _sync_banner("failed"))
+
+
+def _split_tasks(tasks: list, urn_field_id: str, doc_urn: str) -> tuple:
+    """Split *tasks* into (linked to this document, everything else), priority-sorted.
+
+    The ClickUp text-field filter can return fuzzy matches, so the exact URN
+    match is done locally over the one mirrored copy of the list. The order
+    matches TaskMirror.tasks_by_priority for the same tasks.
+    """
+    doc_tasks, all_tasks = cutil.partition_tasks_by_custom_field(
+        tasks, urn_field_id, doc_urn
+    )
+    doc_tasks.sort(key=cutil.priority_order)
+    all_tasks.sort(key=cutil.priority_order)
+    return doc_tasks, all_tasks
+
+
+def _render_signature(statuses: list, doc_tasks: list, all_tasks: list) -> tuple:
+    """Everything the tables display; equal signatures mean nothing to redraw."""
+
+    def _row(task):
+        return (
+            task.get("id"),
+            task.get("name"),
+            task.get("url"),
+            (task.get("priority") or {}).get("id"),
+            (task.get("status") or {}).get("status"),
+            task.get("description"),
+            task.get("time_estimate"),
+        )
+
+    return (
+        tuple(s.get("status", "") for s in statuses),
+        tuple(_row(t) for t in doc_tasks),
+        tuple(_row(t) for t in all_tasks),
+    )
+
+
+def _sync_banner(state: str) -> str:
+    """Return the sync_status text for *state*: 'stale', 'fresh' or 'failed'."""
+    if _synced_at:
+        fmt = "%H:%M" if time.time() - _synced_at < 20 * 3600 else "%b %d %H:%M"
+        when = time.strftime(fmt, time.localtime(_synced_at))
+    else:
+        when = ""
+    if state == "fresh":
+        return f"<i>✓ Up to date ({when})</i>"
+    if state == "failed":
+        if when:
+            return f"<i>⚠ Could not refresh from ClickUp — showing saved copy from {when}.</i>"
+        return "<i>⚠ Could not load tasks from ClickUp.</i>"
+    if when:
+        return f"<i>⟳ Showing saved copy from {when} — refreshing…</i>"
+    return "<i>⟳ Loading tasks from ClickUp…</i>"
+
+
+def _doc_tasks_header(count: int) -> str:
+    return f"<b>Tasks Linked to This Document</b> ({count})"
+
+
+def _all_tasks_header(count: int) -> str:
+    return f"<b>Project Tasks</b> ({count})"
+
+
+def _set_text(inputs: adsk.core.CommandInputs, input_id: str, text: str) -> None:
+    text_input = inputs.itemById(input_id)
+    if text_input:
+        text_input.formattedText = text
+
+
+def _set_sync_status(inputs: adsk.core.CommandInputs, text: str) -> None:
+    _set_text(inputs, "sync_status", text)
+
+
+def _refill_task_table(
+    inputs: adsk.core.CommandInputs, id_prefix: str, model: dict, pending: dict
+) -> None:
+    """Replace the rows of an existing table with *model*'s, keep *pending* edits, and redraw."""
+    pager = _pagers.get(id_prefix)
+    if pager is None:
+        return
+    _install_row_model(id_prefix, model)
+    _apply_pending_edits(pending, id_prefix)
+    pager.set_rows(inputs, model["keys"])
+
+
+def _apply_pending_edits(pending: dict, id_prefix: str) -> None:
+    """Carry the user's unsaved priority/status choices over to freshly loaded rows."""
+    for task_id, payload in pending.items():
+        values = _task_values.get(f"{id_prefix}_{task_id}")
+        if values is None:
+            continue
+        if "priority" in payload:
+            values["priority"] = payload["priority"]
+        if "status" in payload:
+            values["status"] = payload["status"]
+
 
 def _build_task_table(
     inputs: adsk.core.CommandInputs,
     tasks: list,
     table_id: str,
     id_prefix: str,
-    status_options: list = None,
-    task_originals: dict = None,
 ) -> adsk.core.TableCommandInput:
-    """Add a Name | Priority | Status table to *inputs* and populate it.
+    """Add a Name | Priority | Status table to *inputs* and show the first page of *tasks*.
 
     *id_prefix* is used to namespace all child input IDs so two tables on
-    the same dialog never share an ID.
-    *status_options* is the list of status dicts fetched from the ClickUp API.
-    If provided, Status is rendered as an editable dropdown; otherwise read-only.
-    *task_originals* dict is populated with "{id_prefix}_{task_id}" → original
-    status string so command_execute can detect and PATCH changes.
+    the same dialog never share an ID. Only the visible page's rows have
+    inputs; the rest live in _task_rows / _task_values (see TablePager).
     """
-    if status_options is None:
-        status_options = []
-
     table = inputs.addTableCommandInput(table_id, "", 3, "5:2:2")
     table.hasGrid = True
     table.minimumVisibleRows = 3
@@ -309,17 +481,47 @@ def _build_task_table(
     table.addCommandInput(inputs.itemById(f"{id_prefix}_h_priority"), 0, 1)
     table.addCommandInput(inputs.itemById(f"{id_prefix}_h_status"), 0, 2)
 
-    if not tasks:
-        empty = inputs.addTextBoxCommandInput(
-            f"{id_prefix}_empty", "", "No tasks found.", 1, True
-        )
-        table.addCommandInput(empty, 1, 0, 0, 3)
-        return table
+    pager = TablePager(table_id, id_prefix, _add_task_row, _read_task_row)
+    _pagers[id_prefix] = pager
+    pager.add_toolbar(inputs)
+    pager.set_rows(inputs, _load_task_rows(tasks, id_prefix))
+    return table
+
 
+def _load_task_rows(tasks: list, id_prefix: str) -> list:
+    """Record *tasks* in the row model and _task_originals; return their row keys in order."""
+    model = _task_row_model(tasks, id_prefix)
+    _install_row_model(id_prefix, model)
+    return model["keys"]
+
+
+def _install_row_model(id_prefix: str, model: dict, keep_existing: bool = False) -> None:
+    """Make *model* (see _task_row_model) the rows of table *id_prefix*.
+
+    With *keep_existing*, rows already in the model keep their current
+    values (and so the user's edits); only new rows are added.
+    """
+    if keep_existing:
+        for key in model["keys"]:
+            if key not in _task_rows:
+                _task_originals[key] = model["originals"][key]
+                _task_rows[key] = model["rows"][key]
+                _task_values[key] = model["values"][key]
+        return
+    for key in [k for k in _task_rows if k.startswith(f"{id_prefix}_")]:
+        del _task_rows[key]
+        _task_values.pop(key, None)
+    _task_originals.update(model["originals"])
+    _task_rows.update(model["rows"])
+    _task_values.update(model["values"])
+
+
+def _task_row_model(tasks: list, id_prefix: str) -> dict:
+    """Return {"keys", "originals", "rows", "values"} for *tasks* — safe on a worker thread."""
+    keys, originals, rows, values = [], {}, {}, {}
     for i, task in enumerate(tasks, start=1):
         tid = task.get("id", f"unknown_{i}")
-        task_name = task.get("name", "(unnamed)")
-        task_url = task.get("url", "")
+        key = f"{id_prefix}_{tid}"
 
         priority_id = None
         raw_priority = task.get("priority")
@@ -337,62 +539,94 @@ def _build_task_table(
             )
         except (ValueError, TypeError):
             time_est_ms = None
-        if task_originals is not None:
-            task_originals[f"{id_prefix}_{tid}"] = {
-                "status": status_str,
-                "priority": priority_id,
-                "description": description_str,
-                "time_estimate_ms": time_est_ms,
-            }
-
-        name_html = f'<a href="{task_url}">{task_name}</a>' if task_url else task_name
-        name_cell = inputs.addTextBoxCommandInput(
-            f"{id_prefix}_name_{i}", "", name_html, 1, True
-        )
+        originals[key] = {
+            "name": task.get("name", "(unnamed)"),
+            "status": status_str,
+            "priority": priority_id,
+            "description": description_str,
+            "time_estimate_ms": time_est_ms,
+        }
+        rows[key] = {
+            "id": tid,
+            "name": task.get("name", "(unnamed)"),
+            "url": task.get("url", ""),
+        }
+        values[key] = {"priority": priority_id, "status": status_str}
+        keys.append(key)
+    return {"keys": keys, "originals": originals, "rows": rows, "values": values}
 
-        # Priority cell — editable dropdown
-        pri_label_plain = _PRIORITY_INT_TO_LABEL.get(priority_id, "Normal")
-        priority_cell = inputs.addDropDownCommandInput(
-            f"{id_prefix}_priority_{tid}",
+
+def _add_task_row(
+    inputs: adsk.core.CommandInputs,
+    table: adsk.core.TableCommandInput,
+    row: int,
+    key: str,
+) -> None:
+    """Build the Name | Priority | Status inputs for row *key* at table row *row*."""
+    id_prefix = key.split("_", 1)[0]
+    task = _task_rows[key]
+    values = _task_values[key]
+    tid = task["id"]
+    task_name = task["name"]
+    task_url = task["url"]
+    status_str = values["status"]
+
+    name_html = f'<a href="{task_url}">{task_name}</a>' if task_url else task_name
+    name_cell = inputs.addTextBoxCommandInput(
+        f"{id_prefix}_name_{row}", "", name_html, 1, True
+    )
+
+    # Priority cell — editable dropdown
+    pri_label_plain = _PRIORITY_INT_TO_LABEL.get(values["priority"], "Normal")
+    priority_cell = inputs.addDropDownCommandInput(
+        f"{id_prefix}_priority_{tid}",
+        "",
+        adsk.core.DropDownStyles.TextListDropDownStyle,
+    )
+    priority_cell.tooltip = "Priority"
+    priority_cell.tooltipDescription = "Set the ClickUp task priority."
+    for opt in _PRIORITY_OPTIONS:
+        priority_cell.listItems.add(opt, opt == pri_label_plain)
+
+    # Status cell — dropdown if we have API-sourced options, else read-only string
+    if _list_lookup.statuses:
+        status_cell = inputs.addDropDownCommandInput(
+            f"{id_prefix}_status_{tid}",
             "",
             adsk.core.DropDownStyles.TextListDropDownStyle,
         )
-        priority_cell.tooltip = "Priority"
-        priority_cell.tooltipDescription = "Set the ClickUp task priority."
-        for opt in _PRIORITY_OPTIONS:
-            priority_cell.listItems.add(opt, opt == pri_label_plain)
-
-        # Status cell — dropdown if we have API-sourced options, else read-only string
-        if status_options:
-            status_cell = inputs.addDropDownCommandInput(
-                f"{id_prefix}_status_{tid}",
-                "",
-                adsk.core.DropDownStyles.TextListDropDownStyle,
-            )
-            status_cell.tooltip = "Status"
-            status_cell.tooltipDescription = "Set the ClickUp task status."
-            matched = False
-            for opt in status_options:
-                opt_name = opt.get("status", "")
-                is_selected = opt_name.lower() == status_str
-                status_cell.listItems.add(opt_name.title(), is_selected)
-                if is_selected:
-                    matched = True
-            if not matched and status_cell.listItems.count > 0:
-                status_cell.listItems.item(0).isSelected = True
-        else:
-            status_cell = inputs.addStringValueInput(
-                f"{id_prefix}_status_{tid}", "", status_str.title() or "—"
-            )
-            status_cell.isReadOnly = True
-            status_cell.tooltip = "Status"
-            status_cell.tooltipDescription = "Status could not be fetched from ClickUp."
+        status_cell.tooltip = "Status"
+        status_cell.tooltipDescription = "Set the ClickUp task status."
+        # If nothing matches, select the first item
+        selected = max(_list_lookup.status_position(status_str), 0)
+        for i, label in enumerate(_list_lookup.status_options):
+            status_cell.listItems.add(label, i == selected)
+    else:
+        status_cell = inputs.addStringValueInput(
+            f"{id_prefix}_status_{tid}", "", status_str.title() or "—"
+        )
+        status_cell.isReadOnly = True
+        status_cell.tooltip = "Status"
+        status_cell.tooltipDescription = "Status could not be fetched from ClickUp."
 
-        table.addCommandInput(name_cell, i, 0)
-        table.addCommandInput(priority_cell, i, 1)
-        table.addCommandInput(status_cell, i, 2)
+    table.addCommandInput(name_cell, row, 0)
+    table.addCommandInput(priority_cell, row, 1)
+    table.addCommandInput(status_cell, row, 2)
 
-    return table
+
+def _read_task_row(inputs: adsk.core.CommandInputs, key: str) -> None:
+    """Copy row *key*'s priority and status inputs back into _task_values."""
+    prefix, task_id = key.split("_", 1)
+    values = _task_values[key]
+
+    pri_input = inputs.itemById(f"{prefix}_priority_{task_id}")
+    if pri_input and hasattr(pri_input, "selectedItem") and pri_input.selectedItem:
+        values["priority"] = _PRIORITY_LABEL_TO_INT.get(pri_input.selectedItem.name, 3)
+
+    # The read-only fallback (no statuses from ClickUp) cannot be edited
+    status_input = inputs.itemById(f"{prefix}_status_{task_id}")
+    if status_input and hasattr(status_input, "selectedItem") and status_input.selectedItem:
+        values["status"] = status_input.selectedItem.name.lower()
 
 
 def _build_description_inputs(
@@ -447,13 +681,47 @@ def _build_description_inputs(
         )
 
 
+@cutil.traced(CMD_NAME)
 def command_execute(args: adsk.core.CommandEventArgs):
-    """OK was clicked — PATCH any changed priority, status, or description fields to ClickUp."""
-    futil.log(f"{CMD_NAME}: Execute — scanning for changed fields.")
+    """OK was clicked — send any changed priority, status, or description fields to ClickUp."""
+    log.info("Execute — scanning for changed fields.")
 
-    inputs = args.command.commandInputs
-    updated = 0
-    errors = 0
+    payloads = _collect_task_payloads(args.command.commandInputs)
+    if not payloads:
+        log.info("No changes — dialog closed.")
+        return
+
+    results = cutil.update_tasks(payloads, _api_token)
+    # Write-through so the mirror reflects the saves (and drops deleted or
+    # moved tasks) before the next ClickUp sync.
+    try:
+        cutil.get_task_mirror(_list_id).record_updates(results)
+    except Exception as exc:
+        log.warning("task mirror write-through failed (non-fatal): %s", exc)
+    updated = sum(1 for r in results if r.ok)
+    failed = [r for r in results if not r.ok]
+
+    if not failed:
+        ui.messageBox(f"{updated} task(s) updated successfully.", CMD_NAME)
+    else:
+        names = {k.split("_", 1)[1]: o.get("name", "") for k, o in _task_originals.items()}
+        failed_lines = "\n".join(
+            f"  • {names.get(r.task_id) or r.task_id}"
+            f" — {f'HTTP {r.status_code}' if r.status_code else r.error}"
+            for r in failed
+        )
+        ui.messageBox(
+            f"{updated} task(s) updated, {len(failed)} failed:\n\n{failed_lines}\n\n"
+            "Check the add-in log for details.",
+            CMD_NAME,
+        )
+
+
+def _collect_task_payloads(inputs: adsk.core.CommandInputs) -> dict:
+    """Diff both tables against _task_originals and return {task_id: update payload}."""
+    for pager in _pagers.values():
+        pager.capture(inputs)
+    payloads: dict = {}
 
     for key, original in _task_originals.items():
         # key is "{id_prefix}_{task_id}"
@@ -461,27 +729,22 @@ def command_execute(args: adsk.core.CommandEventArgs):
 
         payload: dict = {}
 
-        # ---- Priority ----
-        pri_input = inputs.itemById(f"{prefix}_priority_{task_id}")
-        if pri_input and hasattr(pri_input, "selectedItem") and pri_input.selectedItem:
-            new_pri_label = pri_input.selectedItem.name
-            new_pri_int = _PRIORITY_LABEL_TO_INT.get(new_pri_label, 3)
-            if new_pri_int != original.get("priority"):
-                payload["priority"] = new_pri_int
-                futil.log(
-                    f"{CMD_NAME}: [{task_id}] priority changed → {new_pri_int} ({new_pri_label})"
-                )
-
-        # ---- Status ----
-        status_input = inputs.itemById(f"{prefix}_status_{task_id}")
-        if status_input is not None:
-            if hasattr(status_input, "selectedItem") and status_input.selectedItem:
-                new_status = status_input.selectedItem.name.lower()
-            else:
-                new_status = getattr(status_input, "value", "").lower()
-            if new_status and new_status != original.get("status", ""):
-                payload["status"] = new_status
-                futil.log(f"{CMD_NAME}: [{task_id}] status changed → '{new_status}'")
+        # ---- Priority / Status — from the row model, all pages ----
+        values = _task_values.get(key, {})
+        new_pri_int = values.get("priority")
+        if new_pri_int != original.get("priority"):
+            payload["priority"] = new_pri_int
+            log.info(
+                "[%s] priority changed → %s (%s)",
+                task_id,
+                new_pri_int,
+                _PRIORITY_INT_TO_LABEL.get(new_pri_int, "Normal"),
+            )
+
+        new_status = values.get("status", "")
+        if new_status and new_status != original.get("status", ""):
+            payload["status"] = new_status
+            log.info("[%s] status changed → '%s'", task_id, new_status)
 
         # ---- Description ----
         desc_input = inputs.itemById(f"{prefix}_desc_{task_id}")
@@ -489,7 +752,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
             new_desc = (getattr(desc_input, "formattedText", "") or "").strip()
             if new_desc != (original.get("description", "") or "").strip():
                 payload["description"] = new_desc
-                futil.log(f"{CMD_NAME}: [{task_id}] description changed")
+                log.info("[%s] description changed", task_id)
 
         # ---- Time estimate ----
         time_input = inputs.itemById(f"{prefix}_time_{task_id}")
@@ -502,34 +765,32 @@ def command_execute(args: adsk.core.CommandEventArgs):
             orig_est_ms = original.get("time_estimate_ms") or 0
             if new_est_ms != orig_est_ms:
                 payload["time_estimate"] = new_est_ms
-                futil.log(
-                    f"{CMD_NAME}: [{task_id}] time_estimate changed → {new_est_ms}ms"
-                )
+                log.info("[%s] time_estimate changed → %sms", task_id, new_est_ms)
 
-        if not payload:
-            continue
+        if payload:
+            payloads[task_id] = payload
 
-        ok = _patch_task(task_id, payload, _api_token)
-        if ok:
-            updated += 1
-        else:
-            errors += 1
+    return payloads
 
-    if updated == 0 and errors == 0:
-        futil.log(f"{CMD_NAME}: No changes — dialog closed.")
-    elif errors == 0:
-        ui.messageBox(f"{updated} task(s) updated successfully.", CMD_NAME)
-    else:
-        ui.messageBox(
-            f"{updated} task(s) updated, {errors} failed.\n\nCheck the add-in log for details.",
-            CMD_NAME,
-        )
 
+@cutil.traced(CMD_NAME)
+def command_input_changed(args: adsk.core.InputChangedEventArgs):
+    """Previous / Next under either table flips that table's page."""
+    for pager in _pagers.values():
+        if pager.is_nav_input(args.input.id):
+            pager.turn_page(args.inputs, args.input)
+            return
 
+
+@cutil.traced(CMD_NAME, end=True)
 def command_destroy(args: adsk.core.CommandEventArgs):
     """Called when the dialog closes."""
-    futil.log(f"{CMD_NAME}: Destroyed. Clearing handlers.")
-    global local_handlers
+    log.info("Destroyed. Clearing handlers.")
+    global local_handlers, _command_inputs, _pagers
+    # A refresh still in flight must not touch the closed dialog's inputs
+    cutil.cancel_background(CMD_ID)
+    _command_inputs = None
+    _pagers = {}
     local_handlers = []
 
 
@@ -538,189 +799,22 @@ def command_destroy(args: adsk.core.CommandEventArgs):
 # ---------------------------------------------------------------------------
 
 
-def _patch_task(task_id: str, payload: dict, api_token: str) -> bool:
-    """PATCH /api/v2/task/{task_id} with *payload*. Returns True on success."""
-    import json as _json
-
-    url = f"{CLICKUP_API_BASE}/task/{task_id}"
-    body = _json.dumps(payload)
-    futil.log(f"{CMD_NAME}: _patch_task — PATCH '{url}' body={body}")
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.PutMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Content-Type", "application/json")
-        req.setHeader("Accept", "application/json")
-        req.data = body
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _patch_task [{task_id}] — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _patch_task [{task_id}] — error: {response.data}")
-            return False
-        return True
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _patch_task [{task_id}] — exception: {exc}")
-        return False
-
-
 def _fetch_list_statuses(list_id: str, api_token: str) -> list:
-    """GET /api/v2/list/{list_id} and return its statuses array sorted by orderindex.
+    """Return the list's statuses sorted by orderindex, via the shared list-metadata cache.
 
     Each item is a dict like: {"status": "in progress", "color": "#...", ...}.
     Returns an empty list on any failure.
     ClickUp docs: https://developer.clickup.com/reference/getlist
     """
-    url = f"{CLICKUP_API_BASE}/list/{list_id}"
-    futil.log(f"{CMD_NAME}: _fetch_list_statuses — GET '{url}'")
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_list_statuses — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_list_statuses — error: {response.data}")
-            return []
-        data = json.loads(response.data)
-        statuses = data.get("statuses", [])
-        statuses.sort(key=lambda s: s.get("orderindex", 0))
-        return statuses
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_list_statuses — exception: {exc}")
-        return []
-
-
-def _load_api_token() -> str:
-    """Read the ClickUp API token from cache/auth.json."""
-    if not os.path.isfile(AUTH_JSON_PATH):
-        return ""
-    try:
-        with open(AUTH_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return data.get("clickup_api_token", "").strip()
-
-
-def _load_list_id_for_project(project_urn: str) -> str:
-    """Return the clickup_list_id for the given project URN from projects.json."""
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        return ""
-    try:
-        with open(PROJECTS_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return (
-        data.get("projects", {}).get(project_urn, {}).get("clickup_list_id", "").strip()
-    )
-
-
-def _load_clickup_url_for_project(project_urn: str) -> str:
-    """Return the clickup_url for the given project URN from projects.json."""
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        return ""
-    try:
-        with open(PROJECTS_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return data.get("projects", {}).get(project_urn, {}).get("clickup_url", "").strip()
+    statuses = cutil.get_list_statuses(list_id, api_token)
+    log.info("_fetch_list_statuses — %s status(es)", len(statuses))
+    return statuses
 
 
 def _get_urn_custom_field_id(list_id: str, api_token: str) -> str:
     """Return the field ID of the 'Fusion Document URN' custom field on the given list."""
-    TARGET_NAME = "Fusion Document URN"
-    fields_url = f"{CLICKUP_API_BASE}/list/{list_id}/field"
-    futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — querying list '{list_id}'")
-
-    try:
-        req = adsk.core.HttpRequest.create(fields_url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-
-        if not (200 <= response.statusCode < 300):
-            futil.log(
-                f"{CMD_NAME}: _get_urn_custom_field_id — HTTP {response.statusCode}: {response.data}"
-            )
-            return ""
-
-        fields = json.loads(response.data).get("fields", [])
-        matched = next((f for f in fields if f.get("name") == TARGET_NAME), None)
-        if matched:
-            futil.log(
-                f"{CMD_NAME}: _get_urn_custom_field_id — found id='{matched.get('id')}'"
-            )
-            return matched.get("id", "")
-
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — '{TARGET_NAME}' not found.")
-        return ""
-
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — exception: {exc}")
-        return ""
-
-
-def _fetch_tasks_for_urn(
-    list_id: str, urn_field_id: str, doc_urn: str, api_token: str
-) -> list:
-    """Query GET /api/v2/list/{list_id}/task filtered by the Fusion Document URN field.
-
-    Returns a list of raw ClickUp task dicts (page 0, up to 100).
-    API docs: https://developer.clickup.com/reference/gettasks
-    """
-    import urllib.parse
-
-    cf_filter = json.dumps(
-        [{"field_id": urn_field_id, "operator": "=", "value": doc_urn}]
-    )
-    params = urllib.parse.urlencode(
-        {
-            "custom_field": cf_filter,
-            "page": 0,
-            "include_closed": "true",
-        }
-    )
-    url = f"{CLICKUP_API_BASE}/list/{list_id}/task?{params}"
-    futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — GET '{url}'")
-
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — error body: {response.data}")
-            return []
-        return json.loads(response.data).get("tasks", [])
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — exception: {exc}")
-        return []
-
-
-def _fetch_all_tasks(list_id: str, api_token: str) -> list:
-    """Fetch all tasks from the list (no custom-field filter), including closed.
+    field_id = cutil.find_custom_field_id(list_id, api_token, URN_FIELD_NAME)
+    if not field_id:
+        log.info("_get_urn_custom_field_id — '%s' not found.", URN_FIELD_NAME)
+    return field_id
 
-    Returns a list of raw ClickUp task dicts (page 0, up to 100).
-    API docs: https://developer.clickup.com/reference/gettasks
-    """
-    import urllib.parse
-
-    params = urllib.parse.urlencode({"page": 0, "include_closed": "true"})
-    url = f"{CLICKUP_API_BASE}/list/{list_id}/task?{params}"
-    futil.log(f"{CMD_NAME}: _fetch_all_tasks — GET '{url}'")
-
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_all_tasks — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_all_tasks — error body: {response.data}")
-            return []
-        return json.loads(response.data).get("tasks", [])
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_all_tasks — exception: {exc}")
-        return []
@@ -1,5 +1,63 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2022-2026 IMA LLC
 
-# This module is part of the PowerTools-ClickUp add-in for Fusion.
-# It contains the "Open ClickUp" command functionality.
+import adsk.core
+import os
+from ...lib import fusionAddInUtils as futil
+from ... import config
+from ..lazy import LazyEntry
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+# Command identity information
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_openClickUp"
+CMD_NAME = "Open ClickUp"
+CMD_Description = "Open the ClickUp project associated with the current Fusion document"
+
+# Specify that the command will be promoted to the panel
+IS_PROMOTED = True
+WORKSPACE_ID = config.design_workspace
+TAB_ID = config.tools_tab_id
+TAB_NAME = config.my_tab_name
+
+PANEL_ID = config.clickup_panel_id
+PANEL_NAME = config.clickup_panel_name
+PANEL_AFTER = config.clickup_panel_after
+
+# Resource location for command icons
+ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
+
+
+# The implementation lives in entry.py and is imported the first time the
+# command runs, so add-in start only pays for the button (see commands/lazy.py).
+_entry = LazyEntry(__name__, CMD_NAME)
+
+
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    _entry.module.command_created(args)
+
+
+def start():
+    """Executed when add-in is run."""
+    # Create a command Definition
+    cmd_def = ui.commandDefinitions.addButtonDefinition(
+        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
+    )
+
+    # Define an event handler for the command created event
+    futil.add_handler(cmd_def.commandCreated, command_created)
+
+    # Add a button into the UI
+    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
+    if panel:
+        control = panel.controls.addCommand(cmd_def, "", False)
+        control.isPromoted = IS_PROMOTED
+
+
+def stop():
+    """Executed when add-in is stopped."""
+    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+    if command_definition:
+        command_definition.deleteMe()
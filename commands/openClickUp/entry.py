@@ -3,62 +3,19 @@
 
 import adsk.core
 import adsk.fusion
-import os
-import json
 import webbrowser
 from ...lib import fusionAddInUtils as futil
+from ...lib import clickupUtils as cutil
 from ... import config
+from . import CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-# Command identity information
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_openClickUp"
-CMD_NAME = "Open ClickUp"
-CMD_Description = "Open the ClickUp project associated with the current Fusion document"
-
-# Specify that the command will be promoted to the panel
-IS_PROMOTED = True
-WORKSPACE_ID = config.design_workspace
-TAB_ID = config.tools_tab_id
-TAB_NAME = config.my_tab_name
-
-PANEL_ID = config.clickup_panel_id
-PANEL_NAME = config.clickup_panel_name
-PANEL_AFTER = config.clickup_panel_after
-
-# Resource location for command icons
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
-
 # Local list of event handlers
 local_handlers = []
 
 
-def start():
-    """Executed when add-in is run."""
-    # Create a command Definition
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-
-    # Define an event handler for the command created event
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    # Add a button into the UI
-    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
-    if panel:
-        control = panel.controls.addCommand(cmd_def, "", False)
-        control.isPromoted = IS_PROMOTED
-
-
-def stop():
-    """Executed when add-in is stopped."""
-    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
-
-
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     """Called when the command is created."""
     futil.log(f"{CMD_NAME} Command Created Event")
@@ -105,33 +62,16 @@ def command_execute(args: adsk.core.CommandEventArgs):
         project_urn = project.id
         futil.log(f"Found project URN: {project_urn}")
 
-        # Load the projects JSON file
-        try:
-            with open(config.PROJECTS_JSON_PATH, "r") as f:
-                projects_data = json.load(f)
-        except FileNotFoundError:
-            ui.messageBox(
-                f"Project mapping not found at: {config.PROJECTS_JSON_PATH}",
-                "Project Mapping Error",
-            )
-            return
-        except json.JSONDecodeError:
-            ui.messageBox(
-                "Invalid JSON format in project mapping.",
-                "Project Mapping Error",
-            )
-            return
-
-        # Look up the project URN in the JSON data
-        if "projects" not in projects_data:
+        # Look up the project URN in the project mapping store
+        if not cutil.project_mappings_exist():
             ui.messageBox(
-                'Invalid project mapping: missing "projects" key.',
+                f"Project mapping not found at: {config.PROJECTS_DB_PATH}",
                 "Project Mapping Error",
             )
             return
 
-        if project_urn in projects_data["projects"]:
-            project_info = projects_data["projects"][project_urn]
+        project_info = cutil.get_project_mapping(project_urn)
+        if project_info:
             clickup_url = project_info.get("clickup_url")
             project_name = project_info.get("project_name", "Unknown Project")
 
@@ -148,7 +88,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
                 )
         else:
             ui.messageBox(
-                f"Project URN not found in configuration: {project_urn}\\n\\nPlease add this project to the projects.json file.",
+                f"Project URN not found in configuration: {project_urn}\n\nRun 'Map Project to ClickUp' to add this project.",
                 "Project Not Configured",
             )
 
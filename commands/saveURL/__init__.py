@@ -1,3 +1,54 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2022-2026 IMA LLC
 
+import adsk.core
+import os
+from ...lib import fusionAddInUtils as futil
+from ... import config
+from ..lazy import LazyEntry
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+# TODO *** Specify the command identity information. ***
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_saveClickUpURL"
+CMD_NAME = "Map Project to ClickUp"
+CMD_Description = "Map the current Fusion project to a ClickUp list"
+
+# Resource location for command icons, here we assume a sub folder in this directory named "resources".
+ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
+
+
+# The implementation lives in entry.py and is imported the first time the
+# command runs, so add-in start only pays for the button (see commands/lazy.py).
+_entry = LazyEntry(__name__, CMD_NAME)
+
+
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    _entry.module.command_created(args)
+
+
+# Executed when add-in is run.
+def start():
+    # Create a command Definition.
+    cmd_def = ui.commandDefinitions.addButtonDefinition(
+        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
+    )
+
+    # Define an event handler for the command created event. It will be called when the button is clicked.
+    futil.add_handler(cmd_def.commandCreated, command_created)
+
+    # ******** Add a button into the UI so the user can run the command. ********
+    flyout = futil.get_or_create_qat_file_flyout(
+        config.settings_flyout_id, config.settings_flyout_name
+    )
+    if flyout:
+        flyout.controls.addCommand(cmd_def)
+
+
+# Executed when add-in is stopped.
+def stop():
+    futil.remove_from_qat_file_flyout(CMD_ID, config.settings_flyout_id)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+    if command_definition:
+        command_definition.deleteMe()
@@ -3,54 +3,18 @@
 
 import adsk.core
 import adsk.fusion
-import os
-import json
 from ...lib import fusionAddInUtils as futil
-from ... import config
+from ...lib import clickupUtils as cutil
+from . import CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-
-# TODO *** Specify the command identity information. ***
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_saveClickUpURL"
-CMD_NAME = "Map Project to ClickUp"
-CMD_Description = "Map the current Fusion project to a ClickUp list"
-
-# Resource location for command icons, here we assume a sub folder in this directory named "resources".
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
-
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
 local_handlers = []
 
 
-# Executed when add-in is run.
-def start():
-    # Create a command Definition.
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-
-    # Define an event handler for the command created event. It will be called when the button is clicked.
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    # ******** Add a button into the UI so the user can run the command. ********
-    flyout = futil.get_or_create_qat_file_flyout(
-        config.settings_flyout_id, config.settings_flyout_name
-    )
-    if flyout:
-        flyout.controls.addCommand(cmd_def)
-
-
-# Executed when add-in is stopped.
-def stop():
-    futil.remove_from_qat_file_flyout(CMD_ID, config.settings_flyout_id)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
-
-
 # Function that is called when a user clicks the corresponding button in the UI.
 # This defines the contents of the command dialog and connects to the command related events.
 def command_created(args: adsk.core.CommandCreatedEventArgs):
@@ -86,18 +50,9 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     project_urn = project.id
 
     # Load existing values if available
-    existing_clickup_url = ""
-    existing_list_id = ""
-    try:
-        with open(config.PROJECTS_JSON_PATH, "r") as f:
-            projects_data = json.load(f)
-            if "projects" in projects_data and project_urn in projects_data["projects"]:
-                entry = projects_data["projects"][project_urn]
-                existing_clickup_url = entry.get("clickup_url", "")
-                existing_list_id = entry.get("clickup_list_id", "")
-    except (FileNotFoundError, json.JSONDecodeError):
-        # File doesn't exist or is invalid, we'll create it when saving
-        pass
+    entry = cutil.get_project_mapping(project_urn)
+    existing_clickup_url = entry.get("clickup_url", "")
+    existing_list_id = entry.get("clickup_list_id", "")
 
     # Create the dialog inputs
     inputs = args.command.commandInputs
@@ -163,37 +118,16 @@ def command_execute(args: adsk.core.CommandEventArgs):
             ui.messageBox("Please enter a ClickUp URL.", "Missing URL")
             return
 
-        # Load existing projects data or create new structure
-        projects_data = {"projects": {}}
-        try:
-            with open(config.PROJECTS_JSON_PATH, "r") as f:
-                projects_data = json.load(f)
-        except FileNotFoundError:
-            # File doesn't exist, will be created
-            futil.log("Projects cache not found, creating new one")
-        except json.JSONDecodeError:
-            # File is corrupted, start fresh
-            futil.log("Projects cache corrupted, creating new one")
-
-        # Ensure projects key exists
-        if "projects" not in projects_data:
-            projects_data["projects"] = {}
-
-        # Check if project already exists
-        project_exists = project_urn in projects_data["projects"]
-
-        # Update or add the project — preserve any unrelated existing fields
-        existing = projects_data["projects"].get(project_urn, {})
-        existing.update({
-            "project_name": project_name,
-            "clickup_url": clickup_url,
-            "clickup_list_id": clickup_list_id,
-        })
-        projects_data["projects"][project_urn] = existing
-
-        # Save the updated data
-        with open(config.PROJECTS_JSON_PATH, "w") as f:
-            json.dump(projects_data, f, indent=2)
+        # Update or add the project — preserve any unrelated existing fields.
+        # Only this project's row is written.
+        project_exists = cutil.save_project_mapping(
+            project_urn,
+            {
+                "project_name": project_name,
+                "clickup_url": clickup_url,
+                "clickup_list_id": clickup_list_id,
+            },
+        )
 
         # Show success message
         action = "Updated" if project_exists else "Added"
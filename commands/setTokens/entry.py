@@ -3,56 +3,23 @@
 
 import adsk.core
 import adsk.fusion
-import os
-import json
 from ...lib import fusionAddInUtils as futil
+from ...lib import clickupUtils as cutil
 from ... import config
+from . import CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_setClickUpTokens"
-CMD_NAME = "Set ClickUp Tokens"
-CMD_Description = "Set the ClickUp and TinyURL API tokens used by Power Tools"
-
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
-
 local_handlers = []
 
 
-def start():
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    flyout = futil.get_or_create_qat_file_flyout(
-        config.settings_flyout_id, config.settings_flyout_name
-    )
-    if flyout:
-        flyout.controls.addCommand(cmd_def)
-
-
-def stop():
-    futil.remove_from_qat_file_flyout(CMD_ID, config.settings_flyout_id)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
-
-
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     futil.log(f"{CMD_NAME}: Command Created.")
 
     # Load existing token values if auth.json exists
-    existing_clickup_token = ""
-    existing_tinyurl_token = ""
-    try:
-        with open(config.AUTH_JSON_PATH, "r", encoding="utf-8") as f:
-            auth_data = json.load(f)
-            existing_clickup_token = auth_data.get("clickup_api_token", "")
-            existing_tinyurl_token = auth_data.get("tinyurl_api_token", "")
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass
+    existing_clickup_token = cutil.get_clickup_api_token()
+    existing_tinyurl_token = cutil.get_tinyurl_api_token()
 
     inputs = args.command.commandInputs
 
@@ -83,25 +50,9 @@ def command_execute(args: adsk.core.CommandEventArgs):
         clickup_token = getattr(clickup_token_input, "value", "").strip()
         tinyurl_token = getattr(tinyurl_token_input, "value", "").strip()
 
-        # Load existing auth data to preserve any unrelated keys
-        auth_data = {}
-        try:
-            with open(config.AUTH_JSON_PATH, "r", encoding="utf-8") as f:
-                auth_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-
-        # Update only the two token keys; leave others untouched
-        if clickup_token:
-            auth_data["clickup_api_token"] = clickup_token
-        if tinyurl_token:
-            auth_data["tinyurl_api_token"] = tinyurl_token
-
-        # Ensure cache directory exists
-        os.makedirs(config.CACHE_DIR, exist_ok=True)
-
-        with open(config.AUTH_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(auth_data, f, indent=2)
+        # Update only the two token keys; the store keeps any unrelated keys
+        # and replaces auth.json atomically.
+        cutil.save_tokens(clickup_token, tinyurl_token)
 
         futil.log(f"{CMD_NAME}: auth.json saved to '{config.AUTH_JSON_PATH}'.")
         ui.messageBox("API tokens saved.", CMD_NAME)
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Page-at-a-time rendering for the task tables.
+
+Building every row of a long task list up front costs several Fusion
+controls per task before the dialog can appear. A TablePager keeps the
+row keys (task ids) and draws inputs for one page only; Previous / Next
+buttons in the table's toolbar flip pages. Row values live in the
+command's own model: `read_row` copies a page's inputs back into it before
+the page is torn down and `build_row` draws from it, so edits survive
+paging and command_execute can diff the model instead of the inputs.
+"""
+
+import math
+from typing import Callable
+
+import adsk.core
+
+from .. import config
+
+
+class TablePager:
+    """Pages through *keys* in an existing TableCommandInput whose row 0 is the header."""
+
+    def __init__(
+        self,
+        table_id: str,
+        id_prefix: str,
+        build_row: Callable,
+        read_row: Callable,
+        page_size: int = None,
+        empty_text: str = "No tasks found.",
+    ):
+        self.table_id = table_id
+        self.id_prefix = id_prefix
+        self._build_row = build_row  # (inputs, table, row, key) → None
+        self._read_row = read_row  # (inputs, key) → None
+        self.page_size = max(1, page_size or config.TASK_TABLE_PAGE_SIZE)
+        self.empty_text = empty_text
+        self.keys: list = []
+        self.page = 0
+
+    # ── Ids of the toolbar inputs ─────────────────────────────────────────────
+
+    @property
+    def prev_id(self) -> str:
+        return f"{self.id_prefix}_page_prev"
+
+    @property
+    def next_id(self) -> str:
+        return f"{self.id_prefix}_page_next"
+
+    @property
+    def label_id(self) -> str:
+        return f"{self.id_prefix}_page_label"
+
+    def is_nav_input(self, input_id: str) -> bool:
+        return input_id in (self.prev_id, self.next_id)
+
+    # ── Pages ─────────────────────────────────────────────────────────────────
+
+    @property
+    def page_count(self) -> int:
+        return max(1, math.ceil(len(self.keys) / self.page_size))
+
+    def visible_keys(self) -> list:
+        start = self.page * self.page_size
+        return self.keys[start : start + self.page_size]
+
+    def add_toolbar(self, inputs: adsk.core.CommandInputs) -> None:
+        """Add the Previous / page label / Next controls to the table's toolbar."""
+        table = inputs.itemById(self.table_id)
+        prev_btn = inputs.addBoolValueInput(self.prev_id, "◀ Previous", False, "", False)
+        prev_btn.tooltip = "Previous page"
+        label = inputs.addTextBoxCommandInput(self.label_id, "", "", 1, True)
+        next_btn = inputs.addBoolValueInput(self.next_id, "Next ▶", False, "", False)
+        next_btn.tooltip = "Next page"
+        for control in (prev_btn, label, next_btn):
+            table.addToolbarCommandInput(control)
+
+    def set_rows(
+        self, inputs: adsk.core.CommandInputs, keys: list, redraw: bool = True
+    ) -> None:
+        """Replace the keys, keep the current page where possible, and redraw.
+
+        Pass redraw=False when the current page's rows are known to be
+        unchanged; only the Previous / Next toolbar is updated then.
+        """
+        self.keys = list(keys)
+        self.page = min(self.page, self.page_count - 1)
+        if redraw:
+            self.render(inputs)
+        else:
+            self._update_toolbar(inputs)
+
+    def capture(self, inputs: adsk.core.CommandInputs) -> None:
+        """Copy the visible rows' current input values back into the model."""
+        for key in self.visible_keys():
+            self._read_row(inputs, key)
+
+    def render(self, inputs: adsk.core.CommandInputs) -> None:
+        """Delete the drawn data rows and build the current page's rows."""
+        table = inputs.itemById(self.table_id)
+        if table is None:
+            return
+        for row in range(table.rowCount - 1, 0, -1):
+            table.deleteRow(row, True)
+
+        if not self.keys:
+            empty = inputs.addTextBoxCommandInput(
+                f"{self.id_prefix}_empty", "", self.empty_text, 1, True
+            )
+            table.addCommandInput(empty, 1, 0, 0, table.numberOfColumns)
+        else:
+            for row, key in enumerate(self.visible_keys(), start=1):
+                self._build_row(inputs, table, row, key)
+        self._update_toolbar(inputs)
+
+    def turn_page(self, inputs: adsk.core.CommandInputs, changed: adsk.core.CommandInput) -> bool:
+        """Handle a click on Previous / Next. Returns True when the page changed."""
+        if getattr(changed, "value", False):
+            changed.value = False  # Reset button immediately
+        step = -1 if changed.id == self.prev_id else 1
+        page = min(max(self.page + step, 0), self.page_count - 1)
+        if page == self.page:
+            return False
+        self.capture(inputs)
+        self.page = page
+        self.render(inputs)
+        return True
+
+    def _update_toolbar(self, inputs: adsk.core.CommandInputs) -> None:
+        paged = self.page_count > 1
+        prev_btn = inputs.itemById(self.prev_id)
+        next_btn = inputs.itemById(self.next_id)
+        label = inputs.itemById(self.label_id)
+        if prev_btn:
+            prev_btn.isVisible = paged
+            prev_btn.isEnabled = self.page > 0
+        if next_btn:
+            next_btn.isVisible = paged
+            next_btn.isEnabled = self.page < self.page_count - 1
+        if label:
+            label.isVisible = paged
+            first = self.page * self.page_size + 1
+            last = min(first + self.page_size - 1, len(self.keys))
+            label.formattedText = (
+                f"Page {self.page + 1} of {self.page_count} "
+                f"({first}–{last} of {len(self.keys)})"
+            )
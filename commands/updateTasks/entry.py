@@ -3,39 +3,23 @@
 
 import adsk.core
 import adsk.fusion
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import urlencode
 
 from ...lib import fusionAddInUtils as futil
+from ...lib import clickupUtils as cutil
 from ... import config
+from ..table_pager import TablePager
+from . import CMD_ID, CMD_NAME
 
 app = adsk.core.Application.get()
 ui = app.userInterface
-
-# Command identity information
-CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_updateTasks"
-CMD_NAME = "Update Tasks"
-CMD_Description = "View and update ClickUp tasks linked to the active Fusion document"
-
-IS_PROMOTED = True
-WORKSPACE_ID = config.design_workspace
-TAB_ID = config.tools_tab_id
-TAB_NAME = config.my_tab_name
-
-PANEL_ID = config.clickup_panel_id
-PANEL_NAME = config.clickup_panel_name
-PANEL_AFTER = config.clickup_panel_after
-
-ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
-
-# ClickUp API configuration
-CLICKUP_API_BASE = "https://api.clickup.com/api/v2"
+log = cutil.get_logger(CMD_NAME)
 
 CACHE_DIR = config.CACHE_DIR
 AUTH_JSON_PATH = os.path.join(CACHE_DIR, "auth.json")
-PROJECTS_JSON_PATH = os.path.join(CACHE_DIR, "projects.json")
+PROJECTS_DB_PATH = config.PROJECTS_DB_PATH
 
 # ClickUp priority: display label → API integer
 _PRIORITY_OPTIONS = ["Normal", "Low", "High", "Urgent"]
@@ -51,47 +35,41 @@ _task_originals: dict = (
     {}
 )  # task_id → {"name": str, "due_ms": int|None, "priority": int|None, "status": str|None, "description": str, "time_estimate_ms": int|None}
 _api_token: str = ""
+_list_id: str = ""
 _list_url: str = ""
-_list_statuses: list = []  # [{"status": str, "color": str}, ...]
-_list_members: list = []  # [{"id": int, "username": str, "email": str}, ...]
+_list_lookup = cutil.ListLookup()  # the list's statuses and members, indexed once per bootstrap
 _selected_task_id: str = ""  # task ID of the currently selected table row
 _pending_edits: dict = {}  # task_id → {desc, time_hours, assignee_name, is_private}
 _quick_date_options: list = []  # pre-calculated (label, value) tuples for the Quick Date dropdown
+_task_values: dict = {}  # task_id → {"name", "due", "priority", "status"} as shown in the table, edits included
+_dirty_task_ids: set = set()  # tasks with a table or detail-panel edit since the dialog opened
+_parsed_due: dict = {}  # task_id → due date in ms (None = cleared), for edited due cells only
+_invalid_due_ids: set = set()  # tasks whose edited due cell does not parse
+_pager = None  # TablePager of tasks_table while the dialog is open
+_command_inputs = None  # live dialog inputs while the dialog is open
 
 
-def start():
-    """Executed when add-in is run."""
-    cmd_def = ui.commandDefinitions.addButtonDefinition(
-        CMD_ID, CMD_NAME, CMD_Description, ICON_FOLDER
-    )
-    futil.add_handler(cmd_def.commandCreated, command_created)
-
-    panel = futil.get_or_create_panel(WORKSPACE_ID, TAB_ID, TAB_NAME, PANEL_ID, PANEL_NAME, PANEL_AFTER)
-    if panel:
-        control = panel.controls.addCommand(cmd_def, "", False)
-        control.isPromoted = IS_PROMOTED
-
-
-def stop():
-    """Executed when add-in is stopped."""
-    futil.remove_from_panel(WORKSPACE_ID, PANEL_ID, TAB_ID, CMD_ID)
-    command_definition = ui.commandDefinitions.itemById(CMD_ID)
-    if command_definition:
-        command_definition.deleteMe()
-
-
+@cutil.traced(CMD_NAME, begin=True)
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     """Builds the update-tasks dialog."""
-    global _task_originals, _api_token, _list_url, _list_statuses, _list_members, _selected_task_id, _pending_edits
+    global _task_originals, _api_token, _list_id, _list_url, _list_lookup, _selected_task_id
+    global _pending_edits, _task_values, _pager, _dirty_task_ids, _parsed_due, _invalid_due_ids
+    global _command_inputs
     _task_originals = {}
+    _task_values = {}
+    _dirty_task_ids = set()
+    _parsed_due = {}
+    _invalid_due_ids = set()
+    _pager = None
     _api_token = ""
+    _list_id = ""
     _list_url = ""
-    _list_statuses = []
-    _list_members = []
+    _list_lookup = cutil.ListLookup()
     _selected_task_id = ""
     _pending_edits = {}
+    _command_inputs = None
 
-    futil.log(f"{CMD_NAME}: Command Created — building update tasks dialog.")
+    log.info("Command Created — building update tasks dialog.")
 
     # ------------------------------------------------------------------ #
     # Pre-flight checks                                                   #
@@ -99,8 +77,8 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     missing = []
     if not os.path.isfile(AUTH_JSON_PATH):
         missing.append(f"  • {AUTH_JSON_PATH}")
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        missing.append(f"  • {PROJECTS_JSON_PATH}")
+    if not cutil.project_mappings_exist():
+        missing.append(f"  • {PROJECTS_DB_PATH}")
 
     if missing:
         ui.messageBox(
@@ -135,9 +113,9 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    futil.log(f"{CMD_NAME}: project_urn='{project_urn}'  doc_urn='{doc_urn}'")
+    log.info("project_urn='%s'  doc_urn='%s'", project_urn, doc_urn)
 
-    list_id = _load_list_id_for_project(project_urn)
+    list_id = cutil.get_list_id_for_project(project_urn)
     if not list_id:
         ui.messageBox(
             "No ClickUp list ID configured for this project.\n\n"
@@ -147,9 +125,10 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    _list_url = _load_clickup_url_for_project(project_urn)
+    _list_id = list_id
+    _list_url = cutil.get_clickup_url_for_project(project_urn)
 
-    _api_token = _load_api_token()
+    _api_token = cutil.get_clickup_api_token()
     if not _api_token:
         ui.messageBox(
             "ClickUp API token not found.\n\nPlease run 'Set Tokens'.",
@@ -158,22 +137,23 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    # Fetch available statuses for the list (used to populate the status dropdown)
-    _list_statuses = _fetch_list_statuses(list_id, _api_token)
-    futil.log(
-        f"{CMD_NAME}: fetched {len(_list_statuses)} status(es) for list '{list_id}'."
-    )
-
-    # Fetch list members (used to populate the assignee dropdown)
-    _list_members = _fetch_list_members(list_id, _api_token)
-    futil.log(
-        f"{CMD_NAME}: fetched {len(_list_members)} member(s) for list '{list_id}'."
-    )
-
     # ------------------------------------------------------------------ #
-    # Fetch tasks linked to this document                                 #
+    # Bootstrap requests — statuses, members and the URN field id are     #
+    # issued concurrently; the rows come from the local task mirror and   #
+    # the mirror is synced in the background once the dialog is up.       #
     # ------------------------------------------------------------------ #
-    urn_field_id = _get_urn_custom_field_id(list_id, _api_token)
+    with cutil.perf_timer("bootstrap (total)", CMD_NAME):
+        boot = _bootstrap_requests(list_id, doc_urn, _api_token)
+
+    _list_lookup = cutil.ListLookup(boot["statuses"], boot["members"])
+    urn_field_id = boot["urn_field_id"]
+    log.info(
+        "fetched %s status(es) and %s member(s) for list '%s'.",
+        len(_list_lookup.statuses),
+        len(_list_lookup.members),
+        list_id,
+    )
+
     if not urn_field_id:
         ui.messageBox(
             "The 'Fusion Document URN' custom field was not found on this ClickUp list.\n\n"
@@ -184,67 +164,12 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         args.command.isAutoExecute = True
         return
 
-    raw_tasks = _fetch_tasks_for_urn(list_id, urn_field_id, doc_urn, _api_token)
-
-    # Client-side exact-match on the URN custom field value
-    def _urn_matches(task: dict) -> bool:
-        for cf in task.get("custom_fields", []):
-            if cf.get("id") == urn_field_id:
-                return cf.get("value", "") == doc_urn
-        return False
-
-    doc_tasks = [t for t in raw_tasks if _urn_matches(t)]
-    futil.log(
-        f"{CMD_NAME}: {len(raw_tasks)} API result(s) → {len(doc_tasks)} exact match(es)."
-    )
-
-    # Sort by priority
-    def _pri_sort(task):
-        raw = task.get("priority") or {}
-        try:
-            return {1: 0, 2: 1, 3: 2, 4: 3}.get(int(raw.get("id", 99)), 99)
-        except (ValueError, TypeError):
-            return 99
-
-    doc_tasks.sort(key=_pri_sort)
+    doc_tasks = boot["doc_tasks"]
+    doc_tasks.sort(key=cutil.priority_order)
 
     # Store originals for later change detection
     for task in doc_tasks:
-        tid = task.get("id", "")
-        due_ms = task.get("due_date")
-        try:
-            due_ms = int(due_ms) if due_ms else None
-        except (ValueError, TypeError):
-            due_ms = None
-
-        pri_raw = task.get("priority") or {}
-        try:
-            pri_int = int(pri_raw.get("id", 0)) or None
-        except (ValueError, TypeError):
-            pri_int = None
-
-        status_str = task.get("status", {}).get("status", "").lower()
-
-        try:
-            time_est_ms = (
-                int(task["time_estimate"]) if task.get("time_estimate") else None
-            )
-        except (ValueError, TypeError):
-            time_est_ms = None
-
-        raw_assignees = task.get("assignees", [])
-        assignee_ids = [int(a["id"]) for a in raw_assignees if a.get("id")]
-
-        _task_originals[tid] = {
-            "name": task.get("name", ""),
-            "due_ms": due_ms,
-            "priority": pri_int,
-            "status": status_str,
-            "description": (task.get("description") or "").strip(),
-            "time_estimate_ms": time_est_ms,
-            "is_private": bool(task.get("is_private", False)),
-            "assignee_ids": assignee_ids,
-        }
+        _task_originals[task.get("id", "")] = _task_original(task)
 
     # ------------------------------------------------------------------ #
     # Build dialog                                                        #
@@ -273,7 +198,7 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         True,
     )
 
-    _build_editable_task_table(inputs, doc_tasks, _list_statuses)
+    _build_editable_task_table(inputs, doc_tasks)
 
     # ------------------------------------------------------------------ #
     # Shared detail controls (populated when a table row is selected)     #
@@ -326,8 +251,8 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
         "Select '— Unassigned —' to remove all assignees."
     )
     assignee_ctrl.listItems.add("— Unassigned —", True)
-    for member in _list_members:
-        assignee_ctrl.listItems.add(member["username"], False)
+    for username in _list_lookup.member_options:
+        assignee_ctrl.listItems.add(username, False)
 
     private_ctrl = inputs.addBoolValueInput(
         "detail_private", "Private Task", True, "", False
@@ -364,23 +289,37 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     futil.add_handler(
         args.command.destroy, command_destroy, local_handlers=local_handlers
     )
+    _command_inputs = inputs
+
+    # Revalidate: sync the mirror off the UI thread; _on_doc_tasks updates
+    # the rows the user has not touched.
+    cutil.submit_background(
+        _fetch_doc_tasks,
+        list_id,
+        _api_token,
+        urn_field_id,
+        doc_urn,
+        on_done=_on_doc_tasks,
+        on_error=_on_doc_tasks_failed,
+        owner=CMD_ID,
+        name=f"{CMD_NAME} refresh",
+    )
 
 
 def _build_editable_task_table(
     inputs: adsk.core.CommandInputs,
     tasks: list,
-    status_options: list = None,
 ) -> None:
     """Add an editable table — Select | Task Name | Due Date | Priority | Status — to *inputs*.
 
     A checkbox in the first column lets the user select a row; selection populates the
     shared detail controls (description, time estimate, assignee, private) below the table.
     Name, Due Date, Priority, and Status remain directly editable in the table.
-    *status_options* is a list of dicts from the ClickUp API: [{"status": str, ...}, ...].
-    If empty or None, the status cell falls back to a read-only string.
+    Only the visible page's rows have inputs; the values of every row live in
+    _task_values (see TablePager). If the list has no statuses, the status cell
+    falls back to a read-only string.
     """
-    if status_options is None:
-        status_options = []
+    global _pager
     table = inputs.addTableCommandInput("tasks_table", "", 6, "1:5:3:2:2:2")
     table.hasGrid = True
     table.minimumVisibleRows = 3
@@ -406,198 +345,354 @@ def _build_editable_task_table(
     table.addCommandInput(inputs.itemById("h_status"), 0, 4)
     table.addCommandInput(inputs.itemById("h_time"), 0, 5)
 
-    if not tasks:
-        empty = inputs.addTextBoxCommandInput(
-            "tasks_empty", "", "No tasks linked to this document.", 1, True
-        )
-        table.addCommandInput(empty, 1, 0, 0, 6)
-        return
+    for task in tasks:
+        tid = task.get("id", "")
+        _task_values[tid] = _task_value(_task_originals[tid])
+
+    _pager = TablePager(
+        "tasks_table",
+        "tasks",
+        _add_task_row,
+        _read_task_row,
+        empty_text="No tasks linked to this document.",
+    )
+    _pager.add_toolbar(inputs)
+    _pager.set_rows(inputs, list(_task_values))
 
-    for i, task in enumerate(tasks, start=1):
-        tid = task.get("id", f"unknown_{i}")
-        task_name = task.get("name", "")
-        task_url = task.get("url", "")
-
-        # Due date: ms timestamp → YYYY-MM-DD
-        due_ms = task.get("due_date")
-        try:
-            due_str = (
-                datetime.fromtimestamp(int(due_ms) / 1000).strftime("%Y-%m-%d")
-                if due_ms
-                else ""
-            )
-        except (ValueError, TypeError):
-            due_str = ""
-
-        # Priority
-        pri_raw = task.get("priority") or {}
-        try:
-            pri_int = int(pri_raw.get("id", 0)) or None
-        except (ValueError, TypeError):
-            pri_int = None
-        pri_label = _PRIORITY_INT_TO_LABEL.get(pri_int, "Normal")
-
-        # Status — current value (lowercase to match ClickUp API)
-        status_str = task.get("status", {}).get("status", "").lower()
-
-        # Time estimate — ms → hours string
-        try:
-            time_est_ms = int(task["time_estimate"]) if task.get("time_estimate") else None
-        except (ValueError, TypeError):
-            time_est_ms = None
-        time_str = _ms_to_hours_str(time_est_ms) if time_est_ms else ""
-
-        # Select checkbox — col 0
-        sel_cell = inputs.addBoolValueInput(f"sel_{tid}", "", True, "", False)
-        sel_cell.tooltip = task_name
-        sel_cell.tooltipDescription = (
-            "Check to edit the details (description, time estimate, assignee) for this task."
-            + (f'<br><a href="{task_url}">Open in ClickUp</a>' if task_url else "")
+
+def _task_original(task: dict) -> dict:
+    """Return the fields of *task* kept for change detection and the detail panel."""
+    due_ms = task.get("due_date")
+    try:
+        due_ms = int(due_ms) if due_ms else None
+    except (ValueError, TypeError):
+        due_ms = None
+
+    # Due date: ms timestamp → YYYY-MM-DD
+    try:
+        due_str = (
+            datetime.fromtimestamp(due_ms / 1000).strftime("%Y-%m-%d")
+            if due_ms
+            else ""
         )
+    except (ValueError, TypeError, OSError):
+        due_str = ""
+
+    pri_raw = task.get("priority") or {}
+    try:
+        pri_int = int(pri_raw.get("id", 0)) or None
+    except (ValueError, TypeError):
+        pri_int = None
 
-        # Name cell — editable text with link in tooltip — col 1
-        name_cell = inputs.addStringValueInput(f"name_{tid}", "", task_name)
-        name_cell.tooltip = "Task Name"
-        name_cell.tooltipDescription = f"Edit the task name.<br>" + (
-            f'<a href="{task_url}">Open in ClickUp</a>' if task_url else ""
+    try:
+        time_est_ms = (
+            int(task["time_estimate"]) if task.get("time_estimate") else None
         )
+    except (ValueError, TypeError):
+        time_est_ms = None
+
+    raw_assignees = task.get("assignees", [])
+    return {
+        "name": task.get("name", ""),
+        "due_ms": due_ms,
+        "due_str": due_str,
+        "priority": pri_int,
+        "status": task.get("status", {}).get("status", "").lower(),
+        "description": (task.get("description") or "").strip(),
+        "time_estimate_ms": time_est_ms,
+        "is_private": bool(task.get("is_private", False)),
+        "assignee_ids": [int(a["id"]) for a in raw_assignees if a.get("id")],
+        "url": task.get("url", ""),
+    }
 
-        # Due date cell — editable text — col 2
-        due_cell = inputs.addStringValueInput(f"due_{tid}", "", due_str)
-        due_cell.tooltip = "Due Date"
-        due_cell.tooltipDescription = "Enter a date in <b>YYYY-MM-DD</b> format, or leave blank to clear the due date."
 
-        # Priority cell — drop-down — col 3
-        pri_cell = inputs.addDropDownCommandInput(
-            f"priority_{tid}",
+def _task_value(original: dict) -> dict:
+    """Return the table cells' values for a task as loaded (see _task_original)."""
+    return {
+        "name": original["name"],
+        "due": original["due_str"],
+        "priority": _PRIORITY_INT_TO_LABEL.get(original["priority"], "Normal"),
+        "status": original["status"],
+    }
+
+
+def _on_doc_tasks(tasks: list) -> None:
+    """Main thread: the synced document tasks arrived — refresh the rows the user has not touched.
+
+    Edited rows, rows with detail-panel edits and the selected row keep what
+    the dialog shows; the others are replaced, added or dropped.
+    """
+    global _selected_task_id
+    inputs = _command_inputs
+    if inputs is None or _pager is None:
+        return
+    tasks.sort(key=cutil.priority_order)
+    _pager.capture(inputs)
+    kept = _dirty_task_ids | set(_pending_edits) | {_selected_task_id}
+    originals = {task.get("id", ""): _task_original(task) for task in tasks}
+    keys = list(originals) + [t for t in _pager.keys if t in kept and t not in originals]
+    if keys == _pager.keys and all(
+        t in kept or _task_originals.get(t) == original for t, original in originals.items()
+    ):
+        log.info("refresh found no changes.")
+        return
+
+    log.info("refresh changed the list — redrawing %s row(s).", len(keys))
+    # The redraw unchecks every row, so release the selection as a page turn does
+    if _selected_task_id:
+        _store_pending_edits(inputs, _selected_task_id)
+        _selected_task_id = ""
+        _clear_detail_controls(inputs)
+    for tid in [t for t in _task_originals if t not in keys]:
+        del _task_originals[tid]
+        _task_values.pop(tid, None)
+    for tid, original in originals.items():
+        if tid not in kept:
+            _task_originals[tid] = original
+            _task_values[tid] = _task_value(original)
+    _pager.set_rows(inputs, keys)
+    header = inputs.itemById("doc_tasks_header")
+    if header:
+        header.formattedText = f"<b>Tasks Linked to This Document</b> ({len(keys)})"
+
+
+def _on_doc_tasks_failed(exc: Exception) -> None:
+    """Main thread: the refresh failed — keep the mirrored rows."""
+    log.warning("background refresh failed: %s", exc)
+
+
+def _add_task_row(
+    inputs: adsk.core.CommandInputs,
+    table: adsk.core.TableCommandInput,
+    row: int,
+    tid: str,
+) -> None:
+    """Build the six inputs of task *tid* at table row *row* from _task_values."""
+    values = _task_values[tid]
+    task_name = values["name"]
+    task_url = _task_originals[tid].get("url", "")
+    status_str = values["status"]
+
+    # Time estimate — pending detail-panel edit, else the original
+    if tid in _pending_edits:
+        time_str = _pending_edits[tid].get("time_hours", "")
+    else:
+        time_str = _ms_to_hours_str(_task_originals[tid].get("time_estimate_ms"))
+
+    # Select checkbox — col 0
+    sel_cell = inputs.addBoolValueInput(f"sel_{tid}", "", True, "", False)
+    sel_cell.tooltip = task_name
+    sel_cell.tooltipDescription = (
+        "Check to edit the details (description, time estimate, assignee) for this task."
+        + (f'<br><a href="{task_url}">Open in ClickUp</a>' if task_url else "")
+    )
+
+    # Name cell — editable text with link in tooltip — col 1
+    name_cell = inputs.addStringValueInput(f"name_{tid}", "", task_name)
+    name_cell.tooltip = "Task Name"
+    name_cell.tooltipDescription = f"Edit the task name.<br>" + (
+        f'<a href="{task_url}">Open in ClickUp</a>' if task_url else ""
+    )
+
+    # Due date cell — editable text — col 2
+    due_cell = inputs.addStringValueInput(f"due_{tid}", "", values["due"])
+    due_cell.tooltip = "Due Date"
+    due_cell.tooltipDescription = "Enter a date in <b>YYYY-MM-DD</b> format, or leave blank to clear the due date."
+
+    # Priority cell — drop-down — col 3
+    pri_cell = inputs.addDropDownCommandInput(
+        f"priority_{tid}",
+        "",
+        adsk.core.DropDownStyles.TextListDropDownStyle,
+    )
+    pri_cell.tooltip = "Priority"
+    pri_cell.tooltipDescription = "Set the ClickUp task priority."
+    for opt in _PRIORITY_OPTIONS:
+        pri_cell.listItems.add(opt, opt == values["priority"])
+
+    # Status cell — dropdown if we have API-sourced options, else read-only — col 4
+    if _list_lookup.statuses:
+        status_cell = inputs.addDropDownCommandInput(
+            f"status_{tid}",
             "",
             adsk.core.DropDownStyles.TextListDropDownStyle,
         )
-        pri_cell.tooltip = "Priority"
-        pri_cell.tooltipDescription = "Set the ClickUp task priority."
-        for opt in _PRIORITY_OPTIONS:
-            pri_cell.listItems.add(opt, opt == pri_label)
-
-        # Status cell — dropdown if we have API-sourced options, else read-only — col 4
-        if status_options:
-            status_cell = inputs.addDropDownCommandInput(
-                f"status_{tid}",
-                "",
-                adsk.core.DropDownStyles.TextListDropDownStyle,
-            )
-            status_cell.tooltip = "Status"
-            status_cell.tooltipDescription = "Set the ClickUp task status."
-            matched = False
-            for opt in status_options:
-                opt_name = opt.get("status", "")
-                is_selected = opt_name.lower() == status_str
-                status_cell.listItems.add(opt_name.title(), is_selected)
-                if is_selected:
-                    matched = True
-            # If nothing matched, force-select the first item
-            if not matched and status_cell.listItems.count > 0:
-                status_cell.listItems.item(0).isSelected = True
-        else:
-            status_cell = inputs.addStringValueInput(
-                f"status_{tid}", "", status_str.title() or "—"
-            )
-            status_cell.isReadOnly = True
-            status_cell.tooltip = "Status"
-            status_cell.tooltipDescription = "Status could not be fetched from ClickUp."
-
-        # Time estimate cell — read-only display; select row to edit in the detail panel — col 5
-        time_cell = inputs.addStringValueInput(f"time_{tid}", "", time_str or "—")
-        time_cell.isReadOnly = True
-        time_cell.tooltip = "Time Estimate"
-        time_cell.tooltipDescription = (
-            "Estimated time in hours. Select this row to edit the time estimate in the detail panel below."
+        status_cell.tooltip = "Status"
+        status_cell.tooltipDescription = "Set the ClickUp task status."
+        # If nothing matches, select the first item
+        selected = max(_list_lookup.status_position(status_str), 0)
+        for i, label in enumerate(_list_lookup.status_options):
+            status_cell.listItems.add(label, i == selected)
+    else:
+        status_cell = inputs.addStringValueInput(
+            f"status_{tid}", "", status_str.title() or "—"
         )
+        status_cell.isReadOnly = True
+        status_cell.tooltip = "Status"
+        status_cell.tooltipDescription = "Status could not be fetched from ClickUp."
+
+    # Time estimate cell — read-only display; select row to edit in the detail panel — col 5
+    time_cell = inputs.addStringValueInput(f"time_{tid}", "", time_str or "—")
+    time_cell.isReadOnly = True
+    time_cell.tooltip = "Time Estimate"
+    time_cell.tooltipDescription = (
+        "Estimated time in hours. Select this row to edit the time estimate in the detail panel below."
+    )
+
+    table.addCommandInput(sel_cell, row, 0)
+    table.addCommandInput(name_cell, row, 1)
+    table.addCommandInput(due_cell, row, 2)
+    table.addCommandInput(pri_cell, row, 3)
+    table.addCommandInput(status_cell, row, 4)
+    table.addCommandInput(time_cell, row, 5)
+
+
+def _read_task_row(inputs: adsk.core.CommandInputs, tid: str) -> None:
+    """Copy task *tid*'s name, due date, priority and status inputs back into _task_values."""
+    for prefix, field in _ROW_FIELDS:
+        cell = inputs.itemById(f"{prefix}{tid}")
+        if cell is not None:
+            _note_row_edit(tid, field, _cell_value(cell, field))
+
+
+# Editable table cells: input id prefix → _task_values field
+_ROW_FIELDS = (("name_", "name"), ("due_", "due"), ("priority_", "priority"), ("status_", "status"))
+
 
-        table.addCommandInput(sel_cell, i, 0)
-        table.addCommandInput(name_cell, i, 1)
-        table.addCommandInput(due_cell, i, 2)
-        table.addCommandInput(pri_cell, i, 3)
-        table.addCommandInput(status_cell, i, 4)
-        table.addCommandInput(time_cell, i, 5)
+def _cell_value(cell: adsk.core.CommandInput, field: str):
+    """Return the model value shown by a table cell, or None when it cannot be edited."""
+    if field in ("priority", "status"):
+        # The read-only status fallback (no statuses from ClickUp) has no selectedItem
+        item = getattr(cell, "selectedItem", None)
+        if item is None:
+            return None
+        return item.name.lower() if field == "status" else item.name
+    return cell.value
 
 
+def _note_row_edit(tid: str, field: str, value) -> None:
+    """Record an edited table cell: update the model, mark the row dirty, parse due dates once."""
+    values = _task_values.get(tid)
+    if values is None or value is None or values[field] == value:
+        return
+    values[field] = value
+    _dirty_task_ids.add(tid)
+    if field != "due":
+        return
+    due_str = value.strip()
+    if due_str == _task_originals[tid]["due_str"]:
+        # Back to what was loaded — not a due-date change
+        _parsed_due.pop(tid, None)
+        _invalid_due_ids.discard(tid)
+        return
+    due_ms = _date_to_unix_ms(due_str) if due_str else None
+    _parsed_due[tid] = due_ms
+    if due_str and due_ms is None:
+        _invalid_due_ids.add(tid)
+    else:
+        _invalid_due_ids.discard(tid)
+
+
+@cutil.traced(CMD_NAME)
 def command_execute(args: adsk.core.CommandEventArgs):
-    """Called when the user clicks OK — PATCHes any changed tasks."""
-    futil.log(f"{CMD_NAME}: Execute — scanning for changed fields.")
+    """Called when the user clicks OK — sends every changed task to ClickUp concurrently."""
+    log.info("Execute — scanning for changed fields.")
 
     inputs = args.command.commandInputs
-    updated = 0
-    errors = 0
 
     # Auto-apply any unsaved detail-panel edits for the currently selected row
     if _selected_task_id:
         _store_pending_edits(inputs, _selected_task_id)
 
-    for task_id, original in _task_originals.items():
+    payloads = _collect_task_payloads(inputs)
+    if not payloads:
+        ui.messageBox("No changes were made.", CMD_NAME)
+        return
 
-        # ---- Read current dialog values ----
-        name_input = inputs.itemById(f"name_{task_id}")
-        due_input = inputs.itemById(f"due_{task_id}")
-        pri_input = inputs.itemById(f"priority_{task_id}")
-        status_input = inputs.itemById(f"status_{task_id}")
+    results = cutil.update_tasks(payloads, _api_token)
+    # Write-through so the mirror reflects the saves (and drops deleted or
+    # moved tasks) before the next ClickUp sync.
+    try:
+        cutil.get_task_mirror(_list_id).record_updates(results)
+    except Exception as exc:
+        log.warning("task mirror write-through failed (non-fatal): %s", exc)
+    updated = sum(1 for r in results if r.ok)
+    failed = [r for r in results if not r.ok]
 
-        new_name = getattr(name_input, "value", original["name"]).strip()
+    # ---- Summary feedback ----
+    if not failed:
+        ui.messageBox(
+            f"{updated} task(s) updated successfully.",
+            CMD_NAME,
+        )
+    else:
+        failed_lines = "\n".join(
+            f"  • {_task_originals.get(r.task_id, {}).get('name', r.task_id)}"
+            f" — {f'HTTP {r.status_code}' if r.status_code else r.error}"
+            for r in failed
+        )
+        ui.messageBox(
+            f"{updated} task(s) updated, {len(failed)} failed:\n\n{failed_lines}\n\n"
+            "Check the Fusion add-in log for details.",
+            CMD_NAME,
+        )
 
-        new_due_str = getattr(due_input, "value", "").strip()
-        new_due_ms = _date_to_unix_ms(new_due_str) if new_due_str else None
 
-        new_pri_label = (
-            pri_input.selectedItem.name
-            if pri_input and pri_input.selectedItem
-            else "Normal"
-        )
+def _collect_task_payloads(inputs: adsk.core.CommandInputs) -> dict:
+    """Diff the dialog against _task_originals and return {task_id: update payload}.
+
+    Only tasks with at least one changed field are included.
+    """
+    if _pager is not None:
+        _pager.capture(inputs)
+    payloads: dict = {}
+
+    # Only rows the user touched; everything else still matches _task_originals
+    for task_id in _dirty_task_ids:
+        original = _task_originals[task_id]
+        values = _task_values[task_id]
+
+        new_name = values["name"].strip()
+
+        new_pri_label = values["priority"]
         new_pri_int = _PRIORITY_LABEL_TO_INT.get(new_pri_label, 3)
 
-        # Status — read from dropdown (or string if fallback)
-        if (
-            status_input
-            and hasattr(status_input, "selectedItem")
-            and status_input.selectedItem
-        ):
-            new_status = status_input.selectedItem.name.lower()
-        elif status_input and hasattr(status_input, "value"):
-            new_status = getattr(status_input, "value", "").lower()
-        else:
-            new_status = original.get("status", "")
+        new_status = values["status"]
 
         # ---- Detect changes ----
         payload: dict = {}
 
         if new_name and new_name != original["name"]:
             payload["name"] = new_name
-            futil.log(f"{CMD_NAME}: [{task_id}] name changed → '{new_name}'")
+            log.info("[%s] name changed → '%s'", task_id, new_name)
 
-        if new_due_ms != original["due_ms"]:
+        if task_id in _parsed_due:
+            new_due_ms = _parsed_due[task_id]
             if new_due_ms is not None:
                 payload["due_date"] = new_due_ms
                 payload["due_date_time"] = False
-                futil.log(f"{CMD_NAME}: [{task_id}] due_date changed → {new_due_ms}ms")
+                log.info("[%s] due_date changed → %sms", task_id, new_due_ms)
             else:
                 # Clearing the due date: pass null
                 payload["due_date"] = None
-                futil.log(f"{CMD_NAME}: [{task_id}] due_date cleared")
+                log.info("[%s] due_date cleared", task_id)
 
-        if new_pri_int != original["priority"]:
+        if new_pri_label != _PRIORITY_INT_TO_LABEL.get(original["priority"], "Normal"):
             payload["priority"] = new_pri_int
-            futil.log(
-                f"{CMD_NAME}: [{task_id}] priority changed → {new_pri_int} ({new_pri_label})"
+            log.info(
+                "[%s] priority changed → %s (%s)", task_id, new_pri_int, new_pri_label
             )
 
         if new_status and new_status != original.get("status", ""):
             payload["status"] = new_status
-            futil.log(f"{CMD_NAME}: [{task_id}] status changed → '{new_status}'")
+            log.info("[%s] status changed → '%s'", task_id, new_status)
 
         # ---- Description (from pending edits) ----
         if task_id in _pending_edits:
             new_desc = (_pending_edits[task_id].get("desc", "") or "").strip()
             if new_desc != (original.get("description", "") or "").strip():
                 payload["description"] = new_desc
-                futil.log(f"{CMD_NAME}: [{task_id}] description changed")
+                log.info("[%s] description changed", task_id)
 
         # ---- Time estimate (from pending edits) ----
         if task_id in _pending_edits:
@@ -609,101 +704,91 @@ def command_execute(args: adsk.core.CommandEventArgs):
             orig_est_ms = original.get("time_estimate_ms") or 0
             if new_est_ms != orig_est_ms:
                 payload["time_estimate"] = new_est_ms
-                futil.log(
-                    f"{CMD_NAME}: [{task_id}] time_estimate changed → {new_est_ms}ms"
-                )
+                log.info("[%s] time_estimate changed → %sms", task_id, new_est_ms)
 
         # ---- Private (from pending edits) ----
         if task_id in _pending_edits:
             new_private = bool(_pending_edits[task_id].get("is_private", False))
             if new_private != original.get("is_private", False):
                 payload["is_private"] = new_private
-                futil.log(f"{CMD_NAME}: [{task_id}] is_private changed → {new_private}")
+                log.info("[%s] is_private changed → %s", task_id, new_private)
 
         # ---- Assignee (from pending edits) ----
         if task_id in _pending_edits:
             selected_name = _pending_edits[task_id].get(
                 "assignee_name", "— Unassigned —"
             )
-            new_assignee_id = 0
-            for member in _list_members:
-                if member["username"] == selected_name:
-                    new_assignee_id = member["id"]
-                    break
+            new_assignee_id = _list_lookup.member_id(selected_name)
             orig_assignee_ids = original.get("assignee_ids", [])
             orig_first_id = orig_assignee_ids[0] if orig_assignee_ids else 0
             if new_assignee_id != orig_first_id:
                 add_ids = [new_assignee_id] if new_assignee_id else []
                 rem_ids = [orig_first_id] if orig_first_id else []
                 payload["assignees"] = {"add": add_ids, "rem": rem_ids}
-                futil.log(
-                    f"{CMD_NAME}: [{task_id}] assignees changed → "
-                    f"add={add_ids} rem={rem_ids}"
+                log.info(
+                    "[%s] assignees changed → add=%s rem=%s", task_id, add_ids, rem_ids
                 )
 
         if not payload:
-            futil.log(f"{CMD_NAME}: [{task_id}] no changes — skipping.")
+            log.info("[%s] no changes — skipping.", task_id)
             continue
 
-        # ---- PATCH ClickUp task ----
-        ok = _patch_task(task_id, payload, _api_token)
-        if ok:
-            updated += 1
-        else:
-            errors += 1
+        payloads[task_id] = payload
 
-    # ---- Summary feedback ----
-    if updated == 0 and errors == 0:
-        ui.messageBox("No changes were made.", CMD_NAME)
-    elif errors == 0:
-        ui.messageBox(
-            f"{updated} task(s) updated successfully.",
-            CMD_NAME,
-        )
-    else:
-        ui.messageBox(
-            f"{updated} task(s) updated, {errors} failed.\n\n"
-            "Check the Fusion add-in log for details.",
-            CMD_NAME,
-        )
+    return payloads
 
 
+@cutil.traced(CMD_NAME)
 def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
-    """Validate due-date fields — must be blank or a valid YYYY-MM-DD."""
-    inputs = args.inputs
-
-    for task_id in _task_originals:
-        due_input = inputs.itemById(f"due_{task_id}")
-        if due_input is None:
-            continue
-        val = getattr(due_input, "value", "").strip()
-        if val and _date_to_unix_ms(val) is None:
-            args.areInputsValid = False
-            return
+    """Due dates must be blank or a valid YYYY-MM-DD.
 
-    args.areInputsValid = True
+    Each due cell is parsed once, when command_input_changed sees it edited,
+    so this runs in constant time however many rows the table has.
+    """
+    args.areInputsValid = not _invalid_due_ids
 
 
+@cutil.traced(CMD_NAME, end=True)
 def command_destroy(args: adsk.core.CommandEventArgs):
     """Called when the dialog closes — clears handler references."""
-    futil.log(f"{CMD_NAME}: Destroyed. Clearing handlers.")
-    global local_handlers
+    log.info("Destroyed. Clearing handlers.")
+    global local_handlers, _pager, _command_inputs
+    # A refresh still in flight must not touch the closed dialog's inputs
+    cutil.cancel_background(CMD_ID)
+    _command_inputs = None
     local_handlers = []
+    _pager = None
 
 
+@cutil.traced(CMD_NAME)
 def command_input_changed(args: adsk.core.InputChangedEventArgs):
     """Handles table row selection, the Apply button, and the detail-panel assignee toggle."""
     global _selected_task_id, _pending_edits
     changed = args.input
     inputs = args.inputs
 
+    # ---- Previous / Next page — keep the selected row's detail edits ----
+    if _pager is not None and _pager.is_nav_input(changed.id):
+        if _selected_task_id:
+            _store_pending_edits(inputs, _selected_task_id)
+            _selected_task_id = ""
+            _clear_detail_controls(inputs)
+        _pager.turn_page(inputs, changed)
+        return
+
+    # ---- Editable table cells — record the edit against its row ----
+    for prefix, field in _ROW_FIELDS:
+        if changed.id.startswith(prefix):
+            _note_row_edit(changed.id[len(prefix):], field, _cell_value(changed, field))
+            return
+
     # ---- Row selection via sel_{tid} checkboxes ----
     if changed.id.startswith("sel_"):
         tid = changed.id[4:]
         if getattr(changed, "value", False):
             # New row selected — update tracking first, then deselect any other row
             _selected_task_id = tid
-            for other_tid in _task_originals:
+            for other_tid in _pager.visible_keys() if _pager else ():
                 if other_tid != tid:
                     other_sel = inputs.itemById(f"sel_{other_tid}")
                     if other_sel and getattr(other_sel, "value", False):
@@ -737,6 +822,7 @@ def command_input_changed(args: adsk.core.InputChangedEventArgs):
                 if due_input:
                     # Strip any time component so the table cell shows YYYY-MM-DD
                     due_input.value = _quick_date_options[idx][1].split(" ")[0]
+                    _note_row_edit(_selected_task_id, "due", due_input.value)
         return
 
     # ---- Apply button ----
@@ -779,11 +865,7 @@ def _get_member_name(assignee_ids: list) -> str:
     """Return the username of the first assignee ID, or '— Unassigned —'."""
     if not assignee_ids:
         return "— Unassigned —"
-    first_id = assignee_ids[0]
-    for member in _list_members:
-        if member["id"] == first_id:
-            return member["username"]
-    return "— Unassigned —"
+    return _list_lookup.member_name(assignee_ids[0], "— Unassigned —")
 
 
 def _populate_detail_controls(inputs: adsk.core.CommandInputs, tid: str) -> None:
@@ -823,15 +905,10 @@ def _populate_detail_controls(inputs: adsk.core.CommandInputs, tid: str) -> None
     assignee_ctrl = inputs.itemById("detail_assignee")
     if assignee_ctrl:
         assignee_ctrl.isEnabled = True
-        matched = False
-        for i in range(assignee_ctrl.listItems.count):
-            item = assignee_ctrl.listItems.item(i)
-            is_match = item.name == assignee_name
-            item.isSelected = is_match
-            if is_match:
-                matched = True
-        if not matched and assignee_ctrl.listItems.count > 0:
-            assignee_ctrl.listItems.item(0).isSelected = True
+        # Item 0 is '— Unassigned —', then one item per member in member_options order
+        position = _list_lookup.member_position(assignee_name)
+        if assignee_ctrl.listItems.count > 0:
+            assignee_ctrl.listItems.item(position + 1).isSelected = True
 
     private_ctrl = inputs.itemById("detail_private")
     if private_ctrl:
@@ -904,13 +981,14 @@ def _store_pending_edits(inputs: adsk.core.CommandInputs, tid: str) -> None:
     )
     is_private = bool(getattr(private_ctrl, "value", False)) if private_ctrl else False
 
+    _dirty_task_ids.add(tid)
     _pending_edits[tid] = {
         "desc": desc,
         "time_hours": time_hours,
         "assignee_name": assignee_name,
         "is_private": is_private,
     }
-    futil.log(f"{CMD_NAME}: Stored pending edits for task '{tid}'.")
+    log.info("Stored pending edits for task '%s'.", tid)
 
 
 # ---------------------------------------------------------------------------
@@ -918,202 +996,93 @@ def _store_pending_edits(inputs: adsk.core.CommandInputs, tid: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _patch_task(task_id: str, payload: dict, api_token: str) -> bool:
-    """PATCH /api/v2/task/{task_id} with *payload*.
-
-    Returns True on success (2xx), False otherwise.
-    ClickUp docs: https://developer.clickup.com/reference/updatetask
-    """
-    url = f"{CLICKUP_API_BASE}/task/{task_id}"
-    body = json.dumps(payload)
-    futil.log(f"{CMD_NAME}: _patch_task — PATCH '{url}' body={body}")
-
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.PutMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Content-Type", "application/json")
-        req.setHeader("Accept", "application/json")
-        req.data = body
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _patch_task [{task_id}] — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(
-                f"{CMD_NAME}: _patch_task [{task_id}] — error body: {response.data}"
-            )
-            return False
-        return True
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _patch_task [{task_id}] — exception: {exc}")
-        return False
-
-
-def _load_api_token() -> str:
-    """Read the ClickUp API token from cache/auth.json."""
-    if not os.path.isfile(AUTH_JSON_PATH):
-        return ""
-    try:
-        with open(AUTH_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return data.get("clickup_api_token", "").strip()
-
-
-def _load_list_id_for_project(project_urn: str) -> str:
-    """Return the clickup_list_id for the given project URN from projects.json."""
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        return ""
-    try:
-        with open(PROJECTS_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return (
-        data.get("projects", {}).get(project_urn, {}).get("clickup_list_id", "").strip()
-    )
+def _get_urn_custom_field_id(list_id: str, api_token: str) -> str:
+    """Return the field ID of the 'Fusion Document URN' custom field on the given list."""
+    TARGET_NAME = "Fusion Document URN"
+    field_id = cutil.find_custom_field_id(list_id, api_token, TARGET_NAME)
+    if not field_id:
+        log.info("_get_urn_custom_field_id — '%s' not found.", TARGET_NAME)
+    return field_id
 
 
-def _load_clickup_url_for_project(project_urn: str) -> str:
-    """Return the clickup_url for the given project URN from projects.json."""
-    if not os.path.isfile(PROJECTS_JSON_PATH):
-        return ""
-    try:
-        with open(PROJECTS_JSON_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
-        return ""
-    return data.get("projects", {}).get(project_urn, {}).get("clickup_url", "").strip()
+def _fetch_doc_tasks(list_id: str, api_token: str, urn_field_id: str, doc_urn: str) -> list:
+    """Worker thread: bring the task mirror up to date and return the document's tasks.
 
+    A delta sync (date_updated_gt); if it fails the last mirrored copy is served.
+    """
+    with cutil.perf_timer("_sync_task_mirror", CMD_NAME):
+        mirror = cutil.sync_task_mirror(list_id, api_token)
+    return _fetch_tasks_for_urn(mirror, urn_field_id, doc_urn)
 
-def _get_urn_custom_field_id(list_id: str, api_token: str) -> str:
-    """Return the field ID of the 'Fusion Document URN' custom field on the given list."""
-    TARGET_NAME = "Fusion Document URN"
-    fields_url = f"{CLICKUP_API_BASE}/list/{list_id}/field"
-    futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — querying list '{list_id}'")
 
-    try:
-        req = adsk.core.HttpRequest.create(fields_url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-
-        if not (200 <= response.statusCode < 300):
-            futil.log(
-                f"{CMD_NAME}: _get_urn_custom_field_id — HTTP {response.statusCode}: {response.data}"
-            )
-            return ""
+def _fetch_tasks_for_urn(mirror, urn_field_id: str, doc_urn: str) -> list:
+    """Return the mirrored tasks whose Fusion Document URN field equals *doc_urn* exactly.
 
-        fields = json.loads(response.data).get("fields", [])
-        matched = next((f for f in fields if f.get("name") == TARGET_NAME), None)
-        if matched:
-            return matched.get("id", "")
+    An indexed lookup in the local task mirror — no network.
+    """
+    tasks = mirror.tasks_with_field_value(urn_field_id, doc_urn)
+    log.info("_fetch_tasks_for_urn — %s task(s) from mirror", len(tasks))
+    return tasks
 
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — '{TARGET_NAME}' not found.")
-        return ""
 
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _get_urn_custom_field_id — exception: {exc}")
-        return ""
+def _bootstrap_requests(list_id: str, doc_urn: str, api_token: str) -> dict:
+    """Run the dialog's startup requests concurrently and return their results.
 
+    Statuses, members and the URN field id do not depend on each other, so
+    each gets its own worker; the critical path is the slowest single
+    request instead of their sum. The document's tasks are read from the
+    task mirror as last synced — the sync itself runs after the dialog is
+    up (see _fetch_doc_tasks) and is skipped when the list has no URN
+    field. Each request and the total are timed through cutil.perf_timer.
+    """
 
-def _fetch_tasks_for_urn(
-    list_id: str, urn_field_id: str, doc_urn: str, api_token: str
-) -> list:
-    """GET /api/v2/list/{list_id}/task filtered by the Fusion Document URN field."""
-    cf_filter = json.dumps(
-        [{"field_id": urn_field_id, "operator": "=", "value": doc_urn}]
-    )
-    params = urlencode(
-        {
-            "custom_field": cf_filter,
-            "page": 0,
-            "include_closed": "true",
+    def _timed(fn, *fn_args):
+        with cutil.perf_timer(fn.__name__, CMD_NAME):
+            return fn(*fn_args)
+
+    with ThreadPoolExecutor(
+        max_workers=3, thread_name_prefix="updateTasks-bootstrap"
+    ) as pool:
+        statuses = pool.submit(_timed, _fetch_list_statuses, list_id, api_token)
+        members = pool.submit(_timed, _fetch_list_members, list_id, api_token)
+        urn_field = pool.submit(_timed, _get_urn_custom_field_id, list_id, api_token)
+
+        urn_field_id = urn_field.result()
+        doc_tasks = (
+            _timed(_fetch_tasks_for_urn, cutil.get_task_mirror(list_id), urn_field_id, doc_urn)
+            if urn_field_id
+            else []
+        )
+        return {
+            "statuses": statuses.result(),
+            "members": members.result(),
+            "urn_field_id": urn_field_id,
+            "doc_tasks": doc_tasks,
         }
-    )
-    url = f"{CLICKUP_API_BASE}/list/{list_id}/task?{params}"
-    futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — GET")
-
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — error: {response.data}")
-            return []
-        return json.loads(response.data).get("tasks", [])
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_tasks_for_urn — exception: {exc}")
-        return []
 
 
 def _fetch_list_statuses(list_id: str, api_token: str) -> list:
-    """GET /api/v2/list/{list_id} and return its statuses array.
+    """Return the list's statuses sorted by orderindex, via the shared list-metadata cache.
 
     Each item is a dict like: {"status": "in progress", "color": "#...", ...}.
     Returns an empty list on any failure.
     ClickUp docs: https://developer.clickup.com/reference/getlist
     """
-    url = f"{CLICKUP_API_BASE}/list/{list_id}"
-    futil.log(f"{CMD_NAME}: _fetch_list_statuses — GET '{url}'")
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_list_statuses — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_list_statuses — error: {response.data}")
-            return []
-        data = json.loads(response.data)
-        statuses = data.get("statuses", [])
-        # Sort by orderindex so the dropdown matches the ClickUp order
-        statuses.sort(key=lambda s: s.get("orderindex", 0))
-        return statuses
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_list_statuses — exception: {exc}")
-        return []
+    statuses = cutil.get_list_statuses(list_id, api_token)
+    log.info("_fetch_list_statuses — %s status(es)", len(statuses))
+    return statuses
 
 
 def _fetch_list_members(list_id: str, api_token: str) -> list:
-    """GET /api/v2/list/{list_id}/member and return a sorted list of user dicts.
+    """Return the list members sorted by username, via the shared list-metadata cache.
 
     Each returned item has: {"id": int, "username": str, "email": str}.
     Returns an empty list on any failure.
     ClickUp docs: https://developer.clickup.com/reference/getlistmembers
     """
-    url = f"{CLICKUP_API_BASE}/list/{list_id}/member"
-    futil.log(f"{CMD_NAME}: _fetch_list_members — GET '{url}'")
-    try:
-        req = adsk.core.HttpRequest.create(url, adsk.core.HttpMethods.GetMethod)
-        req.setHeader("Authorization", api_token)
-        req.setHeader("Accept", "application/json")
-        response = req.executeSync()
-        futil.log(f"{CMD_NAME}: _fetch_list_members — HTTP {response.statusCode}")
-        if not (200 <= response.statusCode < 300):
-            futil.log(f"{CMD_NAME}: _fetch_list_members — error: {response.data}")
-            return []
-        data = json.loads(response.data)
-        members = []
-        for item in data.get("members", []):
-            # API may return flat dicts or dicts nested under "user"
-            user = item.get("user", item)
-            uid = user.get("id")
-            if not uid:
-                continue
-            members.append(
-                {
-                    "id": int(uid),
-                    "username": (user.get("username") or user.get("email") or str(uid)),
-                    "email": user.get("email", ""),
-                }
-            )
-        members.sort(key=lambda m: m["username"].lower())
-        return members
-    except Exception as exc:
-        futil.log(f"{CMD_NAME}: _fetch_list_members — exception: {exc}")
-        return []
+    members = cutil.get_list_members(list_id, api_token)
+    log.info("_fetch_list_members — %s member(s)", len(members))
+    return members
 
 
 def _date_to_unix_ms(date_str: str):
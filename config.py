@@ -29,10 +29,41 @@ clickup_panel_after = ""
 settings_flyout_id = "PlusProjectSettings"
 settings_flyout_name = "Plus Project Settings"
 
-# Cache folder (holds projects.json, auth.json, etc.)
+# Rows per page in the List Tasks / Update Tasks tables; only the visible
+# page's row inputs are created, so dialog build time does not grow with the list
+TASK_TABLE_PAGE_SIZE = 25
+
+# Command logging (cutil.get_logger). LOG_LEVEL is "debug", "info", "warning",
+# "error" or "off"; LOG_MODULE_LEVELS overrides it per command name, e.g.
+# {"Update Tasks": "info"}. Console output still requires DEBUG.
+LOG_LEVEL = "debug"
+LOG_MODULE_LEVELS = {}
+
+# Also write command log lines to cache/logs/plusproject.log (rotated by size)
+LOG_TO_FILE = False
+
+# Record latency / traffic metrics for timed blocks and HTTP calls; stop()
+# folds each session into cache/metrics/metrics.json and metrics.csv
+METRICS_ENABLED = True
+
+# Record Chrome trace-event spans (handlers, HTTP requests, timed blocks,
+# background work); each dialog writes cache/traces/<command>-<time>.json
+TRACE_ENABLED = False
+
+# HTTP cassette: "record" appends every ClickUp/TinyURL exchange to
+# HTTP_CASSETTE_PATH, "replay" answers requests from it without the network
+# (waiting the recorded latency unless HTTP_REPLAY_REALTIME is False); "" is off
+HTTP_CASSETTE_MODE = ""
+HTTP_CASSETTE_PATH = ""  # default: cache/cassettes/session.jsonl
+HTTP_REPLAY_REALTIME = True
+
+# Cache folder (holds projects.sqlite, auth.json, etc.)
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
 
-# Projects JSON file path
+# Project mapping database (project URN → ClickUp list)
+PROJECTS_DB_PATH = os.path.join(CACHE_DIR, "projects.sqlite")
+
+# Legacy projects JSON file — imported into PROJECTS_DB_PATH, no longer written
 PROJECTS_JSON_PATH = os.path.join(CACHE_DIR, "projects.json")
 
 # Auth JSON file path
@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+# clickupUtils — ClickUp-specific helpers shared by the PlusProject commands.
+# Unlike fusionAddInUtils this package is owned by this add-in only, so it is
+# free to grow with the ClickUp integration. Commands import it as `cutil`.
+from .tracing import *
+from .metrics import *
+from .cassette import *
+from .http_client import *
+from .pagination import *
+from .bulk_update import *
+from .rate_limit import *
+from .list_metadata import *
+from .list_lookup import *
+from .task_index import *
+from .task_mirror import *
+from .background import *
+from .lazy_log import *
+from .pipeline import *
+from .short_url_cache import *
+from .multipart import *
+from .thumbnail_cache import *
+from .config_store import *
+from .project_store import *
@@ -0,0 +1,295 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Background worker pool with main-thread result delivery.
+
+Fusion's API may only be touched from the main (UI) thread, but network I/O
+run there freezes the application. Work submitted here runs on a small
+thread pool; when it finishes, its result is queued and a Fusion custom
+event is fired. The event handler runs on the main thread, drains the queue
+and invokes each task's `on_done` / `on_error` callback — so callbacks may
+update dialogs, show message boxes, and call any adsk API.
+
+Usage:
+    def _loaded(tasks):
+        _populate_table(tasks)          # main thread
+
+    cutil.submit_background(
+        _fetch_all_tasks, list_id, api_token,
+        on_done=_loaded, owner=CMD_ID,
+    )
+
+    # command_destroy: drop results nobody is waiting for any more
+    cutil.cancel_background(CMD_ID)
+
+`call_later_on_main_thread(delay, callback)` re-enters the main thread after
+a delay without blocking it, e.g. to poll a Fusion DataObjectFuture.
+
+Cancellation is cooperative: a cancelled task that has not started never
+runs, and a running task's callbacks are suppressed. Long-running work may
+poll `task.cancelled` (pass `pass_task=True` to receive the task as the
+first argument) to stop early.
+
+`submit_background` must be called from the main thread the first time, as
+it registers the custom event — except for fire-and-forget work without
+callbacks, which may be submitted from any thread. The add-in's stop() calls
+`shutdown_background()` to cancel queued work, wait briefly for running
+work, and unregister the event.
+"""
+
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable
+
+from ..fusionAddInUtils import general_utils as futil
+from ..fusionAddInUtils import event_utils
+from .tracing import span
+
+try:
+    from ... import config
+
+    _EVENT_PREFIX = config.ADDIN_NAME
+except Exception:
+    _EVENT_PREFIX = "PowerTools-PlusProject"
+
+MAX_BACKGROUND_WORKERS = 4
+# stop() blocks Fusion; running requests get this long to finish.
+SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+BACKGROUND_EVENT_ID = f"{_EVENT_PREFIX}_background_results"
+
+
+class BackgroundTask:
+    """Handle for one piece of submitted work."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, owner, on_done: Callable, on_error: Callable):
+        self.id = next(self._ids)
+        self.name = name
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.future = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Skip the work if not yet started, and suppress its callbacks."""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+
+class BackgroundWorkers:
+    """Thread pool whose completion callbacks are marshalled to the main thread."""
+
+    def __init__(self, max_workers: int = MAX_BACKGROUND_WORKERS):
+        self._max_workers = max_workers
+        self._executor = None
+        self._event = None
+        self._handlers: list = []
+        self._lock = threading.Lock()
+        self._tasks: dict = {}  # task id → BackgroundTask, until its callback has run
+        self._results: list = []  # [(task, ok, value)] waiting for the main thread
+        self._fire_pending = False
+
+    # ── Main-thread side ──────────────────────────────────────────────────────
+
+    def _ensure_executor(self) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="cutil-bg"
+                )
+
+    def _ensure_started(self) -> None:
+        self._ensure_executor()
+        if self._event is not None:
+            return
+        app = futil.app
+        # A previous session that was not stopped cleanly may still own the id.
+        app.unregisterCustomEvent(BACKGROUND_EVENT_ID)
+        self._event = app.registerCustomEvent(BACKGROUND_EVENT_ID)
+        event_utils.add_handler(
+            self._event,
+            self._deliver_results,
+            name="background_results",
+            local_handlers=self._handlers,
+        )
+
+    def _deliver_results(self, args) -> None:
+        """Custom-event handler: run queued callbacks on the main thread."""
+        with self._lock:
+            results, self._results = self._results, []
+            self._fire_pending = False
+        for task, ok, value in results:
+            with self._lock:
+                self._tasks.pop(task.id, None)
+            if task.cancelled:
+                continue
+            callback = task.on_done if ok else task.on_error
+            try:
+                if callback is not None:
+                    with span(f"deliver {task.name}", "background", ok=ok):
+                        callback(value)
+                elif not ok:
+                    futil.log(f"background: '{task.name}' failed: {value!r}")
+            except Exception:
+                futil.handle_error(f"background callback '{task.name}'")
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        on_done: Callable = None,
+        on_error: Callable = None,
+        owner=None,
+        name: str = None,
+        pass_task: bool = False,
+        **kwargs,
+    ) -> BackgroundTask:
+        """Run `fn(*args, **kwargs)` on a worker thread.
+
+        *on_done* receives the return value and *on_error* the exception, both
+        on the main thread. *owner* groups tasks for `cancel(owner)`. With
+        *pass_task*, the BackgroundTask is passed to *fn* as its first argument
+        so it can poll `task.cancelled`. Work without callbacks may be
+        submitted from a worker thread; a failure is then only logged.
+        """
+        if on_done is None and on_error is None:
+            self._ensure_executor()
+        else:
+            self._ensure_started()
+        task = BackgroundTask(name or getattr(fn, "__name__", "task"), owner, on_done, on_error)
+        call_args = (task,) + args if pass_task else args
+
+        def _forget():
+            with self._lock:
+                self._tasks.pop(task.id, None)
+
+        def _run():
+            if task.cancelled:
+                _forget()
+                return
+            try:
+                with span(task.name, "background"):
+                    value, ok = fn(*call_args, **kwargs), True
+            except Exception as exc:
+                value, ok = exc, False
+            self._post(task, ok, value)
+
+        with self._lock:
+            self._tasks[task.id] = task
+        task.future = self._executor.submit(_run)
+        # A task cancelled before it started never posts a result.
+        task.future.add_done_callback(lambda f: f.cancelled() and _forget())
+        return task
+
+    def call_later(
+        self, delay: float, callback: Callable, *, owner=None, name: str = None
+    ) -> BackgroundTask:
+        """Run `callback()` on the main thread after *delay* seconds.
+
+        The wait happens on a timer thread, so the main thread stays free —
+        use this to re-check a Fusion future instead of sleeping in a loop.
+        """
+        self._ensure_started()
+        task = BackgroundTask(
+            name or getattr(callback, "__name__", "call_later"),
+            owner,
+            lambda _: callback(),
+            None,
+        )
+        with self._lock:
+            self._tasks[task.id] = task
+        timer = threading.Timer(delay, self._post, args=(task, True, None))
+        timer.daemon = True
+        timer.start()
+        return task
+
+    def cancel(self, owner=None) -> int:
+        """Cancel every outstanding task of *owner* (all tasks when None). Returns the count."""
+        with self._lock:
+            tasks = [t for t in self._tasks.values() if owner is None or t.owner == owner]
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Cancel queued work, wait up to *timeout* for running work, unregister the event.
+
+        Callbacks of work still running after the timeout are never delivered.
+        """
+        if self._executor is None:
+            return
+        self.cancel()
+        with self._lock:
+            futures = [t.future for t in self._tasks.values() if t.future is not None]
+        executor, self._executor = self._executor, None
+        executor.shutdown(wait=False, cancel_futures=True)
+        _, still_running = wait(futures, timeout=timeout)
+        if still_running:
+            futil.log(f"background: {len(still_running)} task(s) still running at shutdown")
+
+        try:
+            for handler in self._handlers:
+                self._event.remove(handler)
+            futil.app.unregisterCustomEvent(BACKGROUND_EVENT_ID)
+        except Exception:
+            futil.handle_error("background shutdown")
+        self._handlers = []
+        self._event = None
+        with self._lock:
+            self._tasks.clear()
+            self._results = []
+            self._fire_pending = False
+
+    # ── Worker side ───────────────────────────────────────────────────────────
+
+    def _post(self, task: BackgroundTask, ok: bool, value) -> None:
+        """Queue a result and wake the main thread (one event per batch)."""
+        with self._lock:
+            if self._event is None:
+                # Fire-and-forget work before any main-thread submit, or shut
+                # down while this task was running
+                if not ok:
+                    futil.log(f"background: '{task.name}' failed: {value!r}")
+                self._tasks.pop(task.id, None)
+                return
+            self._results.append((task, ok, value))
+            if self._fire_pending:
+                return
+            self._fire_pending = True
+        futil.app.fireCustomEvent(BACKGROUND_EVENT_ID, "")
+
+
+# Module-level pool: started on first submit, shut down from the add-in's stop().
+_workers = BackgroundWorkers()
+
+
+def submit_background(fn: Callable, *args, **kwargs) -> BackgroundTask:
+    """Submit *fn* to the shared pool. See BackgroundWorkers.submit."""
+    return _workers.submit(fn, *args, **kwargs)
+
+
+def call_later_on_main_thread(delay: float, callback: Callable, **kwargs) -> BackgroundTask:
+    """Run *callback* on the main thread after *delay* seconds. See BackgroundWorkers.call_later."""
+    return _workers.call_later(delay, callback, **kwargs)
+
+
+def cancel_background(owner=None) -> int:
+    """Cancel outstanding shared-pool tasks of *owner* (all when None)."""
+    return _workers.cancel(owner)
+
+
+def shutdown_background(timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+    """Drain the shared pool (add-in stop)."""
+    _workers.shutdown(timeout)
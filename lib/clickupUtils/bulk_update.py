@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Concurrent PUT /task/{task_id} dispatch for dialogs that save many rows.
+
+Callers detect changes up front and hand over a {task_id: payload} dict.
+`update_tasks` sends the payloads through a small bounded worker pool and
+returns one TaskUpdateResult per task, so the dialog can show a single
+summary that names every failure.
+
+The pool is deliberately narrow (MAX_UPDATE_WORKERS): ClickUp budgets
+requests per token, and a handful of overlapping round trips already
+removes most of the serial wait.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ..fusionAddInUtils import general_utils as futil
+from .http_client import clickup_request
+from .metrics import perf_timer
+
+MAX_UPDATE_WORKERS = 4
+
+
+class TaskUpdateResult:
+    """Outcome of one task update. `error` is '' on success; `task` is the
+    updated task ClickUp returned, when it returned one."""
+
+    def __init__(
+        self, task_id: str, ok: bool, status_code: int = 0, error: str = "", task: dict = None
+    ):
+        self.task_id = task_id
+        self.ok = ok
+        self.status_code = status_code
+        self.error = error
+        self.task = task
+
+
+def _put_task(task_id: str, payload: dict, api_token: str) -> TaskUpdateResult:
+    try:
+        response = clickup_request("PUT", f"/task/{task_id}", api_token, json_body=payload)
+    except Exception as exc:
+        return TaskUpdateResult(task_id, False, error=str(exc))
+    if response.ok:
+        try:
+            task = response.json()
+        except ValueError:
+            task = None
+        return TaskUpdateResult(
+            task_id, True, response.status_code, task=task if isinstance(task, dict) else None
+        )
+    return TaskUpdateResult(task_id, False, response.status_code, response.data)
+
+
+def update_tasks(
+    payloads: dict, api_token: str, *, max_workers: int = MAX_UPDATE_WORKERS
+) -> list:
+    """PUT every {task_id: payload} concurrently; return results in input order.
+
+    Never raises for per-task failures — inspect `result.ok` / `result.error`.
+    """
+    if not payloads:
+        return []
+    workers = max(1, min(max_workers, len(payloads)))
+    with perf_timer(f"update_tasks (n={len(payloads)}, workers={workers})", "cutil"):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_put_task, task_id, payload, api_token)
+                for task_id, payload in payloads.items()
+            ]
+            results = [f.result() for f in futures]
+    for result in results:
+        if not result.ok:
+            futil.log(
+                f"update_tasks: [{result.task_id}] failed — "
+                f"HTTP {result.status_code}: {result.error}"
+            )
+    return results
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Record / replay of HTTP traffic for repeatable offline performance runs.
+
+Every ClickUp and TinyURL call — JSON requests, paged task downloads and
+the multipart thumbnail upload alike — goes through the pooled client in
+http_client.py, which consults the active cassette:
+
+  record  — requests go to the network as usual; each exchange is appended
+            to a JSON-lines cassette with its response and timing.
+  replay  — nothing touches the network; each request is answered from the
+            cassette, after the recorded latency or immediately.
+
+Requests are matched on method + path + query, ignoring the host (so a
+cassette recorded against one server replays against another) and volatile
+query parameters such as `date_updated_gt`. Repeated requests are answered
+in recorded order; once a request's recordings are used up the last one is
+repeated. A request that was never recorded raises CassetteMiss, an
+OSError, so callers take their usual network-failure path.
+
+Request headers are never written (they carry API tokens); request bodies
+are kept only when small and textual, for reading the cassette.
+
+    cutil.start_recording("cache/cassettes/slow-list.jsonl")
+    ...                                   # use the add-in
+    cutil.stop_cassette()
+    cutil.start_replay("cache/cassettes/slow-list.jsonl", realtime=False)
+
+config.HTTP_CASSETTE_MODE ("record" / "replay") with HTTP_CASSETTE_PATH
+(default cache/cassettes/session.jsonl) and HTTP_REPLAY_REALTIME starts one
+when clickupUtils is first imported.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+except Exception:
+    config = None
+
+# Query parameters whose values depend on when the request was made
+VOLATILE_PARAMS = {"date_updated_gt"}
+# Request bodies up to this size are stored (as text) for reading the cassette
+MAX_STORED_REQUEST_BODY = 64 * 1024
+
+_lock = threading.Lock()
+_active = None  # Cassette while recording or replaying
+
+
+class CassetteMiss(OSError):
+    """Replay was asked for a request the cassette does not contain."""
+
+
+def request_key(method: str, url: str) -> str:
+    """Return the replay match key of a request: "METHOD /path?sorted&query"."""
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    query = sorted((k, v) for k, v in params if k not in VOLATILE_PARAMS)
+    key = f"{method.upper()} {parts.path or '/'}"
+    return f"{key}?{urlencode(query)}" if query else key
+
+
+class Cassette:
+    """One cassette file, open for recording or loaded for replay."""
+
+    def __init__(self, path: str, mode: str, realtime: bool = True):
+        self.path = path
+        self.mode = mode
+        self.realtime = realtime
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._fh = None
+        self._recordings: dict = {}  # key → [interaction, ...] in recorded order
+        self._served: dict = {}  # key → number of recordings already served
+        self.count = 0
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._fh = open(path, "a", encoding="utf-8")
+        elif mode == "replay":
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        item = json.loads(line)
+                        self._recordings.setdefault(item["key"], []).append(item)
+        else:
+            raise ValueError(f"cassette mode must be 'record' or 'replay', not {mode!r}")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        body,
+        status: int,
+        headers: dict,
+        content: bytes,
+        elapsed: float,
+    ) -> None:
+        """Append one completed exchange."""
+        item = {
+            "key": request_key(method, url),
+            "method": method.upper(),
+            "url": url,
+            "at": round(time.perf_counter() - self._started, 6),
+            "elapsed": round(elapsed, 6),
+            "request_bytes": len(body) if body is not None else 0,
+            "status": status,
+            "headers": headers,
+        }
+        if isinstance(body, (bytes, bytearray)) and len(body) <= MAX_STORED_REQUEST_BODY:
+            try:
+                item["request_body"] = bytes(body).decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        try:
+            item["content"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            item["content_b64"] = base64.b64encode(content).decode("ascii")
+        line = json.dumps(item)
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(line + "\n")
+            self._fh.flush()
+            self.count += 1
+
+    def replay(self, method: str, url: str) -> tuple:
+        """Return (status, headers, content, elapsed) recorded for this request.
+
+        Sleeps for the recorded latency first when *realtime* is set.
+        """
+        key = request_key(method, url)
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                raise CassetteMiss(f"no recording for {key} in '{self.path}'")
+            index = min(self._served.get(key, 0), len(recordings) - 1)
+            self._served[key] = index + 1
+            self.count += 1
+        item = recordings[index]
+        if "content_b64" in item:
+            content = base64.b64decode(item["content_b64"])
+        else:
+            content = item.get("content", "").encode("utf-8")
+        elapsed = float(item.get("elapsed", 0.0))
+        if self.realtime and elapsed > 0:
+            time.sleep(elapsed)
+        else:
+            elapsed = 0.0
+        return item["status"], dict(item.get("headers") or {}), content, elapsed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def active_cassette():
+    """Return the Cassette in use, or None for live traffic."""
+    return _active
+
+
+def _start(cassette: Cassette) -> Cassette:
+    global _active
+    with _lock:
+        previous, _active = _active, cassette
+    if previous is not None:
+        previous.close()
+    futil.log(f"cassette: {cassette.mode} '{cassette.path}'")
+    return cassette
+
+
+def start_recording(path: str) -> Cassette:
+    """Append every HTTP exchange from now on to the cassette at *path*."""
+    return _start(Cassette(path, "record"))
+
+
+def start_replay(path: str, realtime: bool = True) -> Cassette:
+    """Serve every HTTP request from the cassette at *path* instead of the network.
+
+    With *realtime*, each response waits for its recorded latency; otherwise
+    responses are immediate.
+    """
+    return _start(Cassette(path, "replay", realtime))
+
+
+def stop_cassette() -> None:
+    """Return to live traffic, closing any cassette being recorded."""
+    global _active
+    with _lock:
+        cassette, _active = _active, None
+    if cassette is not None:
+        cassette.close()
+        futil.log(f"cassette: stopped '{cassette.path}' after {cassette.count} request(s)")
+
+
+_mode = getattr(config, "HTTP_CASSETTE_MODE", "")
+if _mode:
+    try:
+        _path = getattr(config, "HTTP_CASSETTE_PATH", "") or os.path.join(
+            config.CACHE_DIR, "cassettes", "session.jsonl"
+        )
+        if _mode == "record":
+            start_recording(_path)
+        else:
+            start_replay(_path, getattr(config, "HTTP_REPLAY_REALTIME", True))
+    except Exception as exc:
+        futil.log(f"cassette: could not start {_mode!r} from config: {exc}")
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Parsed-once access to cache/auth.json.
+
+Every command used to carry its own `_load_api_token` / `_load_tinyurl_token`
+copy that re-opened and re-parsed the JSON on each call. The file now has
+one JsonFileStore that keeps the parsed document in memory and re-parses it
+only when the file's (mtime, size) stamp changes, so edits made by another
+add-in instance or by hand are still picked up.
+
+Set Tokens writes through `update()`, which re-reads the latest copy,
+applies the change and replaces the file atomically (temp file +
+os.replace), so a reader never sees a half-written file.
+
+Usage:
+    api_token = cutil.get_clickup_api_token()
+    cutil.save_tokens(clickup_api_token=new_token)
+
+Project mappings live in project_store.
+"""
+
+import copy
+import json
+import os
+import threading
+from typing import Callable
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+
+    AUTH_JSON_PATH = config.AUTH_JSON_PATH
+except Exception:
+    _CACHE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+    )
+    AUTH_JSON_PATH = os.path.join(_CACHE_DIR, "auth.json")
+
+
+class JsonFileStore:
+    """One JSON file, parsed once and re-parsed only when it changes on disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data: dict = {}
+        self._stamp = None  # (st_mtime_ns, st_size) of the parsed copy
+        self._lock = threading.Lock()
+
+    def _current_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def exists(self) -> bool:
+        return self._current_stamp() is not None
+
+    def read(self) -> dict:
+        """Return the parsed document, or {} when the file is missing or
+        unparseable. Treat it as read-only — it is shared."""
+        with self._lock:
+            stamp = self._current_stamp()
+            if stamp is not None and stamp == self._stamp:
+                return self._data
+            try:
+                with open(self.path, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+            except (OSError, json.JSONDecodeError) as exc:
+                if stamp is not None:
+                    futil.log(f"config_store: cannot read '{self.path}': {exc}")
+                self._data, self._stamp = {}, None
+                return self._data
+            self._data = data if isinstance(data, dict) else {}
+            self._stamp = stamp
+            return self._data
+
+    def update(self, mutate: Callable) -> dict:
+        """Apply `mutate(doc)` to a fresh copy of the document and write it atomically.
+
+        Returns the new document. Raises OSError when the file cannot be written.
+        """
+        with self._lock:
+            self._stamp = None  # always start from what is on disk now
+        doc = copy.deepcopy(self.read())
+        mutate(doc)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(doc, fh, indent=2)
+            os.replace(tmp_path, self.path)
+            self._data, self._stamp = doc, self._current_stamp()
+        return doc
+
+
+auth_store = JsonFileStore(AUTH_JSON_PATH)
+
+
+# ── auth.json ─────────────────────────────────────────────────────────────────
+
+
+def get_clickup_api_token() -> str:
+    """Return auth.json's "clickup_api_token", or '' when missing."""
+    return (auth_store.read().get("clickup_api_token") or "").strip()
+
+
+def get_tinyurl_api_token() -> str:
+    """Return auth.json's "tinyurl_api_token", or '' when missing."""
+    return (auth_store.read().get("tinyurl_api_token") or "").strip()
+
+
+def save_tokens(clickup_api_token: str = "", tinyurl_api_token: str = "") -> None:
+    """Store the non-empty tokens in auth.json, preserving every other key."""
+
+    def _apply(doc):
+        if clickup_api_token:
+            doc["clickup_api_token"] = clickup_api_token
+        if tinyurl_api_token:
+            doc["tinyurl_api_token"] = tinyurl_api_token
+
+    auth_store.update(_apply)
@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Pooled keep-alive HTTP client shared by every ClickUp and TinyURL call.
+
+`adsk.core.HttpRequest.create(...).executeSync()` opens a fresh TLS session
+per request, so a dialog that issues four or five calls pays four or five
+handshakes. This module keeps idle `http.client.HTTPSConnection` objects per
+host and hands them back out, so connections survive across calls and across
+command invocations for as long as the add-in is loaded.
+
+Bodies may be JSON (`json_body=`), raw bytes (`body=`), or a streamed
+MultipartBody (multipart.py) for uploads, which is sent chunk by chunk
+without being joined into one buffer.
+
+Usage:
+    response = cutil.clickup_request("GET", f"/list/{list_id}/field", api_token)
+    if response.ok:
+        fields = response.json().get("fields", [])
+
+Every request is recorded in the metrics registry (metrics.py) under its
+endpoint template, with latency and bytes sent / received, and as a span
+when tracing is on (tracing.py). While a cassette is active (cassette.py)
+each exchange is recorded, or answered from the cassette without network.
+
+Network failures raise (OSError / http.client.HTTPException) exactly like
+`executeSync` did, so callers keep their existing try/except blocks. Non-2xx
+responses are returned, not raised.
+
+`clickup_request` is scheduled through the per-token RateLimiter
+(rate_limit.py): it waits for budget instead of failing, and a 429 is
+retried after the advertised reset rather than returned to the caller.
+"""
+
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+from ..fusionAddInUtils import general_utils as futil
+from .cassette import active_cassette
+from .metrics import endpoint_template, increment_metric, record_timing
+from .rate_limit import PRIORITY_INTERACTIVE, get_rate_limiter
+from .tracing import span
+
+CLICKUP_API_BASE = "https://api.clickup.com/api/v2"
+
+DEFAULT_TIMEOUT_SECONDS = 30
+# Servers drop idle keep-alive sockets after roughly a minute; retire ours first.
+IDLE_TIMEOUT_SECONDS = 50.0
+MAX_IDLE_PER_HOST = 4
+# A 429 is retried after the reset this many times before it is returned.
+MAX_RATE_LIMIT_RETRIES = 2
+
+# Errors that mean a reused keep-alive socket was closed by the server.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+# Methods that may be re-sent when the server may already have acted on them
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class HttpResponse:
+    """Completed response. `data` mirrors adsk.core.HttpResponse.data (text)."""
+
+    def __init__(self, status_code: int, headers: dict, content: bytes, elapsed: float):
+        self.status_code = status_code
+        self.headers = headers  # lower-cased header names
+        self.content = content
+        self.elapsed = elapsed  # seconds, request sent → body read
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def data(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content or b"null")
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self._max_idle = max_idle_per_host
+        self._idle: dict = {}  # key → [(connection, last_used_monotonic), ...]
+        self._lock = threading.Lock()
+
+    def _acquire(self, key: tuple, timeout: float):
+        """Return (connection, reused). Discards idle connections past their TTL."""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used < IDLE_TIMEOUT_SECONDS:
+                    conn.timeout = timeout
+                    return conn, True
+                conn.close()
+        scheme, host, port = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close_all(self) -> None:
+        """Close every idle connection. Called from the add-in's stop()."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict = None,
+        body=None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> HttpResponse:
+        """Send one request over a pooled connection and read the full response.
+
+        A reused connection that turns out to be stale is retried once on a
+        fresh connection — for POST and other non-idempotent methods only when
+        the failure came before the request was fully sent, so a request the
+        server may have acted on is never repeated. Any other failure
+        propagates to the caller.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        send_headers = {"Connection": "keep-alive"}
+        send_headers.update(headers or {})
+        if body is not None:
+            send_headers["Content-Length"] = str(len(body))
+
+        endpoint = endpoint_template(method, parts.path)
+        cassette = active_cassette()
+        with span(endpoint, "http", host=parts.hostname) as request_span:
+            if cassette is not None and cassette.replaying:
+                status, resp_headers, content, elapsed = cassette.replay(method, url)
+                record_timing(
+                    "http",
+                    endpoint,
+                    elapsed,
+                    bytes_sent=len(body) if body is not None else 0,
+                    bytes_received=len(content),
+                    errors=int(status >= 400),
+                )
+                request_span.set(status=status, bytes=len(content), replayed=True)
+                return HttpResponse(status, resp_headers, content, elapsed)
+
+            idempotent = method.upper() in _IDEMPOTENT_METHODS
+            retried = False
+            while True:
+                conn, reused = self._acquire(key, timeout)
+                t0 = time.perf_counter()
+                sent = False
+                try:
+                    conn.request(method, path, body=body, headers=send_headers)
+                    sent = True
+                    resp = conn.getresponse()
+                    content = resp.read()
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if reused and not retried and (idempotent or not sent):
+                        retried = True
+                        continue
+                    increment_metric("http", endpoint, "errors")
+                    raise
+                except Exception:
+                    conn.close()
+                    increment_metric("http", endpoint, "errors")
+                    raise
+                elapsed = time.perf_counter() - t0
+                record_timing(
+                    "http",
+                    endpoint,
+                    elapsed,
+                    bytes_sent=len(body) if body is not None else 0,
+                    bytes_received=len(content),
+                    errors=int(resp.status >= 400),
+                )
+
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self._release(key, conn)
+
+                request_span.set(status=resp.status, bytes=len(content), reused=reused)
+                if futil.PERF_TRACE:
+                    futil.log(
+                        f"[HTTP] {method:<6} {parts.hostname}{parts.path:<40} | "
+                        f"{resp.status} | {elapsed:.3f} s | "
+                        f"{'reused' if reused else 'new'} connection | {len(content)} B"
+                    )
+                resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+                if cassette is not None:
+                    cassette.record(
+                        method, url, body, resp.status, resp_headers, content, elapsed
+                    )
+                return HttpResponse(resp.status, resp_headers, content, elapsed)
+
+
+# Module-level pool: lives for as long as the add-in is loaded.
+_pool = ConnectionPool()
+
+
+def http_request(
+    method: str,
+    url: str,
+    *,
+    headers: dict = None,
+    json_body=None,
+    body=None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> HttpResponse:
+    """Send *method* to an absolute *url* over the shared connection pool.
+
+    Pass `json_body` for a JSON payload (Content-Type is set automatically)
+    or `body` for pre-encoded bytes or a MultipartBody with a caller-supplied
+    Content-Type.
+    """
+    send_headers = {"Accept": "application/json"}
+    send_headers.update(headers or {})
+    if json_body is not None:
+        body = json.dumps(json_body).encode("utf-8")
+        send_headers.setdefault("Content-Type", "application/json")
+    return _pool.request(method, url, headers=send_headers, body=body, timeout=timeout)
+
+
+def clickup_request(
+    method: str,
+    path: str,
+    api_token: str,
+    *,
+    params: dict = None,
+    json_body=None,
+    body=None,
+    content_type: str = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> HttpResponse:
+    """Call the ClickUp v2 API. *path* is relative to CLICKUP_API_BASE, e.g. "/list/123".
+
+    Waits for request budget on *api_token* first; pass
+    `priority=PRIORITY_BACKGROUND` for work no dialog is waiting on.
+    Raises RateLimitTimeout if no budget frees up in time. While a cassette
+    is replaying, no budget is spent or learned — recorded X-RateLimit-*
+    headers describe the recording session, not this one.
+    """
+    url = f"{CLICKUP_API_BASE}{path}"
+    if params:
+        url = f"{url}?{urlencode(params)}"
+    headers = {"Authorization": api_token}
+    if content_type:
+        headers["Content-Type"] = content_type
+
+    cassette = active_cassette()
+    replaying = cassette is not None and cassette.replaying
+    limiter = None if replaying else get_rate_limiter(api_token)
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if limiter is not None:
+            waited = limiter.acquire(priority)
+            if waited > 0.05:
+                futil.log(f"[HTTP] {method} {path} — waited {waited:.2f} s for rate-limit budget")
+        response = http_request(
+            method, url, headers=headers, json_body=json_body, body=body, timeout=timeout
+        )
+        if limiter is not None:
+            limiter.observe(response.status_code, response.headers)
+        if response.status_code != 429:
+            break
+        increment_metric("http", endpoint_template(method, path), "rate_limited")
+        futil.log(f"[HTTP] {method} {path} — 429 rate limited (attempt {attempt + 1})")
+    return response
+
+
+def close_connections() -> None:
+    """Close all pooled connections (add-in stop)."""
+    _pool.close_all()
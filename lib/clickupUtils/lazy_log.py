@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Leveled, lazily formatted logging for the PlusProject commands.
+
+futil.log takes a finished string, so every call site pays for its
+f-string — often an HTTP body, a JSON payload or a URL — even when
+config.DEBUG is off and the line is thrown away. A Logger takes a
+%-format string plus arguments, or a callable returning the message, and
+formats nothing unless the line will actually be written:
+
+    log = cutil.get_logger(CMD_NAME)
+    log.info("POST '/list/%s/task'", list_id)
+    log.debug("response body: %s", response.data)
+    log.debug(lambda: json.dumps(payload, indent=2))
+
+Lines go to futil.log (so the console still follows config.DEBUG) and,
+with config.LOG_TO_FILE, to a rotating file under cache/logs/ written by a
+background thread. The writer's queue is bounded; when it is full, lines
+are dropped and counted rather than blocking the caller. Each logger is
+prefixed with its name and filtered by config.LOG_LEVEL, overridden per
+name by config.LOG_MODULE_LEVELS. A disabled call costs one comparison.
+"""
+
+import os
+import queue
+import threading
+import time
+
+import adsk.core
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+except Exception:
+    config = None
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+_LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+_LEVEL_LABELS = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+_FUSION_LEVELS = {
+    WARNING: adsk.core.LogLevels.WarningLogLevel,
+    ERROR: adsk.core.LogLevels.ErrorLogLevel,
+}
+
+LOG_FILE_NAME = "plusproject.log"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+LOG_QUEUE_SIZE = 10_000
+
+_lock = threading.Lock()
+_loggers: dict = {}  # name → Logger
+_settings: dict = {}  # "level", "module_levels", "console", "file_path"; see configure_logging
+_writer = None  # _FileWriter while file logging is on
+
+
+def _parse_level(value, default: int = INFO) -> int:
+    if isinstance(value, int):
+        return value
+    return _LEVEL_NAMES.get(str(value or "").strip().lower(), default)
+
+
+# ── File sink ─────────────────────────────────────────────────────────────────
+
+
+class _FileWriter:
+    """Appends queued lines to *path* on a daemon thread, rotating by size."""
+
+    def __init__(self, path: str, max_bytes: int, backups: int, queue_size: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self.stopped = False  # the thread has exited; later lines are dropped
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="plusproject-log", daemon=True)
+        self._thread.start()
+
+    def put(self, line: str) -> None:
+        if self.stopped:
+            return
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write what is queued, then stop the thread."""
+        if self.stopped:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        fh = None
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fh = open(self.path, "a", encoding="utf-8")
+            while True:
+                line = self._queue.get()
+                lines = [line]
+                # Write whatever else is already queued in the same pass
+                while line is not None and not self._queue.empty():
+                    line = self._queue.get_nowait()
+                    lines.append(line)
+                if self.dropped:
+                    lines.insert(0, f"… {self.dropped} log line(s) dropped (queue full)")
+                    self.dropped = 0
+                fh.write("".join(f"{l}\n" for l in lines if l is not None))
+                fh.flush()
+                if lines[-1] is None:
+                    return
+                if fh.tell() >= self.max_bytes:
+                    fh.close()
+                    self._rotate()
+                    fh = open(self.path, "a", encoding="utf-8")
+        except Exception as exc:
+            futil.log(f"lazy_log: file logging stopped: {exc}")
+        finally:
+            self.stopped = True
+            if fh is not None:
+                fh.close()
+
+    def _rotate(self) -> None:
+        """plusproject.log → .1 → .2 …, dropping the oldest."""
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+# ── Loggers ───────────────────────────────────────────────────────────────────
+
+
+class Logger:
+    """Named logger; use get_logger() rather than constructing one."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._prefix = f"{name}: " if name else ""
+        self.threshold = OFF  # lowest level written; set by _apply_settings
+
+    def is_enabled(self, level: int) -> bool:
+        return level >= self.threshold
+
+    def log(self, level: int, msg, *args) -> None:
+        """Write *msg* at *level*; *msg* is a %-format string or a callable returning one."""
+        if level < self.threshold:
+            return
+        try:
+            text = msg() if callable(msg) else msg
+            if args:
+                text = text % args
+        except Exception as exc:
+            text = f"{msg!r} {args!r} (log formatting failed: {exc})"
+        _emit(level, self._prefix + str(text))
+
+    def debug(self, msg, *args) -> None:
+        if DEBUG >= self.threshold:
+            self.log(DEBUG, msg, *args)
+
+    def info(self, msg, *args) -> None:
+        if INFO >= self.threshold:
+            self.log(INFO, msg, *args)
+
+    def warning(self, msg, *args) -> None:
+        if WARNING >= self.threshold:
+            self.log(WARNING, msg, *args)
+
+    def error(self, msg, *args) -> None:
+        if ERROR >= self.threshold:
+            self.log(ERROR, msg, *args)
+
+    def _apply_settings(self) -> None:
+        if not (_settings["console"] or _settings["file_path"]):
+            self.threshold = OFF
+            return
+        self.threshold = _parse_level(
+            _settings["module_levels"].get(self.name, _settings["level"])
+        )
+
+
+def _emit(level: int, message: str) -> None:
+    if _settings["console"]:
+        futil.log(message, _FUSION_LEVELS.get(level, adsk.core.LogLevels.InfoLogLevel))
+    writer = _writer
+    if writer is not None:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        writer.put(f"{stamp} {_LEVEL_LABELS.get(level, level):<7} {message}")
+
+
+def get_logger(name: str) -> Logger:
+    """Return the shared Logger for *name* (a command name such as CMD_NAME)."""
+    with _lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = Logger(name)
+            logger._apply_settings()
+        return logger
+
+
+def configure_logging(
+    level=None, module_levels: dict = None, console: bool = None, file_path: str = None
+) -> None:
+    """Change levels and sinks at runtime; arguments left as None keep their value.
+
+    *level* and the values of *module_levels* are level names ("debug",
+    "info", "warning", "error", "off") or the module's level constants.
+    *file_path* '' turns the file sink off.
+    """
+    global _writer
+    with _lock:
+        if level is not None:
+            _settings["level"] = level
+        if module_levels is not None:
+            _settings["module_levels"] = dict(module_levels)
+        if console is not None:
+            _settings["console"] = console
+        old_writer = None
+        if file_path is not None and file_path != _settings["file_path"]:
+            _settings["file_path"] = file_path
+            old_writer, _writer = _writer, None
+            if file_path:
+                _writer = _FileWriter(
+                    file_path, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS, LOG_QUEUE_SIZE
+                )
+        for logger in _loggers.values():
+            logger._apply_settings()
+    if old_writer is not None:
+        old_writer.close()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the file writer (add-in stop)."""
+    configure_logging(file_path="")
+
+
+_settings.update(
+    level=getattr(config, "LOG_LEVEL", "debug"),
+    module_levels=dict(getattr(config, "LOG_MODULE_LEVELS", None) or {}),
+    console=futil.DEBUG,
+    file_path="",
+)
+if getattr(config, "LOG_TO_FILE", False):
+    configure_logging(file_path=os.path.join(config.CACHE_DIR, "logs", LOG_FILE_NAME))
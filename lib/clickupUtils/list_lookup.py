@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Hash indexes over one list's statuses and members.
+
+The dialogs resolve members by id (task assignees) and by username (the
+assignee dropdown), and select each row's status by name. Scanning the
+member and status lists for every row and every save costs O(members) per
+lookup, which adds up in workspaces with hundreds of members. A ListLookup
+is built once per bootstrap from get_list_statuses / get_list_members and
+answers each of those in O(1); its option tuples are shared by every row's
+dropdown.
+"""
+
+
+class ListLookup:
+    """Statuses and members of one list, indexed for constant-time lookups."""
+
+    def __init__(self, statuses: list = None, members: list = None):
+        self.statuses = list(statuses or [])  # sorted by orderindex, as fetched
+        self.members = list(members or [])  # sorted by username, as fetched
+
+        # Dropdown labels, in the same order as statuses / members
+        self.status_options = tuple(s.get("status", "").title() for s in self.statuses)
+        self.member_options = tuple(m["username"] for m in self.members)
+
+        # First entry wins on duplicates, matching the linear scans this replaces
+        self._status_index: dict = {}  # lower-case status → position in statuses
+        for i, status in enumerate(self.statuses):
+            self._status_index.setdefault(status.get("status", "").lower(), i)
+        self._member_index: dict = {}  # username → position in members
+        self._member_by_id: dict = {}  # member id → member
+        for i, member in enumerate(self.members):
+            self._member_index.setdefault(member["username"], i)
+            self._member_by_id.setdefault(member["id"], member)
+
+    def __bool__(self) -> bool:
+        return bool(self.statuses or self.members)
+
+    # ── Statuses ──────────────────────────────────────────────────────────────
+
+    def status_position(self, status: str) -> int:
+        """Return the position of *status* (any case) in status_options, or -1."""
+        return self._status_index.get((status or "").lower(), -1)
+
+    def status_info(self, status: str):
+        """Return {"status", "orderindex", "color", ...} for *status* (any case), or None."""
+        i = self.status_position(status)
+        return self.statuses[i] if i >= 0 else None
+
+    def status_color(self, status: str, default: str = "") -> str:
+        info = self.status_info(status)
+        return info.get("color") or default if info else default
+
+    # ── Members ───────────────────────────────────────────────────────────────
+
+    def member_position(self, username: str) -> int:
+        """Return the position of *username* in member_options, or -1."""
+        return self._member_index.get(username, -1)
+
+    def member_by_id(self, member_id):
+        """Return the member dict for *member_id*, or None."""
+        return self._member_by_id.get(member_id)
+
+    def member_by_username(self, username: str):
+        """Return the member dict for *username*, or None."""
+        i = self.member_position(username)
+        return self.members[i] if i >= 0 else None
+
+    def member_id(self, username: str, default: int = 0) -> int:
+        """Return the id of the member called *username*, or *default*."""
+        member = self.member_by_username(username)
+        return member["id"] if member else default
+
+    def member_name(self, member_id, default: str = "") -> str:
+        """Return the username of member *member_id*, or *default*."""
+        member = self._member_by_id.get(member_id)
+        return member["username"] if member else default
@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Persistent cache of per-list ClickUp metadata: custom fields, statuses, members.
+
+A list's schema changes a few times a year, yet every dialog used to
+re-download it. Each list gets one JSON file under cache/:
+
+  list_meta_<list_id>.json  — {"fields"|"statuses"|"members": {"fetched_at": epoch, "data": [...]}}
+
+Entries are served stale-while-revalidate:
+  age < FRESH_SECONDS    → served as-is
+  age < MAX_AGE_SECONDS  → served as-is, refreshed on the background pool
+  older / missing        → fetched synchronously
+
+`find_custom_field_id` answers any field lookup ('Fusion Document URN',
+'Fusion Design', ...) from the single cached /field response and re-fetches
+once when the name is missing, so a newly added field is picked up.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from ..fusionAddInUtils import general_utils as futil
+from .http_client import clickup_request
+from .background import submit_background
+from .metrics import perf_timer
+from .rate_limit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+try:
+    from ... import config
+
+    METADATA_CACHE_DIR = config.CACHE_DIR
+except Exception:
+    METADATA_CACHE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+    )
+
+FRESH_SECONDS = 15 * 60
+MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_KINDS = ("fields", "statuses", "members")
+
+_memory: dict = {}  # list_id → {kind: {"fetched_at": float, "data": list}}
+_lock = threading.Lock()
+# Held across snapshot + write, so concurrent fetches of one list's kinds
+# cannot overwrite a newer file with an older snapshot.
+_write_lock = threading.Lock()
+_refreshing: set = set()  # {(list_id, kind)} with a background refresh in flight
+
+
+# ── Fetchers (raise on failure so nothing bad is cached) ─────────────────────
+
+
+def _fetch_fields(list_id: str, api_token: str, priority: int) -> list:
+    response = clickup_request(
+        "GET", f"/list/{list_id}/field", api_token, priority=priority
+    )
+    if not response.ok:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.data}")
+    return response.json().get("fields", [])
+
+
+def _fetch_statuses(list_id: str, api_token: str, priority: int) -> list:
+    response = clickup_request("GET", f"/list/{list_id}", api_token, priority=priority)
+    if not response.ok:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.data}")
+    statuses = response.json().get("statuses", [])
+    # Sort by orderindex so dropdowns match the ClickUp order
+    statuses.sort(key=lambda s: s.get("orderindex", 0))
+    return statuses
+
+
+def _fetch_members(list_id: str, api_token: str, priority: int) -> list:
+    response = clickup_request(
+        "GET", f"/list/{list_id}/member", api_token, priority=priority
+    )
+    if not response.ok:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.data}")
+    members = []
+    for item in response.json().get("members", []):
+        # API may return flat dicts or dicts nested under "user"
+        user = item.get("user", item)
+        uid = user.get("id")
+        if not uid:
+            continue
+        members.append(
+            {
+                "id": int(uid),
+                "username": (user.get("username") or user.get("email") or str(uid)),
+                "email": user.get("email", ""),
+            }
+        )
+    members.sort(key=lambda m: m["username"].lower())
+    return members
+
+
+_FETCHERS = {
+    "fields": _fetch_fields,
+    "statuses": _fetch_statuses,
+    "members": _fetch_members,
+}
+
+
+# ── Disk layer ────────────────────────────────────────────────────────────────
+
+
+def list_metadata_cache_path(list_id: str) -> str:
+    """Return the JSON path holding cached metadata for *list_id*."""
+    safe_id = re.sub(r"[^\w\-]", "_", str(list_id))
+    return os.path.join(METADATA_CACHE_DIR, f"list_meta_{safe_id}.json")
+
+
+def _load_entry(list_id: str) -> dict:
+    """Return the in-memory entry for *list_id*, reading the disk file once. Caller holds _lock."""
+    entry = _memory.get(list_id)
+    if entry is not None:
+        return entry
+    entry = {}
+    path = list_metadata_cache_path(list_id)
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                payload = json.load(fh)
+            entry = {k: v for k, v in payload.items() if k in _KINDS}
+        except Exception:
+            futil.log(f"list_metadata: failed to read '{path}' — ignoring")
+    _memory[list_id] = entry
+    return entry
+
+
+def _write_entry(list_id: str) -> None:
+    """Write the current in-memory entry for *list_id* to disk."""
+    path = list_metadata_cache_path(list_id)
+    tmp_path = None
+    with _write_lock:
+        with _lock:
+            snapshot = dict(_load_entry(list_id))
+        try:
+            os.makedirs(METADATA_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=METADATA_CACHE_DIR, prefix=os.path.basename(path), suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(snapshot, fh)
+            os.replace(tmp_path, path)
+        except Exception:
+            futil.log(f"list_metadata: failed to write '{path}' — ignoring")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+# ── Core get / refresh ────────────────────────────────────────────────────────
+
+
+def _refresh(list_id: str, kind: str, api_token: str, priority: int) -> list:
+    data = _FETCHERS[kind](list_id, api_token, priority)
+    with _lock:
+        entry = _load_entry(list_id)
+        entry[kind] = {"fetched_at": time.time(), "data": data}
+    _write_entry(list_id)
+    return data
+
+
+def _refresh_in_background(list_id: str, kind: str, api_token: str) -> None:
+    key = (list_id, kind)
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def _run():
+        try:
+            _refresh(list_id, kind, api_token, PRIORITY_BACKGROUND)
+            futil.log(f"list_metadata: background refresh of {kind} for list '{list_id}' done")
+        except Exception as exc:
+            futil.log(f"list_metadata: background refresh of {kind} failed: {exc}")
+
+    def _finished(_future):
+        with _lock:
+            _refreshing.discard(key)
+
+    # The shared pool lets stop() cancel or drain the refresh along with all
+    # other background I/O, before the pooled connections are closed.
+    task = submit_background(_run, owner="list_metadata", name=f"list_meta_{kind}")
+    # Runs whether the refresh finished, failed or was cancelled before starting
+    task.future.add_done_callback(_finished)
+
+
+def _get(list_id: str, kind: str, api_token: str, force_refresh: bool = False) -> list:
+    """Return cached *kind* for *list_id*, fetching or revalidating per the TTLs.
+
+    Returns [] when nothing is cached and the fetch fails.
+    """
+    with _lock:
+        cached = _load_entry(list_id).get(kind)
+    age = time.time() - cached["fetched_at"] if cached else None
+
+    if cached and not force_refresh and age < MAX_AGE_SECONDS:
+        if age >= FRESH_SECONDS:
+            _refresh_in_background(list_id, kind, api_token)
+        return cached["data"]
+
+    try:
+        with perf_timer(f"fetch {kind} (list {list_id})", "list_metadata"):
+            return _refresh(list_id, kind, api_token, PRIORITY_INTERACTIVE)
+    except Exception as exc:
+        futil.log(f"list_metadata: fetching {kind} for list '{list_id}' failed: {exc}")
+        # A stale answer beats none when ClickUp is unreachable.
+        return cached["data"] if cached else []
+
+
+def get_list_fields(list_id: str, api_token: str) -> list:
+    """Return the list's custom-field definitions (GET /list/{id}/field)."""
+    return _get(list_id, "fields", api_token)
+
+
+def get_list_statuses(list_id: str, api_token: str) -> list:
+    """Return the list's statuses sorted by orderindex (GET /list/{id})."""
+    return _get(list_id, "statuses", api_token)
+
+
+def get_list_members(list_id: str, api_token: str) -> list:
+    """Return [{"id": int, "username": str, "email": str}] sorted by username."""
+    return _get(list_id, "members", api_token)
+
+
+def _match_field(fields: list, name: str, field_type: str = None) -> str:
+    for f in fields:
+        if f.get("name") == name and (field_type is None or f.get("type") == field_type):
+            return f.get("id", "")
+    return ""
+
+
+def find_custom_field_id(
+    list_id: str, api_token: str, name: str, field_type: str = None
+) -> str:
+    """Return the id of the custom field called *name* (and of *field_type*, if given).
+
+    A miss against cached data invalidates the field cache and re-fetches
+    once before giving up. Returns '' when the field does not exist.
+    """
+    with _lock:
+        was_cached = "fields" in _load_entry(list_id)
+    field_id = _match_field(get_list_fields(list_id, api_token), name, field_type)
+    if field_id or not was_cached:
+        return field_id
+    futil.log(f"list_metadata: '{name}' not in cached fields for list '{list_id}' — re-fetching")
+    return _match_field(
+        _get(list_id, "fields", api_token, force_refresh=True), name, field_type
+    )
+
+
+def peek_list_metadata(list_id: str, kind: str):
+    """Return cached *kind* for *list_id* at any age without touching the network.
+
+    Returns None when nothing has been cached yet. Used to draw a dialog from
+    the last known snapshot before revalidating in the background.
+    """
+    with _lock:
+        cached = _load_entry(list_id).get(kind)
+    return cached["data"] if cached else None
+
+
+def peek_custom_field_id(list_id: str, name: str, field_type: str = None) -> str:
+    """Return the cached id of the custom field *name*, or '' — never fetches."""
+    return _match_field(peek_list_metadata(list_id, "fields") or [], name, field_type)
+
+
+def invalidate_list_metadata(list_id: str, kind: str = None) -> None:
+    """Drop cached *kind* (or everything) for *list_id*, in memory and on disk."""
+    with _lock:
+        entry = _load_entry(list_id)
+        if kind is None:
+            entry.clear()
+        else:
+            entry.pop(kind, None)
+    _write_entry(list_id)
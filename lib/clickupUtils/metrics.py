@@ -0,0 +1,321 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Aggregated latency and traffic metrics for timed blocks and HTTP calls.
+
+futil.perf_timer prints one line per block and forgets it. This registry
+keeps, per key, a call count, a latency histogram (p50 / p95 / p99) and
+named counters (bytes sent / received, errors, 429s):
+
+  timer  "<context> | <label>"        — every cutil.perf_timer block
+  http   "<METHOD> <endpoint>"        — every pooled request, e.g.
+                                        "GET /list/{id}/task"
+
+Endpoints are reduced to templates (ids replaced by {id}) so one list's
+requests aggregate under a single key, and timer labels drop a trailing
+detail with a number in it, such as "(list 123)", for the same reason.
+
+Histograms use fixed log-spaced buckets, so they merge exactly:
+write_metrics_report() folds the session into cache/metrics/metrics.json
+(the running totals since the last reset) and rewrites metrics.csv beside
+it, then starts a new session. The add-in's stop() calls it, so the report
+covers every session until reset_metrics(clear_report=True).
+"""
+
+import csv
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from ..fusionAddInUtils import general_utils as futil
+from .tracing import span
+
+try:
+    from ... import config
+
+    METRICS_ENABLED = getattr(config, "METRICS_ENABLED", True)
+    METRICS_DIR = os.path.join(config.CACHE_DIR, "metrics")
+except Exception:
+    METRICS_ENABLED = True
+    METRICS_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+        "metrics",
+    )
+
+# Bucket i holds durations up to _BUCKET_BASE * _BUCKET_GROWTH ** i seconds:
+# 0.5 ms … ~5 min in steps of ~19 %.
+_BUCKET_BASE = 0.0005
+_BUCKET_GROWTH = 2 ** 0.25
+_BUCKET_COUNT = 80
+
+# ClickUp path segments followed by an id
+_ID_AFTER = {"list", "task", "field", "folder", "space", "team", "user", "view", "comment", "goal"}
+_API_PREFIX = "/api/v2"
+
+_CSV_COLUMNS = (
+    "kind", "key", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "total_s",
+    "bytes_sent", "bytes_received", "errors", "rate_limited",
+)
+
+_lock = threading.Lock()
+_entries: dict = {}  # (kind, key) → _Entry
+_session_started = time.time()
+
+
+class Histogram:
+    """Latency histogram over fixed log-spaced buckets."""
+
+    def __init__(self):
+        self.buckets: dict = {}  # bucket index → count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        if seconds <= _BUCKET_BASE:
+            index = 0
+        else:
+            index = min(
+                _BUCKET_COUNT - 1,
+                math.ceil(math.log(seconds / _BUCKET_BASE, _BUCKET_GROWTH)),
+            )
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "Histogram") -> None:
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q* quantile (0 < q ≤ 1), in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_BUCKET_BASE * _BUCKET_GROWTH ** index, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": {str(i): n for i, n in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        hist = cls()
+        hist.count = int(data.get("count", 0))
+        hist.total = float(data.get("total", 0.0))
+        hist.max = float(data.get("max", 0.0))
+        hist.buckets = {int(i): int(n) for i, n in (data.get("buckets") or {}).items()}
+        return hist
+
+
+class _Entry:
+    def __init__(self):
+        self.latency = Histogram()
+        self.counters: dict = {}  # name → int
+
+
+def _entry(kind: str, key: str) -> _Entry:
+    """Return the entry for (kind, key), creating it. Caller holds _lock."""
+    entry = _entries.get((kind, key))
+    if entry is None:
+        entry = _entries[(kind, key)] = _Entry()
+    return entry
+
+
+# ── Recording ─────────────────────────────────────────────────────────────────
+
+
+def record_timing(kind: str, key: str, seconds: float, **counters) -> None:
+    """Add one *seconds* sample for (kind, key) and bump any named *counters*."""
+    if not METRICS_ENABLED:
+        return
+    with _lock:
+        entry = _entry(kind, key)
+        entry.latency.add(seconds)
+        for name, n in counters.items():
+            if n:
+                entry.counters[name] = entry.counters.get(name, 0) + n
+
+
+def increment_metric(kind: str, key: str, name: str, n: int = 1) -> None:
+    """Bump counter *name* of (kind, key) by *n* without a timing sample."""
+    if not METRICS_ENABLED:
+        return
+    with _lock:
+        entry = _entry(kind, key)
+        entry.counters[name] = entry.counters.get(name, 0) + n
+
+
+def endpoint_template(method: str, path: str) -> str:
+    """Return "METHOD /path" with ids replaced, e.g. "GET /list/{id}/task"."""
+    path = path.split("?", 1)[0]
+    if path.startswith(_API_PREFIX):
+        path = path[len(_API_PREFIX):]
+    segments = path.strip("/").split("/") if path.strip("/") else []
+    for i in range(1, len(segments)):
+        if segments[i - 1] in _ID_AFTER or segments[i].isdigit():
+            segments[i] = "{id}"
+    return f"{method.upper()} /{'/'.join(segments)}"
+
+
+def _timer_key(label: str, context: str) -> str:
+    label = re.sub(r"\s*\([^()]*\d[^()]*\)$", "", label)
+    return f"{context} | {label}" if context else label
+
+
+@contextmanager
+def perf_timer(label: str, context: str = ""):
+    """futil.perf_timer that also records the block in the registry and the trace.
+
+    The [PERF] line is still printed when config.PERF_TRACE is on; the
+    duration is recorded whenever metrics are enabled, and a span while
+    tracing is on (tracing.py).
+    """
+    t0 = time.perf_counter()
+    try:
+        with span(label, context or "perf_timer"), futil.perf_timer(label, context):
+            yield
+    finally:
+        if METRICS_ENABLED:
+            record_timing("timer", _timer_key(label, context), time.perf_counter() - t0)
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+
+def _row(kind: str, key: str, latency: Histogram, counters: dict) -> dict:
+    mean = latency.total / latency.count if latency.count else 0.0
+    return {
+        "kind": kind,
+        "key": key,
+        "count": latency.count,
+        "mean_ms": round(mean * 1000, 1),
+        "p50_ms": round(latency.percentile(0.50) * 1000, 1),
+        "p95_ms": round(latency.percentile(0.95) * 1000, 1),
+        "p99_ms": round(latency.percentile(0.99) * 1000, 1),
+        "max_ms": round(latency.max * 1000, 1),
+        "total_s": round(latency.total, 3),
+        "bytes_sent": counters.get("bytes_sent", 0),
+        "bytes_received": counters.get("bytes_received", 0),
+        "errors": counters.get("errors", 0),
+        "rate_limited": counters.get("rate_limited", 0),
+    }
+
+
+def metrics_snapshot() -> list:
+    """Return this session's metrics as report rows, slowest total time first."""
+    with _lock:
+        rows = [
+            _row(kind, key, entry.latency, dict(entry.counters))
+            for (kind, key), entry in _entries.items()
+        ]
+    rows.sort(key=lambda r: r["total_s"], reverse=True)
+    return rows
+
+
+def _load_report(json_path: str) -> dict:
+    try:
+        with open(json_path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        futil.log(f"metrics: ignoring unreadable '{json_path}': {exc}")
+        return {}
+
+
+def write_metrics_report(directory: str = None) -> tuple:
+    """Fold this session into the running report and return (json_path, csv_path).
+
+    Returns ("", "") when the report cannot be written; the session is then
+    kept so a later call can try again.
+    """
+    directory = directory or METRICS_DIR
+    json_path = os.path.join(directory, "metrics.json")
+    csv_path = os.path.join(directory, "metrics.csv")
+    global _session_started
+
+    with _lock:
+        session, started = dict(_entries), _session_started
+        _entries.clear()
+        _session_started = time.time()
+
+    report = _load_report(json_path)
+    totals: dict = {}
+    for item in report.get("metrics", []):
+        hist = Histogram.from_dict(item.get("latency") or {})
+        totals[(item["kind"], item["key"])] = (hist, dict(item.get("counters") or {}))
+    for (kind, key), entry in session.items():
+        hist, counters = totals.setdefault((kind, key), (Histogram(), {}))
+        hist.merge(entry.latency)
+        for name, n in entry.counters.items():
+            counters[name] = counters.get(name, 0) + n
+
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    report = {
+        "since": report.get("since") or time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "updated": now,
+        "metrics": [
+            {"kind": kind, "key": key, "latency": hist.to_dict(), "counters": counters}
+            for (kind, key), (hist, counters) in sorted(totals.items())
+        ],
+    }
+    rows = sorted(
+        (_row(kind, key, hist, counters) for (kind, key), (hist, counters) in totals.items()),
+        key=lambda r: r["total_s"],
+        reverse=True,
+    )
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{json_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=1)
+        os.replace(tmp_path, json_path)
+        with open(csv_path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=_CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    except Exception as exc:
+        futil.log(f"metrics: failed to write report to '{directory}': {exc}")
+        with _lock:
+            for key, entry in session.items():
+                current = _entry(*key)
+                current.latency.merge(entry.latency)
+                for name, n in entry.counters.items():
+                    current.counters[name] = current.counters.get(name, 0) + n
+        return "", ""
+    return json_path, csv_path
+
+
+def reset_metrics(clear_report: bool = False, directory: str = None) -> None:
+    """Drop this session's metrics and, with *clear_report*, the report on disk."""
+    global _session_started
+    with _lock:
+        _entries.clear()
+        _session_started = time.time()
+    if clear_report:
+        directory = directory or METRICS_DIR
+        for name in ("metrics.json", "metrics.csv"):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Streaming multipart/form-data request bodies.
+
+Building an upload as `header + file_bytes + trailer` copies the whole file
+a second time. A MultipartBody keeps references to its parts and yields them
+in chunks when the request is sent, so the payload is never concatenated.
+It reports its total length up front, so the request still carries a
+Content-Length header (ClickUp rejects chunked uploads). It can be iterated
+more than once, which lets the connection pool retry a stale connection.
+
+Usage:
+    body = cutil.MultipartBody()
+    body.add_file("attachment", "part_thumbnail.png", png_bytes, "image/png")
+    cutil.clickup_request("POST", f"/task/{task_id}/attachment", api_token,
+                          body=body, content_type=body.content_type)
+"""
+
+import uuid
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class MultipartBody:
+    """multipart/form-data body streamed from its parts."""
+
+    def __init__(self, boundary: str = None):
+        self.boundary = boundary or f"----FusionAddInBoundary{uuid.uuid4().hex}"
+        self._parts: list = []  # bytes-like objects, sent in order
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _add_part(self, headers: str, data) -> None:
+        self._parts.append(f"--{self.boundary}\r\n{headers}\r\n".encode("utf-8"))
+        self._parts.append(memoryview(data))
+        self._parts.append(b"\r\n")
+
+    def add_field(self, name: str, value: str) -> None:
+        """Append a plain form field."""
+        self._add_part(
+            f'Content-Disposition: form-data; name="{name}"\r\n', value.encode("utf-8")
+        )
+
+    def add_file(
+        self, name: str, filename: str, data, content_type: str = "application/octet-stream"
+    ) -> None:
+        """Append a file part. *data* (bytes, bytearray or memoryview) is referenced, not copied."""
+        self._add_part(
+            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n",
+            data,
+        )
+
+    def _closing(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("utf-8")
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self._parts) + len(self._closing())
+
+    def __iter__(self):
+        for part in self._parts:
+            view = memoryview(part)
+            for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+                yield view[offset : offset + STREAM_CHUNK_SIZE]
+        yield self._closing()
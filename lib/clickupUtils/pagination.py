@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Streaming paginator for GET /list/{list_id}/task.
+
+ClickUp returns at most 100 tasks per page and flags the final page with
+`"last_page": true`. `iter_task_pages` walks every page, requesting page N+1
+on a background thread while the caller is still consuming page N, so the
+network wait overlaps the caller's processing.
+
+Stopping early is just breaking out of the loop (or closing the generator):
+the in-flight prefetch is abandoned and no further pages are requested.
+
+Usage:
+    for task in cutil.iter_tasks(list_id, api_token, {"include_closed": "true"}):
+        ...
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .http_client import clickup_request
+
+# ClickUp's fixed page size for the Get Tasks endpoint.
+TASKS_PAGE_SIZE = 100
+
+
+class ClickUpPageError(Exception):
+    """Raised when a task page comes back with a non-2xx status."""
+
+    def __init__(self, page: int, status_code: int, body: str):
+        super().__init__(f"page {page} — HTTP {status_code}: {body}")
+        self.page = page
+        self.status_code = status_code
+        self.body = body
+
+
+def _fetch_task_page(list_id: str, api_token: str, params: dict, page: int) -> dict:
+    query = dict(params)
+    query["page"] = page
+    response = clickup_request("GET", f"/list/{list_id}/task", api_token, params=query)
+    if not response.ok:
+        raise ClickUpPageError(page, response.status_code, response.data)
+    return response.json() or {}
+
+
+def iter_task_pages(
+    list_id: str, api_token: str, params: dict = None, *, prefetch: bool = True
+):
+    """Yield each page of tasks (a list of raw task dicts) until the last page.
+
+    *params* are extra query parameters (custom_field, include_closed, ...);
+    `page` is managed here. With *prefetch* the next page is requested as soon
+    as the current one arrives. Raises ClickUpPageError / network errors.
+    """
+    params = dict(params or {})
+    params.pop("page", None)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = 0
+        if executor:
+            pending = executor.submit(_fetch_task_page, list_id, api_token, params, 0)
+        while True:
+            data = pending.result() if executor else _fetch_task_page(
+                list_id, api_token, params, page
+            )
+            tasks = data.get("tasks", [])
+            # Older API responses omit last_page; a short page means the end.
+            is_last = data.get("last_page", len(tasks) < TASKS_PAGE_SIZE) or not tasks
+            if executor and not is_last:
+                pending = executor.submit(
+                    _fetch_task_page, list_id, api_token, params, page + 1
+                )
+            if tasks:
+                yield tasks
+            if is_last:
+                return
+            page += 1
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_tasks(
+    list_id: str,
+    api_token: str,
+    params: dict = None,
+    *,
+    limit: int = None,
+    prefetch: bool = True,
+):
+    """Yield tasks one at a time across all pages, stopping after *limit* if given."""
+    count = 0
+    pages = iter_task_pages(list_id, api_token, params, prefetch=prefetch)
+    try:
+        for tasks in pages:
+            for task in tasks:
+                yield task
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        pages.close()
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Small dependency-aware step executor for a command's network work.
+
+A command's requests rarely form a straight line: the TinyURL shortening
+and the custom-field lookups behind 'Add Task' are independent of each
+other, and only the task POST needs all of them. A Pipeline runs each named
+step on a worker thread as soon as the steps it depends on have finished,
+so independent work overlaps and can start long before the user clicks OK.
+
+Usage:
+    pipeline = cutil.Pipeline("addTask")
+    pipeline.step("urn_field_id", _get_urn_custom_field_id, list_id, api_token)
+    pipeline.step("short_url", _shorten_url, fusion_url, tinyurl_token)
+    pipeline.step("payload", _build_payload, after=("short_url",))  # gets short_url's result
+    ...
+    urn_field_id = pipeline.value("urn_field_id")   # waits; None if it failed
+
+`step()` is idempotent per name, so speculative starts (e.g. from an
+input_changed handler) and the execute path can both request the same step
+and share one result. Step callables run on worker threads and must not
+touch the Fusion API. Each step is timed through metrics.perf_timer.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from ..fusionAddInUtils import general_utils as futil
+from .metrics import perf_timer
+
+MAX_PIPELINE_WORKERS = 4
+
+
+class Pipeline:
+    """Named steps, each started as soon as its dependencies resolve."""
+
+    def __init__(self, name: str, max_workers: int = MAX_PIPELINE_WORKERS):
+        self.name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"pipeline-{name}"
+        )
+        self._steps: dict = {}  # step name → Future
+        self._lock = threading.Lock()
+
+    def __contains__(self, step_name: str) -> bool:
+        with self._lock:
+            return step_name in self._steps
+
+    def step(self, step_name: str, fn: Callable, *args, after: tuple = (), **kwargs) -> Future:
+        """Schedule `fn(*dependency_results, *args, **kwargs)` and return its Future.
+
+        *after* names steps that must finish first; their results are passed
+        to *fn* positionally, in order. A failed dependency fails this step
+        with the same exception. Requesting an existing step returns its
+        Future unchanged.
+        """
+        with self._lock:
+            existing = self._steps.get(step_name)
+            if existing is not None:
+                return existing
+            missing = [d for d in after if d not in self._steps]
+            if missing:
+                raise ValueError(f"{self.name}: step '{step_name}' depends on unknown {missing}")
+            deps = [self._steps[d] for d in after]
+            future = Future()
+            self._steps[step_name] = future
+
+        def _run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                dep_results = [d.result() for d in deps]
+                with perf_timer(step_name, f"pipeline {self.name}"):
+                    result = fn(*dep_results, *args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        remaining = [len(deps)]
+        remaining_lock = threading.Lock()
+
+        def _launch(_dep=None):
+            if _dep is not None:
+                with remaining_lock:
+                    remaining[0] -= 1
+                    if remaining[0]:
+                        return
+            try:
+                self._executor.submit(_run)
+            except RuntimeError:  # pipeline already shut down
+                future.cancel()
+
+        if deps:
+            for dep in deps:
+                dep.add_done_callback(_launch)
+        else:
+            _launch()
+        return future
+
+    def value(self, step_name: str, default=None, timeout: float = None):
+        """Wait for *step_name* and return its result, or *default* if it is
+        unknown, failed, or did not finish within *timeout*."""
+        with self._lock:
+            future = self._steps.get(step_name)
+        if future is None:
+            return default
+        try:
+            return future.result(timeout=timeout)
+        except Exception as exc:
+            futil.log(f"pipeline {self.name}: step '{step_name}' failed: {exc!r}")
+            return default
+
+    def shutdown(self) -> None:
+        """Cancel steps that have not started; running steps finish unobserved."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            steps = list(self._steps.values())
+        for future in steps:
+            future.cancel()
@@ -0,0 +1,242 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Indexed store of Fusion project URN → ClickUp list mappings.
+
+projects.json held every mapping in one document, so adding one project
+rewrote the whole file and every lookup parsed all of it. On a hub with
+thousands of projects, and with the cache folder synced between users,
+that was slow and two users saving at once could drop each other's edits.
+Mappings now live in cache/projects.sqlite:
+
+  projects     — urn (primary key), JSON body of the entry, updated_at
+  store_state  — (mtime, size) stamp of the last projects.json imported
+
+A lookup is a primary-key seek and a save updates one row inside an
+IMMEDIATE transaction, so concurrent writers queue up instead of
+overwriting each other. Rows already read are served from memory until the
+database's change counter moves (any commit, by any user).
+
+An existing projects.json is imported on first use and again whenever its
+stamp changes (a hand edit, or an older add-in version writing it), so the
+switch is transparent. An entry from the file replaces a row only when the
+file was modified after the row's updated_at, so a stale copy never undoes
+newer saves. The JSON file is left in place; it is no longer written.
+
+Usage:
+    list_id = cutil.get_list_id_for_project(project_urn)
+    cutil.save_project_mapping(project_urn, {"clickup_list_id": "9011..."})
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+
+    PROJECTS_DB_PATH = config.PROJECTS_DB_PATH
+    LEGACY_PROJECTS_JSON_PATH = config.PROJECTS_JSON_PATH
+except Exception:
+    _CACHE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+    )
+    PROJECTS_DB_PATH = os.path.join(_CACHE_DIR, "projects.sqlite")
+    LEGACY_PROJECTS_JSON_PATH = os.path.join(_CACHE_DIR, "projects.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    urn        TEXT PRIMARY KEY,
+    body       TEXT NOT NULL,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS store_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _db_change_counter(path: str):
+    """Return the SQLite header's file change counter — bumped by every commit."""
+    try:
+        with open(path, "rb") as fh:
+            header = fh.read(28)
+    except OSError:
+        return None
+    return header[24:28] if len(header) == 28 else None
+
+
+def _file_stamp(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+class ProjectStore:
+    """Project mappings in SQLite, migrated from a legacy projects.json."""
+
+    def __init__(self, db_path: str, legacy_json_path: str = None):
+        self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
+        self._ready = False
+        self._legacy_stamp = None  # stamp of projects.json last checked
+        self._db_stamp = None  # change counter of the database the memo reflects
+        self._memo: dict = {}  # urn → entry dict (or None for "not mapped")
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _connect(self):
+        """Yield a connection inside one transaction; always closed on exit."""
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _prepare(self) -> None:
+        """Create the schema once and import projects.json when it changed."""
+        legacy_stamp = _file_stamp(self.legacy_json_path) if self.legacy_json_path else None
+        if self._ready and legacy_stamp == self._legacy_stamp:
+            return
+        with self._lock:
+            if not self._ready:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                with self._connect() as db:
+                    db.executescript(_SCHEMA)
+                self._ready = True
+            if legacy_stamp != self._legacy_stamp:
+                if legacy_stamp is not None:
+                    self._import_legacy_json(legacy_stamp)
+                self._legacy_stamp = legacy_stamp
+
+    def _import_legacy_json(self, stamp: str) -> None:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT value FROM store_state WHERE key = 'legacy_json_stamp'"
+            ).fetchone()
+            if row and row[0] == stamp:
+                return
+            try:
+                modified = os.path.getmtime(self.legacy_json_path)
+                with open(self.legacy_json_path, "r", encoding="utf-8") as fh:
+                    projects = json.load(fh).get("projects", {})
+            except (OSError, ValueError, AttributeError) as exc:
+                futil.log(
+                    f"project_store: cannot import '{self.legacy_json_path}': {exc}"
+                )
+                return
+            # Rows saved (or imported) after the file was written keep their body
+            db.executemany(
+                "INSERT INTO projects (urn, body, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (urn) DO UPDATE SET body = excluded.body, "
+                "updated_at = excluded.updated_at "
+                "WHERE projects.updated_at IS NULL OR projects.updated_at < excluded.updated_at",
+                [
+                    (urn, json.dumps(entry), modified)
+                    for urn, entry in projects.items()
+                    if isinstance(entry, dict)
+                ],
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO store_state (key, value) VALUES ('legacy_json_stamp', ?)",
+                (stamp,),
+            )
+        futil.log(
+            f"project_store: imported {len(projects)} mapping(s) from '{self.legacy_json_path}'"
+        )
+
+    def _refresh_memo(self) -> None:
+        """Drop memoized rows when the database changed on disk. Caller holds _lock."""
+        stamp = _db_change_counter(self.db_path)
+        if stamp is None or stamp != self._db_stamp:
+            self._memo.clear()
+            self._db_stamp = stamp
+
+    def get(self, project_urn: str) -> dict:
+        """Return a copy of the entry for *project_urn*, or {} when it is not mapped."""
+        try:
+            self._prepare()
+            with self._lock:
+                self._refresh_memo()
+                if project_urn not in self._memo:
+                    with self._connect() as db:
+                        row = db.execute(
+                            "SELECT body FROM projects WHERE urn = ?", (project_urn,)
+                        ).fetchone()
+                    self._memo[project_urn] = json.loads(row[0]) if row else None
+                entry = self._memo[project_urn]
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            futil.log(f"project_store: lookup of '{project_urn}' failed: {exc}")
+            return {}
+        return dict(entry) if entry else {}
+
+    def save(self, project_urn: str, fields: dict) -> bool:
+        """Merge *fields* into the entry for *project_urn*, keeping unrelated keys.
+
+        Returns True when the project was already mapped. Raises sqlite3.Error
+        or OSError when the store cannot be written.
+        """
+        self._prepare()
+        with self._lock:
+            with self._connect() as db:
+                db.execute("BEGIN IMMEDIATE")  # serialize read-merge-write across users
+                row = db.execute(
+                    "SELECT body FROM projects WHERE urn = ?", (project_urn,)
+                ).fetchone()
+                entry = json.loads(row[0]) if row else {}
+                entry.update(fields)
+                db.execute(
+                    "INSERT OR REPLACE INTO projects (urn, body, updated_at) VALUES (?, ?, ?)",
+                    (project_urn, json.dumps(entry), time.time()),
+                )
+            self._memo.clear()
+            self._db_stamp = None
+        return row is not None
+
+    def has_mappings(self) -> bool:
+        """Return True when at least one project is mapped."""
+        try:
+            self._prepare()
+            with self._connect() as db:
+                return db.execute("SELECT 1 FROM projects LIMIT 1").fetchone() is not None
+        except (sqlite3.Error, OSError) as exc:
+            futil.log(f"project_store: cannot open '{self.db_path}': {exc}")
+            return False
+
+
+project_store = ProjectStore(PROJECTS_DB_PATH, LEGACY_PROJECTS_JSON_PATH)
+
+
+def get_project_mapping(project_urn: str) -> dict:
+    """Return the mapping entry for *project_urn*, or {}."""
+    return project_store.get(project_urn)
+
+
+def get_list_id_for_project(project_urn: str) -> str:
+    """Return the mapped "clickup_list_id" for *project_urn*, or ''."""
+    return (get_project_mapping(project_urn).get("clickup_list_id") or "").strip()
+
+
+def get_clickup_url_for_project(project_urn: str) -> str:
+    """Return the mapped "clickup_url" for *project_urn*, or ''."""
+    return (get_project_mapping(project_urn).get("clickup_url") or "").strip()
+
+
+def save_project_mapping(project_urn: str, fields: dict) -> bool:
+    """Merge *fields* into the entry for *project_urn*; True when it already existed."""
+    return project_store.save(project_urn, fields)
+
+
+def project_mappings_exist() -> bool:
+    """Return True when any project has been mapped (or projects.json can be imported)."""
+    return project_store.has_mappings()
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Per-token request scheduler that keeps ClickUp calls inside the rate limit.
+
+ClickUp budgets requests per API token per minute and reports the budget on
+every response:
+
+  X-RateLimit-Limit      requests allowed per window
+  X-RateLimit-Remaining  requests left in the current window
+  X-RateLimit-Reset      unix time (seconds) when the window resets
+
+Each token gets a RateLimiter — a token bucket that starts from a
+conservative default, learns the real budget from those headers, and pauses
+until the reset time when the budget runs out or ClickUp answers 429.
+Callers block in `acquire()` instead of failing; waiters are served by
+priority, then FIFO, so dialog requests overtake queued background work.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+PRIORITY_INTERACTIVE = 0  # a dialog is waiting on this request
+PRIORITY_BACKGROUND = 1  # prefetch / post-creation work nobody is watching
+
+# ClickUp's smallest plan allows 100 requests per minute per token.
+DEFAULT_LIMIT_PER_MINUTE = 100
+WINDOW_SECONDS = 60.0
+# Longer than one full window, so a queued request survives a complete reset.
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 90.0
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a request could not be scheduled within the wait timeout."""
+
+
+class RateLimiter:
+    """Token bucket for one API token, refilled at limit / WINDOW_SECONDS."""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT_PER_MINUTE):
+        self._cond = threading.Condition()
+        self._limit = float(limit)
+        self._tokens = float(limit)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list = []  # heap of (priority, ticket)
+        self._tickets = itertools.count()
+
+    def _refill(self, now: float) -> None:
+        rate = self._limit / WINDOW_SECONDS
+        self._tokens = min(self._limit, self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def acquire(
+        self,
+        priority: int = PRIORITY_INTERACTIVE,
+        timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+    ) -> float:
+        """Block until this caller may send one request. Returns seconds waited."""
+        entry = (priority, next(self._tickets))
+        start = time.monotonic()
+        deadline = start + timeout
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    is_head = self._waiters[0] == entry
+                    if is_head and now >= self._blocked_until and self._tokens >= 1.0:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1.0
+                        self._cond.notify_all()
+                        return now - start
+                    if now >= deadline:
+                        raise RateLimitTimeout(
+                            f"no request budget after {timeout:.0f} s"
+                        )
+                    if not is_head:
+                        wait = deadline - now  # woken by notify_all when head moves
+                    elif now < self._blocked_until:
+                        wait = self._blocked_until - now
+                    else:
+                        wait = (1.0 - self._tokens) * WINDOW_SECONDS / self._limit
+                    self._cond.wait(min(wait, deadline - now))
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+                raise
+
+    def observe(self, status_code: int, headers: dict) -> None:
+        """Learn the budget from a response's X-RateLimit-* / Retry-After headers."""
+        now = time.monotonic()
+        limit = _int_header(headers, "x-ratelimit-limit")
+        remaining = _int_header(headers, "x-ratelimit-remaining")
+        reset_epoch = _int_header(headers, "x-ratelimit-reset")
+        retry_after = _int_header(headers, "retry-after")
+
+        reset_at = None
+        if reset_epoch is not None:
+            reset_at = now + max(0.0, reset_epoch - time.time())
+        elif retry_after is not None:
+            reset_at = now + retry_after
+
+        with self._cond:
+            self._refill(now)
+            if limit:
+                self._limit = float(limit)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+            if status_code == 429 or (remaining is not None and remaining <= 0):
+                self._tokens = 0.0
+                # No reset hint on a 429: sit out one full window.
+                self._blocked_until = max(
+                    self._blocked_until,
+                    reset_at if reset_at is not None else now + WINDOW_SECONDS,
+                )
+            self._cond.notify_all()
+
+
+def _int_header(headers: dict, name: str):
+    try:
+        return int(float(headers[name]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_limiters: dict = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_token: str) -> RateLimiter:
+    """Return the shared RateLimiter for *api_token*, creating it on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(api_token)
+        if limiter is None:
+            limiter = _limiters[api_token] = RateLimiter()
+        return limiter
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Disk-backed memo of shortened URLs (long URL → TinyURL).
+
+The Open-on-Desktop link for a document only changes when the document is
+renamed or moved, yet 'Add Task' used to shorten it afresh for every task —
+an external round trip and one unit of TinyURL quota each time. Short links
+are remembered in cache/short_urls.json:
+
+  {"version": 1, "entries": [[long_url, short_url, last_used_epoch], ...]}
+
+Entries are kept in least-recently-used order and capped at
+MAX_SHORT_URLS; the oldest are evicted first. A hit only reorders the table
+in memory; the file is rewritten when a URL is added and by
+flush_short_urls() at add-in stop. Writes are atomic (temp file +
+os.replace). Concurrent requests for the same URL share one API call.
+
+Usage:
+    short_url = cutil.memoized_short_url(fusion_url, lambda u: _shorten_url(u, token))
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+
+    SHORT_URL_CACHE_PATH = os.path.join(config.CACHE_DIR, "short_urls.json")
+except Exception:
+    SHORT_URL_CACHE_PATH = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+        "short_urls.json",
+    )
+
+MAX_SHORT_URLS = 500
+
+_entries = None  # OrderedDict long_url → (short_url, last_used), oldest first
+_dirty = False  # recency changed in memory since the last write
+_lock = threading.Lock()
+_inflight: dict = {}  # long_url → threading.Lock held while it is being shortened
+
+
+def _load() -> OrderedDict:
+    """Return the in-memory table, reading the disk file once. Caller holds _lock."""
+    global _entries
+    if _entries is not None:
+        return _entries
+    _entries = OrderedDict()
+    if os.path.exists(SHORT_URL_CACHE_PATH):
+        try:
+            with open(SHORT_URL_CACHE_PATH, encoding="utf-8") as fh:
+                payload = json.load(fh)
+            rows = sorted(payload.get("entries", []), key=lambda r: r[2])
+            for long_url, short_url, last_used in rows[-MAX_SHORT_URLS:]:
+                _entries[long_url] = (short_url, last_used)
+        except Exception:
+            futil.log(f"short_url_cache: failed to read '{SHORT_URL_CACHE_PATH}' — ignoring")
+    return _entries
+
+
+def _save(entries: OrderedDict) -> None:
+    """Write *entries* atomically. Caller holds _lock."""
+    global _dirty
+    tmp_path = f"{SHORT_URL_CACHE_PATH}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SHORT_URL_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"version": 1, "entries": [[k, v[0], v[1]] for k, v in entries.items()]},
+                fh,
+            )
+        os.replace(tmp_path, SHORT_URL_CACHE_PATH)
+        _dirty = False
+    except Exception:
+        futil.log(f"short_url_cache: failed to write '{SHORT_URL_CACHE_PATH}' — ignoring")
+
+
+def get_short_url(long_url: str):
+    """Return the memoized short URL for *long_url* (marking it recently used), or None."""
+    global _dirty
+    with _lock:
+        entries = _load()
+        hit = entries.get(long_url)
+        if hit is None:
+            return None
+        entries[long_url] = (hit[0], time.time())
+        entries.move_to_end(long_url)
+        _dirty = True
+        return hit[0]
+
+
+def put_short_url(long_url: str, short_url: str) -> None:
+    """Remember *short_url* for *long_url*, evicting least-recently-used entries over the cap."""
+    with _lock:
+        entries = _load()
+        entries[long_url] = (short_url, time.time())
+        entries.move_to_end(long_url)
+        while len(entries) > MAX_SHORT_URLS:
+            entries.popitem(last=False)
+        _save(entries)
+
+
+def flush_short_urls() -> None:
+    """Write recency changes from cache hits to disk (add-in stop)."""
+    with _lock:
+        if _dirty and _entries is not None:
+            _save(_entries)
+
+
+def memoized_short_url(long_url: str, shorten: Callable):
+    """Return the short URL for *long_url*, calling `shorten(long_url)` only on a miss.
+
+    *shorten* returns the short URL or None on failure; failures are not
+    memoized. Safe to call from worker threads — concurrent calls for the
+    same URL wait for the first one instead of shortening twice.
+    """
+    short_url = get_short_url(long_url)
+    if short_url:
+        return short_url
+    with _lock:
+        key_lock = _inflight.setdefault(long_url, threading.Lock())
+    with key_lock:
+        short_url = get_short_url(long_url)  # filled while we waited?
+        if not short_url:
+            short_url = shorten(long_url)
+            if short_url:
+                put_short_url(long_url, short_url)
+    with _lock:
+        _inflight.pop(long_url, None)
+    return short_url
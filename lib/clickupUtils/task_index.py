@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Client-side matching over raw ClickUp task dicts.
+
+ClickUp's text custom-field filter can return fuzzy matches, so commands
+must match the 'Fusion Document URN' value exactly on the client. Splitting
+one list download into matches and the rest in a single pass replaces the
+second, filtered download.
+"""
+
+
+def custom_field_value(task: dict, field_id: str):
+    """Return *task*'s value for the custom field *field_id*, or None if unset."""
+    for cf in task.get("custom_fields", []):
+        if cf.get("id") == field_id:
+            return cf.get("value")
+    return None
+
+
+def partition_tasks_by_custom_field(tasks: list, field_id: str, value) -> tuple:
+    """Split *tasks* into (exact matches for *value*, everything else) in one pass."""
+    matches, rest = [], []
+    for task in tasks:
+        if custom_field_value(task, field_id) == value:
+            matches.append(task)
+        else:
+            rest.append(task)
+    return matches, rest
@@ -0,0 +1,369 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Per-list SQLite mirror of ClickUp tasks with incremental sync.
+
+Each list gets cache/tasks_<list_id>.sqlite holding:
+
+  tasks        — id, date_created, date_updated, priority order, raw task
+                 JSON; indexed on (priority_order, date_created) so the first
+                 page of a priority-sorted table is read without the rest
+  task_fields  — (task_id, field_id, value) for every custom field that has
+                 a value, indexed on (field_id, value) so the 'Fusion Document
+                 URN' lookup is an index seek instead of a list scan
+  sync_state   — high-water mark and last full-sync time
+
+`sync()` asks ClickUp only for tasks with `date_updated_gt` the stored high-
+water mark, so an unchanged list costs one small request. Deletions and
+tasks moved to another list never show up in a delta, so the mirror is
+rebuilt from a full download every FULL_RESYNC_SECONDS. In between, the
+dialogs' own saves are written through with record_updates(), which also
+drops tasks ClickUp answers 404 for or reports in another list.
+
+Usage:
+    mirror = cutil.sync_task_mirror(list_id, api_token)
+    doc_tasks = mirror.tasks_with_field_value(urn_field_id, doc_urn)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from ..fusionAddInUtils import general_utils as futil
+from .metrics import perf_timer
+from .pagination import iter_task_pages
+
+try:
+    from ... import config
+
+    TASK_MIRROR_DIR = config.CACHE_DIR
+except Exception:
+    TASK_MIRROR_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+    )
+
+SCHEMA_VERSION = "2"
+FULL_RESYNC_SECONDS = 30 * 60
+# Re-request a small window before the high-water mark so tasks updated in
+# the same millisecond as the last sync are not missed (upserts are idempotent).
+HIGH_WATER_OVERLAP_MS = 1000
+# priority_order of tasks without a priority: after Low (4)
+NO_PRIORITY_ORDER = 99
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id             TEXT PRIMARY KEY,
+    date_created   INTEGER,
+    date_updated   INTEGER,
+    priority_order INTEGER NOT NULL,
+    body           TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_priority ON tasks (priority_order, date_created DESC, id);
+CREATE TABLE IF NOT EXISTS task_fields (
+    task_id  TEXT NOT NULL,
+    field_id TEXT NOT NULL,
+    value    TEXT,
+    PRIMARY KEY (task_id, field_id)
+);
+CREATE INDEX IF NOT EXISTS task_fields_by_value ON task_fields (field_id, value);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_list_locks: dict = {}
+_list_locks_guard = threading.Lock()
+_prepared_paths: set = set()  # mirror files whose schema is known to be current
+_prepare_lock = threading.Lock()
+
+
+def _list_lock(list_id: str) -> threading.Lock:
+    with _list_locks_guard:
+        return _list_locks.setdefault(list_id, threading.Lock())
+
+
+def _int_or_zero(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def priority_order(task: dict) -> int:
+    """Sort key of *task*'s priority: 1 (Urgent) … 4 (Low), NO_PRIORITY_ORDER when unset."""
+    try:
+        order = int((task.get("priority") or {}).get("id"))
+    except (TypeError, ValueError):
+        return NO_PRIORITY_ORDER
+    return order if 1 <= order <= 4 else NO_PRIORITY_ORDER
+
+
+def _field_value_text(value):
+    """Store text values verbatim (exact-match lookups); everything else as JSON."""
+    if value is None or value == "":
+        return None
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def task_mirror_path(list_id: str) -> str:
+    """Return the SQLite path for *list_id*'s mirror."""
+    safe_id = re.sub(r"[^\w\-]", "_", str(list_id))
+    return os.path.join(TASK_MIRROR_DIR, f"tasks_{safe_id}.sqlite")
+
+
+class TaskMirror:
+    """Local copy of one ClickUp list. Every method opens its own connection,
+    so a mirror may be used from worker threads."""
+
+    def __init__(self, list_id: str):
+        self.list_id = str(list_id)
+        self.path = task_mirror_path(self.list_id)
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """Create or migrate the schema once per file per session."""
+        if self.path in _prepared_paths and os.path.exists(self.path):
+            return
+        with _prepare_lock:
+            if self.path in _prepared_paths and os.path.exists(self.path):
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._connect() as db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                version = self._get_state(db, "schema_version")
+                if version not in (None, SCHEMA_VERSION):
+                    # Older layout: rebuild; the next sync is a full download
+                    db.executescript(
+                        "DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS task_fields; "
+                        "DELETE FROM sync_state;"
+                    )
+                db.executescript(_SCHEMA)
+                if version != SCHEMA_VERSION:
+                    self._set_state(db, "schema_version", SCHEMA_VERSION)
+            _prepared_paths.add(self.path)
+
+    @contextmanager
+    def _connect(self):
+        """Yield a connection inside one transaction; always closed on exit."""
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def _get_state(db, key: str):
+        row = db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_state(db, key: str, value) -> None:
+        db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _upsert(db, tasks: list) -> int:
+        high_water = 0
+        for task in tasks:
+            tid = task.get("id")
+            if not tid:
+                continue
+            updated = _int_or_zero(task.get("date_updated"))
+            high_water = max(high_water, updated)
+            db.execute(
+                "INSERT OR REPLACE INTO tasks "
+                "(id, date_created, date_updated, priority_order, body) VALUES (?, ?, ?, ?, ?)",
+                (
+                    tid,
+                    _int_or_zero(task.get("date_created")),
+                    updated,
+                    priority_order(task),
+                    json.dumps(task),
+                ),
+            )
+            db.execute("DELETE FROM task_fields WHERE task_id = ?", (tid,))
+            db.executemany(
+                "INSERT INTO task_fields (task_id, field_id, value) VALUES (?, ?, ?)",
+                [
+                    (tid, cf["id"], _field_value_text(cf.get("value")))
+                    for cf in task.get("custom_fields", [])
+                    if cf.get("id") and _field_value_text(cf.get("value")) is not None
+                ],
+            )
+        return high_water
+
+    def upsert_tasks(self, tasks: list) -> None:
+        """Write-through for tasks the add-in created or changed itself."""
+        with self._connect() as db:
+            self._upsert(db, tasks)
+
+    def remove_tasks(self, task_ids) -> None:
+        """Drop tasks that were deleted in ClickUp or moved to another list."""
+        rows = [(tid,) for tid in task_ids]
+        if not rows:
+            return
+        with self._connect() as db:
+            db.executemany("DELETE FROM tasks WHERE id = ?", rows)
+            db.executemany("DELETE FROM task_fields WHERE task_id = ?", rows)
+
+    def record_updates(self, results: list) -> None:
+        """Write update_tasks() results through to the mirror.
+
+        Each returned task is merged over its mirrored copy (so fields the
+        PUT response leaves out are kept); a 404, or a task now in another
+        list, removes the task.
+        """
+        gone, updated = [], []
+        for result in results:
+            task = getattr(result, "task", None)
+            if result.status_code == 404:
+                gone.append(result.task_id)
+            elif result.ok and task:
+                home = (task.get("list") or {}).get("id")
+                if home and str(home) != self.list_id:
+                    gone.append(result.task_id)
+                else:
+                    updated.append(task)
+        self.remove_tasks(gone)
+        if not updated:
+            return
+        with self._connect() as db:
+            merged = []
+            for task in updated:
+                row = db.execute("SELECT body FROM tasks WHERE id = ?", (task.get("id"),)).fetchone()
+                merged.append({**json.loads(row[0]), **task} if row else task)
+            self._upsert(db, merged)
+
+    def record_custom_field(self, task_id: str, field_id: str, value) -> None:
+        """Reflect a successful POST /task/{id}/field/{field_id} in the mirror."""
+        with self._connect() as db:
+            row = db.execute("SELECT body FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                return
+            task = json.loads(row[0])
+            fields = task.setdefault("custom_fields", [])
+            for cf in fields:
+                if cf.get("id") == field_id:
+                    cf["value"] = value
+                    break
+            else:
+                fields.append({"id": field_id, "value": value})
+            self._upsert(db, [task])
+
+    # ── Sync ──────────────────────────────────────────────────────────────────
+
+    def sync(self, api_token: str, *, force_full: bool = False) -> int:
+        """Bring the mirror up to date with ClickUp; return the number of tasks received.
+
+        Raises on network/HTTP failure; the mirror is left unchanged for a
+        failed full sync and partially advanced for a failed delta sync.
+        """
+        with _list_lock(self.list_id):
+            with self._connect() as db:
+                high_water = _int_or_zero(self._get_state(db, "high_water_ms"))
+                last_full = float(self._get_state(db, "last_full_sync") or 0)
+            full = force_full or not high_water or time.time() - last_full > FULL_RESYNC_SECONDS
+
+            params = {"include_closed": "true"}
+            if not full:
+                params["date_updated_gt"] = max(0, high_water - HIGH_WATER_OVERLAP_MS)
+
+            label = "full" if full else "delta"
+            received = 0
+            with perf_timer(f"task mirror {label} sync (list {self.list_id})", "cutil"):
+                if full:
+                    tasks = [t for page in iter_task_pages(self.list_id, api_token, params) for t in page]
+                    received = len(tasks)
+                    with self._connect() as db:
+                        db.execute("DELETE FROM tasks")
+                        db.execute("DELETE FROM task_fields")
+                        high_water = max(high_water, self._upsert(db, tasks))
+                        self._set_state(db, "high_water_ms", high_water)
+                        self._set_state(db, "last_full_sync", time.time())
+                else:
+                    for page in iter_task_pages(self.list_id, api_token, params):
+                        received += len(page)
+                        with self._connect() as db:
+                            high_water = max(high_water, self._upsert(db, page))
+                            self._set_state(db, "high_water_ms", high_water)
+            with self._connect() as db:
+                self._set_state(db, "last_sync", time.time())
+            futil.log(f"task mirror: {label} sync of list '{self.list_id}' — {received} task(s)")
+            return received
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def all_tasks(self) -> list:
+        """Return every mirrored task, newest first (ClickUp's default order)."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT body FROM tasks ORDER BY date_created DESC, id"
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def tasks_with_field_value(self, field_id: str, value) -> list:
+        """Return tasks whose custom field *field_id* equals *value* exactly (indexed)."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT t.body FROM task_fields f JOIN tasks t ON t.id = f.task_id "
+                "WHERE f.field_id = ? AND f.value = ? ORDER BY t.date_created DESC, t.id",
+                (field_id, _field_value_text(value)),
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def last_synced(self) -> float:
+        """Return the epoch time of the last successful sync, or 0 if never synced."""
+        with self._connect() as db:
+            return float(self._get_state(db, "last_sync") or 0)
+
+    def tasks_by_priority(self, limit: int, exclude_field_id: str = "", exclude_value=None) -> list:
+        """Return the first *limit* tasks by priority, then newest first (indexed).
+
+        Tasks whose custom field *exclude_field_id* equals *exclude_value* are
+        skipped. Only the returned rows are read and decoded, so this costs
+        the same for any list size.
+        """
+        sql = "SELECT body FROM tasks"
+        params: tuple = ()
+        if exclude_field_id:
+            sql += (
+                " WHERE id NOT IN (SELECT task_id FROM task_fields"
+                " WHERE field_id = ? AND value = ?)"
+            )
+            params = (exclude_field_id, _field_value_text(exclude_value))
+        sql += " ORDER BY priority_order, date_created DESC, id LIMIT ?"
+        with self._connect() as db:
+            rows = db.execute(sql, params + (limit,)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+
+def get_task_mirror(list_id: str) -> TaskMirror:
+    """Open (creating if needed) the mirror for *list_id* without syncing it."""
+    return TaskMirror(list_id)
+
+
+def sync_task_mirror(list_id: str, api_token: str) -> TaskMirror:
+    """Open the mirror for *list_id* and sync it. A failed sync is logged and the
+    last mirrored data is served instead."""
+    mirror = TaskMirror(list_id)
+    try:
+        mirror.sync(api_token)
+    except Exception as exc:
+        futil.log(f"task mirror: sync of list '{list_id}' failed — serving mirrored data: {exc}")
+    return mirror
@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Content-addressed disk cache of document thumbnails.
+
+Every task linked to a document used to download the 256×256 thumbnail
+from the Fusion cloud and upload it to ClickUp again, even when ten tasks
+were filed against the same document version. Thumbnails are now kept under
+cache/thumbnails/:
+
+  <sha256>.png   — one file per distinct image (content hash)
+  index.json     — {"versions": {"<file id>@<version>": {"hash", "last_used"}},
+                    "blobs":    {"<sha256>": {"size", "last_used"}}}
+
+A (DataFile id, versionNumber) pair resolves to a content hash, so a second
+task on the same version skips the Fusion download, and versions whose
+image did not change share one blob. Blobs are evicted least-recently-used
+once the directory exceeds MAX_THUMBNAIL_CACHE_BYTES. Cache hits only
+update recency in memory; flush_thumbnail_cache() writes it at add-in stop.
+Uploads are not recorded: Add Task only ever attaches to a task it has just created.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+
+    THUMBNAIL_CACHE_DIR = os.path.join(config.CACHE_DIR, "thumbnails")
+except Exception:
+    THUMBNAIL_CACHE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+        "thumbnails",
+    )
+
+MAX_THUMBNAIL_CACHE_BYTES = 20 * 1024 * 1024
+
+_index = None
+_dirty = False  # recency changed in memory since the last write
+_lock = threading.Lock()
+
+
+def _index_path() -> str:
+    return os.path.join(THUMBNAIL_CACHE_DIR, "index.json")
+
+
+def _blob_path(digest: str) -> str:
+    return os.path.join(THUMBNAIL_CACHE_DIR, f"{digest}.png")
+
+
+def _version_key(file_id: str, version) -> str:
+    return f"{file_id}@{version}"
+
+
+def _load() -> dict:
+    """Return the in-memory index, reading it from disk once. Caller holds _lock."""
+    global _index
+    if _index is not None:
+        return _index
+    _index = {"versions": {}, "blobs": {}}
+    path = _index_path()
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                payload = json.load(fh)
+            for section in _index:
+                _index[section].update(payload.get(section, {}))
+        except Exception:
+            futil.log(f"thumbnail_cache: failed to read '{path}' — ignoring")
+    return _index
+
+
+def _save(index: dict) -> None:
+    """Write the index atomically. Caller holds _lock."""
+    global _dirty
+    path = _index_path()
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh)
+        os.replace(tmp_path, path)
+        _dirty = False
+    except Exception:
+        futil.log(f"thumbnail_cache: failed to write '{path}' — ignoring")
+
+
+def _evict(index: dict) -> None:
+    """Drop least-recently-used blobs until the cache fits. Caller holds _lock."""
+    blobs = index["blobs"]
+    total = sum(b["size"] for b in blobs.values())
+    for digest in sorted(blobs, key=lambda d: blobs[d]["last_used"]):
+        if total <= MAX_THUMBNAIL_CACHE_BYTES:
+            break
+        total -= blobs.pop(digest)["size"]
+        try:
+            os.remove(_blob_path(digest))
+        except OSError:
+            pass
+        futil.log(f"thumbnail_cache: evicted {digest[:12]}…")
+    index["versions"] = {
+        k: v for k, v in index["versions"].items() if v["hash"] in blobs
+    }
+
+
+def cached_thumbnail_digest(file_id: str, version) -> str:
+    """Return the content hash cached for this document version, or '' — no disk read of the image."""
+    with _lock:
+        entry = _load()["versions"].get(_version_key(file_id, version))
+        return entry["hash"] if entry else ""
+
+
+def cached_thumbnail(file_id: str, version):
+    """Return the cached PNG bytes for this document version, or None."""
+    global _dirty
+    with _lock:
+        index = _load()
+        entry = index["versions"].get(_version_key(file_id, version))
+        if entry is None:
+            return None
+        digest = entry["hash"]
+        try:
+            with open(_blob_path(digest), "rb") as fh:
+                png = fh.read()
+        except OSError:
+            # Blob vanished from disk — forget it so it is downloaded again
+            index["versions"].pop(_version_key(file_id, version), None)
+            index["blobs"].pop(digest, None)
+            _save(index)
+            return None
+        now = time.time()
+        entry["last_used"] = now
+        if digest in index["blobs"]:
+            index["blobs"][digest]["last_used"] = now
+        _dirty = True
+        return png
+
+
+def store_thumbnail(file_id: str, version, png: bytes) -> str:
+    """Cache *png* for this document version and return its content hash."""
+    digest = hashlib.sha256(png).hexdigest()
+    now = time.time()
+    with _lock:
+        index = _load()
+        if digest not in index["blobs"]:
+            try:
+                os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+                tmp_path = f"{_blob_path(digest)}.tmp"
+                with open(tmp_path, "wb") as fh:
+                    fh.write(png)
+                os.replace(tmp_path, _blob_path(digest))
+            except OSError as exc:
+                futil.log(f"thumbnail_cache: failed to store {digest[:12]}…: {exc}")
+                return digest
+            index["blobs"][digest] = {"size": len(png), "last_used": now}
+        else:
+            index["blobs"][digest]["last_used"] = now
+        index["versions"][_version_key(file_id, version)] = {"hash": digest, "last_used": now}
+        _evict(index)
+        _save(index)
+    return digest
+
+
+def flush_thumbnail_cache() -> None:
+    """Write recency changes from cache hits to disk (add-in stop)."""
+    with _lock:
+        if _dirty and _index is not None:
+            _save(_index)
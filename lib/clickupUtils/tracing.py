@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2022-2026 IMA LLC
+
+"""Chrome trace-event spans for command lifecycles.
+
+perf_timer lines say how long a block took, not how blocks overlap across
+the main thread, the bootstrap pool and the background workers. With
+config.TRACE_ENABLED, spans are recorded for:
+
+  - each command invocation, from command_created to command_destroy;
+  - each dialog event handler decorated with @traced(CMD_NAME);
+  - each pooled HTTP request (http_client) and each cutil.perf_timer block;
+  - each background task run and each main-thread result delivery.
+
+Closing an invocation writes its events to
+cache/traces/<command>-<time>.json in Chrome trace-event format; open it
+in chrome://tracing or https://ui.perfetto.dev. Spans nest by time on each
+thread, so a handler shows its HTTP calls and timed blocks beneath it.
+Written events leave the buffer, so write_trace() from stop() dumps only
+what no dialog's file holds yet (e.g. post-OK uploads).
+
+When tracing is off, span() returns a shared no-op context manager and
+@traced handlers run unwrapped apart from one flag check.
+"""
+
+import functools
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+from ..fusionAddInUtils import general_utils as futil
+
+try:
+    from ... import config
+
+    TRACE_ENABLED = getattr(config, "TRACE_ENABLED", False)
+    TRACES_DIR = os.path.join(config.CACHE_DIR, "traces")
+except Exception:
+    TRACE_ENABLED = False
+    TRACES_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "cache",
+        "traces",
+    )
+
+# Oldest events are dropped beyond this, so a forgotten trace cannot grow unbounded
+MAX_TRACE_EVENTS = 200_000
+
+_lock = threading.Lock()
+_events: deque = deque(maxlen=MAX_TRACE_EVENTS)
+_thread_names: dict = {}  # tid → thread name
+_invocations: dict = {}  # command name → start timestamp (µs) of the open invocation
+_file_counter = itertools.count(1)
+_PID = os.getpid()
+
+
+def _now_us() -> float:
+    return time.perf_counter() * 1_000_000
+
+
+def _record(event: dict) -> None:
+    thread = threading.current_thread()
+    event["pid"] = _PID
+    event["tid"] = thread.ident
+    with _lock:
+        _events.append(event)
+        if thread.ident not in _thread_names:
+            _thread_names[thread.ident] = thread.name
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "t0")
+
+    def __init__(self, name: str, cat: str, args: dict):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.t0 = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        now = _now_us()
+        event = {"name": self.name, "cat": self.cat, "ph": "X", "ts": self.t0, "dur": now - self.t0}
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.args:
+            event["args"] = self.args
+        _record(event)
+        return False
+
+    def set(self, **args) -> None:
+        """Attach *args* to the span, e.g. a response status known only at the end."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def tracing_enabled() -> bool:
+    return TRACE_ENABLED
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """Turn span recording on or off at runtime (initially config.TRACE_ENABLED)."""
+    global TRACE_ENABLED
+    TRACE_ENABLED = enabled
+
+
+def span(name: str, cat: str = "", **args):
+    """Context manager recording a complete event *name* around the block."""
+    if not TRACE_ENABLED:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def traced(cat: str, name: str = None, *, begin: bool = False, end: bool = False):
+    """Decorator: record a span named after the function (or *name*) per call.
+
+    For command handlers *cat* is CMD_NAME. `begin=True` (command_created)
+    opens the command's invocation before the span; `end=True`
+    (command_destroy) closes it and writes the trace file after the span.
+    """
+
+    def decorate(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACE_ENABLED:
+                return fn(*args, **kwargs)
+            if begin:
+                begin_command_trace(cat)
+            try:
+                with _Span(span_name, cat, {}):
+                    return fn(*args, **kwargs)
+            finally:
+                if end:
+                    end_command_trace(cat)
+
+        return wrapper
+
+    return decorate
+
+
+def begin_command_trace(cmd_name: str) -> None:
+    """Mark the start of a command invocation; see traced(begin=True)."""
+    if not TRACE_ENABLED:
+        return
+    with _lock:
+        _invocations[cmd_name] = _now_us()
+
+
+def end_command_trace(cmd_name: str) -> str:
+    """Close the invocation opened by begin_command_trace and write its trace file.
+
+    Returns the file path, or '' when tracing is off or nothing was open.
+    Work still running when the dialog closes (post-OK uploads) is only in
+    a later write_trace().
+    """
+    with _lock:
+        start = _invocations.pop(cmd_name, None)
+    if start is None or not TRACE_ENABLED:
+        return ""
+    _record(
+        {"name": cmd_name, "cat": "command", "ph": "X", "ts": start, "dur": _now_us() - start}
+    )
+    return write_trace(cmd_name, since_us=start)
+
+
+def write_trace(label: str = "session", since_us: float = None, directory: str = None) -> str:
+    """Write buffered events (those starting at or after *since_us*) to a trace file.
+
+    The written events are dropped from the buffer, so no event is in two
+    files. Returns the path written, or '' on failure or when there is
+    nothing to write.
+    """
+    with _lock:
+        events = [e for e in _events if since_us is None or e["ts"] >= since_us]
+        names = dict(_thread_names)
+    if not events:
+        return ""
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": _PID, "tid": tid, "args": {"name": tname}}
+        for tid, tname in names.items()
+    ]
+    directory = directory or TRACES_DIR
+    safe_label = re.sub(r"[^\w\-]+", "_", label).strip("_") or "trace"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"{safe_label}-{stamp}-{next(_file_counter)}.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, fh)
+    except Exception as exc:
+        futil.log(f"tracing: failed to write '{path}': {exc}")
+        return ""
+    written = {id(e) for e in events}
+    with _lock:
+        kept = [e for e in _events if id(e) not in written]
+        _events.clear()
+        _events.extend(kept)
+    futil.log(f"tracing: wrote {len(events)} event(s) to '{path}'")
+    return path
+
+
+def clear_trace() -> None:
+    """Drop every buffered event."""
+    with _lock:
+        _events.clear()